@@ -4,6 +4,7 @@ import json
 import sys
 from pathlib import Path
 import re
+import subprocess
 
 import requests
 
@@ -92,7 +93,7 @@ def _generate_tests_and_data(class_name, host, html):
 
 def _register_scraper(class_name):
     module = class_name.lower()
-    init_path = SCRAPERS_DIR / "__init__.py"
+    init_path = SCRAPERS_DIR / "_scrapers.py"
     lines = init_path.read_text().splitlines()
 
     new_import = f"from .{module} import {class_name}"
@@ -139,6 +140,10 @@ def _register_scraper(class_name):
         out.append(line)
 
     init_path.write_text("\n".join(out) + "\n")
+    subprocess.run(
+        [sys.executable, str(BASE_DIR / "scripts" / "generate_manifest.py")],
+        check=True,
+    )
 
 
 def _group_dict_entries(lines):
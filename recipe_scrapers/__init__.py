@@ -2,29 +2,32 @@ from __future__ import annotations
 
 __all__ = (
     "AbstractScraper",
+    "AsyncFetcher",
     "ElementNotFoundInHtml",
+    "Fetcher",
     "FieldNotProvidedByWebsiteException",
+    "HTTPCache",
+    "MemoryResultCache",
     "NoSchemaFoundInWildMode",
     "RecipeSchemaNotFound",
+    "ResultCache",
+    "SQLiteResultCache",
+    "ScrapeResult",
     "StaticValueException",
     "WebsiteNotImplementedError",
     "scrape_html",
+    "scrape_many",
+    "scrape_url",
+    "scrape_urls",
 )
 
 import warnings
 
 from urllib.request import urlopen, Request
 
-try:
-    # requests is an optional dependency; we can provide better error messages
-    # when we know that it's unavailable before a user attempts a web request
-    import requests
-except ImportError as e:
-    requests_import_error: Exception | None = e
-else:
-    requests_import_error = None
-
 from ._abstract import HEADERS, AbstractScraper
+from ._async import AsyncFetcher, scrape_url, scrape_urls
+from ._batch import ScrapeResult, scrape_many
 from ._exceptions import (
     ElementNotFoundInHtml,
     FieldNotProvidedByWebsiteException,
@@ -35,1383 +38,25 @@ from ._exceptions import (
 )
 from ._utils import get_host_name
 from ._factory import SchemaScraperFactory
-from .abeautifulmess import ABeautifulMess
-from .aberlehome import AberleHome
-from .abril import Abril
-from .abuelascounter import AbuelasCounter
-from .acouplecooks import ACoupleCooks
-from .acozykitchen import ACozyKitchen
-from .addapinch import AddAPinch
-from .adozensundays import ADozenSundays
-from .adrianasbestrecipes import AdrianasBestRecipes
-from .afarmgirlsdabbles import AFarmGirlsDabbles
-from .afghankitchenrecipes import AfghanKitchenRecipes
-from .aflavorjournal import AFlavorJournal
-from .africanbites import AfricanBites
-from .afullliving import AFullLiving
-from .ahealthysliceoflife import AHealthySliceOfLife
-from .akispetretzikis import AkisPetretzikis
-from .albertcz import AlbertCz
-from .albertheijn import AlbertHeijn
-from .aldi import Aldi
-from .aldinord import AldiNord
-from .aldisued import AldiSued
-from .aldisuisse import AldiSuisse
-from .alexandracooks import AlexandraCooks
-from .alisoneroman import AlisoneRoman
-from .alittlebityummy import ALittleBitYummy
-from .allnutritious import AllNutritious
-from .allrecipes import AllRecipes
-from .allsavoryrecipes import AllSavoryRecipes
-from .allthehealthythings import AllTheHealthyThings
-from .alltommat import AlltOmMat
-from .altonbrown import AltonBrown
-from .amazingoriental import AmazingOriental
-from .amazingribs import AmazingRibs
-from .amberskitchencooks import AmbersKitchencooks
-from .ambitiouskitchen import AmbitiousKitchen
-from .ameessavorydish import AmeesSavoryDish
-from .americastestkitchen import AmericasTestKitchen
-from .andycooks import AndyCooks
-from .anitalianinmykitchen import AnItalianInMyKitchen
-from .archanaskitchen import ArchanasKitchen
-from .argiro import Argiro
-from .arla import Arla
-from .asweetpeachef import ASweetPeaChef
-from .atelierdeschefs import AtelierDesChefs
-from .aubreyskitchen import AubreysKitchen
-from .averiecooks import AverieCooks
-from .bakeeatrepeat import BakeEatRepeat
-from .bakeitwithlove import BakeItWithLove
-from .bakels import Bakels
-from .bakerbynature import BakerByNature
-from .bakewithzoha import BakeWithZoha
-from .bakingmischief import BakingMischief
-from .bakingsense import BakingSense
-from .barefeetinthekitchen import BarefeetInTheKitchen
-from .barefootcontessa import BareFootContessa
-from .barefootinthepines import BarefootInThePines
-from .bbcfood import BBCFood
-from .bbcgoodfood import BBCGoodFood
-from .belleofthekitchen import BelleOfTheKitchen
-from .bellyfull import BellyFull
-from .bestrecipes import BestRecipes
-from .betterfoodguru import BetterFoodGuru
-from .bettybossi import BettyBossi
-from .bettycrocker import BettyCrocker
-from .beyondfrosting import BeyondFrosting
-from .biancazapatka import BiancaZapatka
-from .biggerbolderbaking import BiggerBolderBaking
-from .bigoven import BigOven
-from .billyparisi import BillyParisi
-from .bitsofcarey import BitsOfCarey
-from .blessthismessplease import BlessThisMessPlease
-from .blogghetti import Blogghetti
-from .blogosferathermomix import BlogosferaThermomix
-from .blueapron import BlueApron
-from .bluejeanchef import BlueJeanChef
-from .bodybuilding import Bodybuilding
-from .bofrost import Bofrost
-from .bonappetit import BonAppetit
-from .bongeats import BongEats
-from .bowlofdelicious import BowlOfDelicious
-from .breadtopia import Breadtopia
-from .brewersfriend import BrewersFriend
-from .briceletbaklava import BricelEtBaklava
-from .brokenovenbaking import BrokenOvenBaking
-from .budgetbytes import BudgetBytes
-from .cafedelites import CafeDelites
-from .caioflorentina import CaioFlorentina
-from .cakemehometonight import CakeMeHomeTonight
-from .cakewhiz import CakeWhiz
-from .cambreabakes import CambreaBakes
-from .carlsbadcravings import CarlsBadCravings
-from .carriesexperimentalkitchen import CarriesExperimentalKitchen
-from .castironketo import CastIronKeto
-from .castironskilletcooking import CastIronSkilletCooking
-from .cdkitchen import CdKitchen
-from .celebratingsweets import CelebratingSweets
-from .chefjackovens import ChefJackOvens
-from .chefjeanpierre import ChefJeanPierre
-from .chefkoch import Chefkoch
-from .chefnini import Chefnini
-from .chefsavvy import ChefSavvy
-from .chewoutloud import ChewOutLoud
-from .chocolatewithgrace import ChocolateWithGrace
-from .choosehomemade import ChooseHomemade
-from .cleaneatingkitchen import CleanEatingKitchen
-from .closetcooking import ClosetCooking
-from .cloudykitchen import CloudyKitchen
-from .coleycooks import ColeyCooks
-from .colleenchristensennutrition import ColleenChristensenNutrition
-from .comidinhasdochef import ComidinhasDoChef
-from .cookedandloved import CookedAndLoved
-from .cookfastrecipes import CookFastRecipes
-from .cookieandkate import CookieAndKate
-from .cookiesandcups import CookiesAndCups
-from .cookingcircle import CookingCircle
-from .cookingclassy import CookingClassy
-from .cookinglight import CookingLight
-from .cookinglsl import CookingLSL
-from .cookingwithjanica import CookingWithJanica
-from .cookomix import Cookomix
-from .cookpad import CookPad
-from .cooktalk import CookTalk
-from .cookwell import CookWell
-from .cookwithdana import CookWithDana
-from .copykat import CopyKat
-from .corriecooks import CorrieCooks
-from .costco import Costco
-from .countryliving import CountryLiving
-from .crazyforcrust import CrazyForCrust
-from .creativecanning import CreativeCanning
-from .cucchiaio import Cucchiaio
-from .cuisineaz import CuisineAZ
-from .cuisinezpourbebe import CuisinezPourBebe
-from .culinaryhill import CulinaryHill
-from .culy import Culy
-from .cybercook import Cybercook
-from .dagelijksekost import DagelijkseKost
-from .damndelicious import DamnDelicious
-from .daringgourmet import DaringGourmet
-from .dashfordinner import DashForDinner
-from .davidlebovitz import DavidLebovitz
-from .deliciouslyella import DeliciouslyElla
-from .deliciouslysprinkled import DeliciouslySprinkled
-from .delish import Delish
-from .delishkitchen import DelishKitchen
-from .delscookingtwist import DelsCookingTwist
-from .dinneratthezoo import DinnerAtTheZoo
-from .dinnerthendessert import DinnerThenDessert
-from .directoalpaladar import DirectoAlPaladar
-from .dishnz import Dishnz
-from .dobruchutaktualitysk import DobruChutAktualitySK
-from .domesticateme import DomesticateMe
-from .donalskehan import DonalSkehan
-from .donnahay import DonnaHay
-from .downshiftology import Downshiftology
-from .dr import Dr
-from .drinkoteket import Drinkoteket
-from .drizzleanddip import DrizzleAndDip
-from .eatingbirdfood import EatingBirdFood
-from .eatingeuropean import EatingEuropean
-from .eatingonadime import EatingOnADime
-from .eatingwell import EatingWell
-from .eatliverun import EatLiveRun
-from .eatsmarter import Eatsmarter
-from .eatthismuch import EatThisMuch
-from .eattolerant import EatTolerant
-from .eatwell101 import EatWell101
-from .eatwhattonight import EatWhatTonight
-from .edeka import EDEKA
-from .editionslarousse import EditionsLarousse
-from .eggsca import EggsCa
-from .elavegan import ElaVegan
-from .emilybites import EmilyBites
-from .emmikochteinfach import EmmiKochtEinfach
-from .empirecipes import Empirecipes
-from .epicurious import Epicurious
-from .erinliveswhole import ErinLivesWhole
-from .erinscozykitchen import ErinsCozyKitchen
-from .errenskitchen import ErrensKitchen
-from .essenundtrinken import EssenUndTrinken
-from .ethanchlebowski import EthanChlebowski
-from .everydaydelicious import EverydayDelicious
-from .everydaypie import EverydayPie
-from .evolvingtable import EvolvingTable
-from .familyfoodonthetable import FamilyfoodOnTheTable
-from .familyspice import FamilySpice
-from .fantabulosity import Fantabulosity
-from .farmhousedelivery import FarmhouseDelivery
-from .farmhouseonboone import FarmhouseOnBoone
-from .farmtojar import FarmToJar
-from .fattoincasadabenedetta import FattoInCasaDaBenedetta
-from .feastingathome import FeastingAtHome
-from .feelgoodfoodie import FeelGoodFoodie
-from .felixkitchen import FelixKitchen
-from .festligare import Festligare
-from .fifteengram import FifteenGram
-from .fifteenspatulas import FifteenSpatulas
-from .figjar import FigJar
-from .finedininglovers import FineDiningLovers
-from .fithealthymacros import FitHealthyMacros
-from .fitmencook import FitMenCook
-from .fitslowcookerqueen import FitSlowCookerQueen
-from .flavorsbylinbie import FlavorsByLinbie
-from .food import Food
-from .food52 import Food52
-from .foodandwine import FoodAndWine
-from .foodbymaria import FoodByMaria
-from .foodfidelity import FoodFidelity
-from .foodnetwork import FoodNetwork
-from .foodrepublic import FoodRepublic
-from .forksoverknives import ForksOverKnives
-from .forktospoon import ForkToSpoon
-from .fortyaprons import FortyAprons
-from .franzoesischkochen import FranzoesischKochen
-from .freshiprima import FreshiPrima
-from .g750g import G750g
-from .garlicandzest import GarlicAndZest
-from .garnishandglaze import GarnishAndGlaze
-from .gesundaktiv import GesundAktiv
-from .giallozafferano import GialloZafferano
-from .gimmesomeoven import GimmeSomeOven
-from .girlgonegourmet import GirlGoneGourmet
-from .girlversusdough import GirlVersusDough
-from .globo import Globo
-from .gloriousrecipes import GloriousRecipes
-from .glutenfreeonashoestring import GlutenFreeOnAShoeString
-from .godt import Godt
-from .goldnplump import GoldnPlump
-from .gonnawantseconds import GonnaWantSeconds
-from .goodfooddiscoveries import GoodFoodDiscoveries
-from .goodhousekeeping import GoodHousekeeping
-from .goodstuffrecipes import GoodStuffRecipes
-from .gourmettraveller import GourmetTraveller
-from .grandbabycakes import GrandbabyCakes
-from .grandfrais import GrandFrais
-from .greatbritishchefs import GreatBritishChefs
-from .grimgrains import GrimGrains
-from .grouprecipes import GroupRecipes
-from .halfbakedharvest import HalfBakedHarvest
-from .handletheheat import HandleTheHeat
-from .hassanchef import HassanChef
-from .headbangerskitchen import HeadbangersKitchen
-from .healthywithachanceofsprinkles import HealthyWithAChanceOfSprinkles
-from .heatherchristo import HeatherChristo
-from .heb import HEB
-from .hellofresh import HelloFresh
-from .hersheyland import HersheyLand
-from .hilahcooking import HilahCooking
-from .hofer import Hofer
-from .hogarmania import Hogarmania
-from .homeandplate import HomeAndPlate
-from .homechef import HomeChef
-from .hostthetoast import Hostthetoast
-from .houseofnasheats import HouseOfNashEats
-from .houseofyumm import HouseOfYumm
-from .howtocook import HowToCook
-from .howtofeedaloon import HowToFeedALoon
-from .hungryhappens import HungryHappens
-from .iamafoodblog import IAmAFoodBlog
-from .iambaker import IAmBaker
-from .ica import Ica
-from .ig import IG
-from .imworthy import ImWorthy
-from .inbloombakery import InBloomBakery
-from .indianhealthyrecipes import IndianHealthyRecipes
-from .ingoodflavor import InGoodFlavor
-from .innit import Innit
-from .insanelygoodrecipes import InsanelyGoodRecipes
-from .inspiralized import Inspiralized
-from .inspiredtaste import InspiredTaste
-from .iowagirleats import IowaGirlEats
-from .irishcentral import IrishCentral
-from .itdoesnttastelikechicken import ItDoesntTasteLikeChicken
-from .itsnotaboutnutrition import ItsNotAboutNutrition
-from .izzycooking import IzzyCooking
-from .jamieoliver import JamieOliver
-from .jennycancook import JennyCanCook
-from .jimcooksfoodgood import JimCooksFoodGood
-from .jocooks import JoCooks
-from .joshuaweissman import JoshuaWeissman
-from .journaldesfemmes import JournalDesFemmes
-from .jow import Jow
-from .joyfoodsunshine import Joyfoodsunshine
-from .joyfullymad import JoyfullyMad
-from .joythebaker import JoyTheBaker
-from .juliasalbum import JuliasAlbum
-from .juliegoodwin import JulieGoodwin
-from .jumbo import Jumbo
-from .justalittlebitofbacon import JustALittleBitOfBacon
-from .justapinch import JustAPinch
-from .justataste import JustATaste
-from .justbento import JustBento
-from .justinesnacks import JustineSnacks
-from .justonecookbook import JustOneCookbook
-from .kalcirecept import KalciRecept
-from .kalejunkie import KaleJunkie
-from .kellyscleankitchen import KellysCleanKitchen
-from .kennethtemple import KennethTemple
-from .kennymcgovern import KennyMcGovern
-from .keukenliefdenl import KeukenLiefdeNL
-from .keytomylime import KeyToMyLime
-from .kfoods import KFoods
-from .kiddokitchen import KiddoKitchen
-from .kikkoman import Kikkoman
-from .kingarthur import KingArthur
-from .kitchenaidaustralia import KitchenAidAustralia
-from .kitchendivas import KitchenDivas
-from .kitchendreaming import KitchenDreaming
-from .kitchensanctuary import KitchenSanctuary
-from .kitchenstories import KitchenStories
-from .kochbar import Kochbar
-from .kochbucher import Kochbucher
-from .koket import Koket
-from .kookjij import KookJij
-from .kristineskitchenblog import KristinesKitchenBlog
-from .krollskorner import KrollsKorner
-from .kuchniadomowa import KuchniaDomowa
-from .kuchynalidla import KuchynaLidla
-from .kwestiasmaku import KwestiaSmaku
-from .lacucinaitaliana import LaCucinaItaliana
-from .lanascooking import LanasCooking
-from .latelierderoxane import LAtelierDeRoxane
-from .laurenslatest import LaurensLatest
-from .lazycatkitchen import LazyCatKitchen
-from .lecker import Lecker
-from .leckerschmecker import LeckerSchmecker
-from .lecremedelacrumb import LeCremeDeLaCrumb
-from .leitesculinaria import LeitesCulinaria
-from .lekkerensimpel import LekkerEnSimpel
-from .letscampsmore import LetsCampSmore
-from .leukerecepten import Leukerecepten
-from .lidiasitaly import LidiasItaly
-from .lifestyleofafoodie import LifestyleOfAFoodie
-from .littleferrarokitchen import LittleFerraroKitchen
-from .littlespicejar import LittleSpiceJar
-from .littlespoonfarm import LittleSpoonFarm
-from .littlesunnykitchen import LittleSunnyKitchen
-from .livelytable import LivelyTable
-from .lmld import Lmld
-from .lolascocina import LolasCocina
-from .loveandlemons import LoveAndLemons
-from .lovefood import LoveFood
-from .lovingitvegan import Lovingitvegan
-from .maangchi import Maangchi
-from .madamecuisine import MadameCuisine
-from .madamelefigaro import MadameLeFigaro
-from .madensverden import MadensVerden
-from .madsvin import Madsvin
-from .magimix import Magimix
-from .makeitdairyfree import MakeItDairyFree
-from .marmiton import Marmiton
-from .marthastewart import MarthaStewart
-from .matprat import Matprat
-from .mccormick import McCormick
-from .mealprepmanual import MealPrepManual
-from .meatchurch import MeatChurch
-from .meganvskitchen import MeganVsKitchen
-from .meljoulwan import Meljoulwan
-from .mellisaknorris import MellisaKNorris
-from .melloschourico import MellosChourico
-from .melskitchencafe import MelsKitchenCafe
-from .mexicanplease import MexicanPlease
-from .migusto import Migusto
-from .miljuschka import Miljuschka
-from .mindmegette import Mindmegette
-from .minimalistbaker import Minimalistbaker
-from .ministryofcurry import MinistryOfCurry
-from .misya import Misya
-from .mob import Mob
-from .mobkitchen import MobKitchen
-from .modernhoney import ModernHoney
-from .mollybaz import MollyBaz
-from .momontimeout import MomOnTimeout
-from .momswithcrockpots import MomsWithCrockPots
-from .moscatomom import MoscatoMom
-from .motherthyme import MotherThyme
-from .moulinex import Moulinex
-from .mundodereceitasbimby import MundoDeReceitasBimby
-from .mybakingaddiction import MyBakingAddiction
-from .myjewishlearning import MyJewishLearning
-from .mykidslickthebowl import MyKidsLickTheBowl
-from .mykitchen101 import MyKitchen101
-from .mykitchen101en import MyKitchen101en
-from .mykoreankitchen import MyKoreanKitchen
-from .myrecipes import MyRecipes
-from .myriadrecipes import MyriadRecipes
-from .myvegetarianroots import MyVegetarianRoots
-from .natashaskitchen import NatashasKitchen
-from .naturallyella import NaturallyElla
-from .ndr import Ndr
-from .netacooks import NetaCooks
-from .newdadskitchen import NewDadsKitchen
-from .nhshealthierfamilies import NHSHealthierFamilies
-from .nibbledish import NibbleDish
-from .nihhealthyeating import NIHHealthyEating
-from .ninjatestkitchen import NinjaTestKitchen
-from .noracooks import NoraCooks
-from .norecipes import NoRecipes
-from .nosalty import NoSalty
-from .notenoughcinnamon import NotEnoughCinnamon
-from .nourishedbynutrition import NourishedByNutrition
-from .nrkmat import NRKMat
-from .number2pencil import Number2Pencil
-from .nutritionbynathalie import NutritionByNathalie
-from .nutritionfacts import NutritionFacts
-from .nytimes import NYTimes
-from .ohsheglows import OhSheGlows
-from .ohsweetbasil import OhSweetBasil
-from .okokorecepten import OkokoRecepten
-from .omnivorescookbook import OmnivoresCookbook
-from .onceuponachef import OnceUponAChef
-from .onehundredonecookbooks import OneHundredOneCookBooks
-from .onesevensevenmilkstreet import OneSevenSevenMilkStreet
-from .onesweetappetite import OneSweetAppetite
-from .organicallyaddison import OrganicallyAddison
-from .ottolenghibooks import OttolenghiBooks
-from .ourbestbites import OurBestBites
-from .owenhan import OwenHan
-from .paleorunningmomma import PaleoRunningMomma
-from .panelinha import Panelinha
-from .paninihappy import PaniniHappy
-from .panlasangpinoy import PanlasangPinoy
-from .pastificiosorrentino import PastificioSorrentino
-from .pauladeen import PaulaDeen
-from .peelwithzeal import PeelWithZeal
-from .persnicketyplates import PersnicketyPlates
-from .pickuplimes import PickUpLimes
-from .picnic import Picnic
-from .piesandplots import PiesAndPlots
-from .pilipinasrecipes import PilipinasRecipes
-from .pinchofyum import PinchOfYum
-from .pingodoce import PingoDoce
-from .pinkowlkitchen import PinkOwlKitchen
-from .plantyou import PlantYou
-from .platingpixels import PlatingPixels
-from .platingsandpairings import PlatingsAndPairings
-from .plowingthroughlife import PlowingThroughLife
-from .polishfoodies import PolishFoodies
-from .poppycooks import PoppyCooks
-from .popsugar import PopSugar
-from .postpunkkitchen import PostPunkKitchen
-from .potatorolls import PotatoRolls
-from .practicalselfreliance import PracticalSelfReliance
-from .preppykitchen import PreppyKitchen
-from .pressureluckcooking import PressureLuckCooking
-from .primaledgehealth import PrimalEdgeHealth
-from .projectgezond import ProjectGezond
-from .przepisy import Przepisy
-from .purelypope import PurelyPope
-from .purplecarrot import PurpleCarrot
-from .quakeroats import QuakerOats
-from .quitoque import QuiToque
-from .rachlmansfield import RachlMansfield
-from .rainbowplantlife import RainbowPlantLife
-from .realfoodtesco import RealFoodTesco
-from .realfoodwell import RealFoodWell
-from .realmomnutrition import RealMomNutrition
-from .realsimple import RealSimple
-from .receitasnestlebr import ReceitasNestleBR
-from .recept import Recept
-from .receptiindex import ReceptiIndex
-from .receptyprevas import ReceptyPreVas
-from .recetteplus import RecettePlus
-from .recipeforperfection import RecipeForPerfection
-from .recipegirl import RecipeGirl
-from .recipeland import RecipeLand
-from .reciperunner import RecipeRunner
-from .recipetineats import RecipeTinEats
-from .redhousespice import RedHouseSpice
-from .reishunger import Reishunger
-from .relish import Relish
-from .rewe import Rewe
-from .rezeptwelt import Rezeptwelt
-from .ricardocuisine import RicardoCuisine
-from .ricetta import Ricetta
-from .ricetteperbimby import RicettePerBimby
-from .rickbayless import RickBayless
-from .rosannapansino import RosannaPansino
-from .rutgerbakt import RutgerBakt
-from .saboresajinomoto import SaboresAjinomoto
-from .sallysbakingaddiction import SallysBakingAddiction
-from .sallysblog import SallysBlog
-from .saltpepperskillet import SaltPepperSkillet
-from .samsungfood import SamsungFood
-from .sandwhichtribunal import SandwhichTribunal
-from .saveur import Saveur
-from .savoringthegood import SavoringTheGood
-from .savorynothings import SavoryNothings
-from .savorythoughts import SavoryThoughts
-from .savvysavingcouple import SavvySavingCouple
-from .schoolofwok import SchoolOfWok
-from .scrambledandscrumptious import ScrambledAndScrumptious
-from .scrummylane import ScrummyLane
-from .seriouseats import SeriousEats
-from .sharkninja import SharkNinja
-from .shelikesfood import SheLikesFood
-from .simplegreensmoothies import SimpleGreenSmoothies
-from .simplehomeedit import SimpleHomeEdit
-from .simpleveganista import SimpleVeganista
-from .simplycookit import SimplyCookit
-from .simplyquinoa import SimplyQuinoa
-from .simplyrecipes import SimplyRecipes
-from .simplywhisked import SimplyWhisked
-from .sipandfeast import SipAndFeast
-from .sizzlefish import SizzleFish
-from .sizzlingeats import SizzlingEats
-from .skinnytaste import SkinnyTaste
-from .smalltownwoman import SmallTownWoman
-from .smulweb import Smulweb
-from .sobors import SoBors
-from .somuchfoodblog import SoMuchFoodBlog
-from .southernbite import SouthernBite
-from .southerncastiron import SouthernCastIron
-from .southernliving import SouthernLiving
-from .spainonafork import SpainOnAFork
-from .spendwithpennies import SpendWithPennies
-from .spicysouthernkitchen import SpicySouthernKitchen
-from .spisbedre import SpisBedre
-from .springlane import Springlane
-from .stacyling import StacyLing
-from .staysnatched import StaySnatched
-from .steamykitchen import SteamyKitchen
-from .streetkitchen import StreetKitchen
-from .strongrfastr import StrongrFastr
-from .sudachirecipes import SudachiRecipes
-from .sugarhero import SugarHero
-from .sugarmaplefarmhouse import SugarMapleFarmhouse
-from .sugarspunrun import SugarSpunRun
-from .sunbasket import SunBasket
-from .sundaysuppermovement import SundaySupperMovement
-from .sundpaabudget import SundPaaBudget
-from .sunset import Sunset
-from .sweetcsdesigns import SweetCsDesigns
-from .sweetpeasandsaffron import SweetPeasAndSaffron
-from .swissmilk import SwissMilk
-from .tableanddish import TableAndDish
-from .tasteandtellblog import TasteAndTellBlog
-from .tasteatlas import TasteAtlas
-from .tasteau import TasteAU
-from .tastefullygrace import TastefullyGrace
-from .tasteline import Tasteline
-from .tasteofhome import TasteOfHome
-from .tastesbetterfromscratch import TastesBetterFromScratch
-from .tastesoflizzyt import TastesOfLizzyT
-from .tastinghistory import TastingHistory
-from .tasty import Tasty
-from .tastykitchen import TastyKitchen
-from .tastyoven import TastyOven
-from .tatyanaseverydayfood import TatyanasEverydayFood
-from .teakandthyme import TeakAndThyme
-from .thealmondeater import TheAlmondEater
-from .thebigmansworld import TheBigMansWorld
-from .theclevercarrot import TheCleverCarrot
-from .thecookierookie import TheCookieRookie
-from .thecookingguy import TheCookingGuy
-from .thecountrycook import TheCountryCook
-from .thefirstmess import TheFirstMess
-from .thefoodcharlatan import TheFoodCharlatan
-from .thefoodietakesflight import TheFoodieTakesFlight
-from .theglutenfreeaustrian import TheGlutenFreeAustrian
-from .theguardian import TheGuardian
-from .thehappyfoodie import TheHappyFoodie
-from .theicecreamconfectionals import TheIceCreamConfectionals
-from .thekitchencommunity import TheKitchenCommunity
-from .thekitchenmagpie import TheKitchenMagPie
-from .thekitchn import TheKitchn
-from .theloopywhisk import TheLoopyWhisk
-from .themagicalslowcooker import TheMagicalSlowCooker
-from .themediterranedish import TheMediterraneDish
-from .themodernproper import TheModernProper
-from .theoldwomanandthesea import TheOldWomanAndTheSea
-from .thepalatablelife import ThePalatableLife
-from .thepioneerwoman import ThePioneerWoman
-from .theplantbasedschool import ThePlantBasedSchool
-from .therecipecritic import TheRecipeCritic
-from .thesaltymarshmallow import TheSaltyMarshmallow
-from .thespicetrain import TheSpiceTrain
-from .thespruceeats import TheSpruceEats
-from .thesuburbansoapbox import TheSuburbanSoapBox
-from .thevintagemixer import TheVintageMixer
-from .thewoksoflife import Thewoksoflife
-from .thewoodenskillet import TheWoodenSkillet
-from .thinlicious import Thinlicious
-from .thirtyseconds import ThirtySeconds
-from .thishealthytable import ThisHealthyTable
-from .threesixfivedaysofbakingandmore import ThreeSixFiveDaysOfBakingAndMore
-from .tidymom import TidyMom
-from .timesofindia import TimesOfIndia
-from .tineno import TineNo
-from .tofoo import Tofoo
-from .toriavey import ToriAvey
-from .tudogostoso import TudoGostoso
-from .twentyfourkitchen import TwentyFourKitchen
-from .twopeasandtheirpod import TwoPeasAndTheirPod
-from .uitpaulineskeukennl import UitPaulinesKeukenNL
-from .unsophisticook import Unsophisticook
-from .usapears import USAPears
-from .usdamyplate import USDAMyPlate
-from .valdemarsro import Valdemarsro
-from .valentinascorner import ValentinasCorner
-from .vanillaandbean import VanillaAndBean
-from .varechapravdask import VarechaPravdaSK
-from .veganricha import VeganRicha
-from .vegansociety import VeganSociety
-from .vegetarbloggen import Vegetarbloggen
-from .vegolosi import Vegolosi
-from .vegrecipesofindia import VegRecipesOfIndia
-from .velocidadcuchara import VelocidadCuchara
-from .veroniquecloutier import VeroniqueCloutier
-from .waitrose import Waitrose
-from .watchwhatueat import WatchWhatUEat
-from .wdr import WDR
-from .wearenotmartha import WeAreNotMartha
-from .wedishitup import WeDishItUp
-from .weightwatchers import WeightWatchers
-from .weightwatcherspublic import WeightWatchersPublic
-from .wellplated import WellPlated
-from .whatsgabycooking import WhatsGabyCooking
-from .whole30 import Whole30
-from .wholefoods import WholeFoods
-from .wikicookbook import WikiCookbook
-from .williamssonoma import WilliamsSonoma
-from .womensweeklyfood import WomensWeeklyFood
-from .woop import Woop
-from .wyseguide import WyseGuide
-from .xiachufang import Xiachufang
-from .yamasa import Yamasa
-from .yemek import Yemek
-from .yummly import Yummly
-from .zaubertopf import ZauberTopf
-from .zeitwochenmarkt import ZeitWochenmarkt
-from .zenbelly import ZenBelly
-from .zestfulkitchen import ZestfulKitchen
+from ._fetcher import Fetcher, get_default_fetcher, requests_import_error
+from ._http_cache import HTTPCache
+from ._result_cache import MemoryResultCache, ResultCache, SQLiteResultCache
+from ._manifest import SCRAPER_MANIFEST
+from ._registry import ScraperRegistry, load_scraper_class
+
+SCRAPERS = ScraperRegistry(SCRAPER_MANIFEST)
+_SCRAPER_MODULES = SCRAPERS.class_locations()
+
 
-SCRAPERS = {
-    ABeautifulMess.host(): ABeautifulMess,
-    AberleHome.host(): AberleHome,
-    Abril.host(): Abril,
-    AbuelasCounter.host(): AbuelasCounter,
-    ACoupleCooks.host(): ACoupleCooks,
-    ACozyKitchen.host(): ACozyKitchen,
-    AddAPinch.host(): AddAPinch,
-    ADozenSundays.host(): ADozenSundays,
-    AdrianasBestRecipes.host(): AdrianasBestRecipes,
-    AFarmGirlsDabbles.host(): AFarmGirlsDabbles,
-    AfghanKitchenRecipes.host(): AfghanKitchenRecipes,
-    AFlavorJournal.host(): AFlavorJournal,
-    AfricanBites.host(): AfricanBites,
-    AFullLiving.host(): AFullLiving,
-    AHealthySliceOfLife.host(): AHealthySliceOfLife,
-    AkisPetretzikis.host(): AkisPetretzikis,
-    AlbertCz.host(): AlbertCz,
-    AlbertHeijn.host(): AlbertHeijn,
-    AlbertHeijn.host(domain="ah.be"): AlbertHeijn,
-    Aldi.host(): Aldi,
-    AldiNord.host(): AldiNord,
-    AldiNord.host(domain="aldi.es"): AldiNord,
-    AldiNord.host(domain="aldi.fr"): AldiNord,
-    AldiNord.host(domain="aldi.lu"): AldiNord,
-    AldiNord.host(domain="aldi.nl"): AldiNord,
-    AldiNord.host(domain="aldi.pl"): AldiNord,
-    AldiNord.host(domain="aldi.pt"): AldiNord,
-    AldiSued.host(): AldiSued,
-    AldiSued.host(domain="aldi.hu"): AldiSued,
-    AldiSued.host(domain="aldi.it"): AldiSued,
-    AldiSuisse.host(): AldiSuisse,
-    AlexandraCooks.host(): AlexandraCooks,
-    AlisoneRoman.host(): AlisoneRoman,
-    ALittleBitYummy.host(): ALittleBitYummy,
-    AllNutritious.host(): AllNutritious,
-    AllRecipes.host(): AllRecipes,
-    AllSavoryRecipes.host(): AllSavoryRecipes,
-    AllTheHealthyThings.host(): AllTheHealthyThings,
-    AlltOmMat.host(): AlltOmMat,
-    AltonBrown.host(): AltonBrown,
-    AmazingOriental.host(): AmazingOriental,
-    AmazingRibs.host(): AmazingRibs,
-    AmbersKitchencooks.host(): AmbersKitchencooks,
-    AmbitiousKitchen.host(): AmbitiousKitchen,
-    AmeesSavoryDish.host(): AmeesSavoryDish,
-    AmericasTestKitchen.host(): AmericasTestKitchen,
-    AndyCooks.host(): AndyCooks,
-    AnItalianInMyKitchen.host(): AnItalianInMyKitchen,
-    ArchanasKitchen.host(): ArchanasKitchen,
-    Argiro.host(): Argiro,
-    Arla.host(): Arla,
-    ASweetPeaChef.host(): ASweetPeaChef,
-    AtelierDesChefs.host(): AtelierDesChefs,
-    AubreysKitchen.host(): AubreysKitchen,
-    AverieCooks.host(): AverieCooks,
-    BakeEatRepeat.host(): BakeEatRepeat,
-    BakeItWithLove.host(): BakeItWithLove,
-    Bakels.host(): Bakels,
-    Bakels.host(domain="co.uk"): Bakels,
-    BakerByNature.host(): BakerByNature,
-    BakeWithZoha.host(): BakeWithZoha,
-    BakingMischief.host(): BakingMischief,
-    BakingSense.host(): BakingSense,
-    BarefeetInTheKitchen.host(): BarefeetInTheKitchen,
-    BareFootContessa.host(): BareFootContessa,
-    BarefootInThePines.host(): BarefootInThePines,
-    BBCFood.host(): BBCFood,
-    BBCFood.host(domain="co.uk"): BBCFood,
-    BBCGoodFood.host(): BBCGoodFood,
-    BelleOfTheKitchen.host(): BelleOfTheKitchen,
-    BellyFull.host(): BellyFull,
-    BestRecipes.host(): BestRecipes,
-    BetterFoodGuru.host(): BetterFoodGuru,
-    BettyBossi.host(): BettyBossi,
-    BettyCrocker.host(): BettyCrocker,
-    BeyondFrosting.host(): BeyondFrosting,
-    BiancaZapatka.host(): BiancaZapatka,
-    BiggerBolderBaking.host(): BiggerBolderBaking,
-    BigOven.host(): BigOven,
-    BillyParisi.host(): BillyParisi,
-    BitsOfCarey.host(): BitsOfCarey,
-    BlessThisMessPlease.host(): BlessThisMessPlease,
-    Blogghetti.host(): Blogghetti,
-    BlogosferaThermomix.host(): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-albacete.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-alcala.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-algeciras.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-alicante.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-almeria.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-alzira.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-badajoz.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(
-        domain="thermomix-barcelona-centro.es"
-    ): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-barcelona.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-bilbao.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-burgos.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-caceres.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-cadiz.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-cartagena.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-castellon.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-ceuta.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-ciudadreal.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-cordoba.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-coruna.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-doshermanas.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-elche.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-esplugues.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-fuenlabrada.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-fuerteventura.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-gijon.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-girona.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-granada.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-huelva.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-jaen.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-jerez.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-lanzarote.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-laspalmas.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-leon.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-lleida.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-madrid-centro.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(
-        domain="thermomix-madrid-mendezalvaro.es"
-    ): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-majadahonda.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-malaga-centro.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-malaga.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-mallorca.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-manresa.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-marbella.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-mataro.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-mostoles.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-murcia.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-orense.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-pamplona.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-plasencia.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-pontevedra.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-sabadell.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-salamanca.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-sansebastian.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-santander.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(
-        domain="thermomix-sevilla-aljarafe.es"
-    ): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-sevilla.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-ssreyes.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-talavera.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-tarragona.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-tenerife.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-tenerifesur.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-toledo.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-valencia.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-valladolid.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-vic.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-vigo.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-vitoria.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-zamora.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomix-zaragoza.es"): BlogosferaThermomix,
-    BlogosferaThermomix.host(domain="thermomixasturias.es"): BlogosferaThermomix,
-    BlueApron.host(): BlueApron,
-    BlueJeanChef.host(): BlueJeanChef,
-    Bodybuilding.host(): Bodybuilding,
-    Bofrost.host(): Bofrost,
-    BonAppetit.host(): BonAppetit,
-    BongEats.host(): BongEats,
-    BowlOfDelicious.host(): BowlOfDelicious,
-    Breadtopia.host(): Breadtopia,
-    BrewersFriend.host(): BrewersFriend,
-    BricelEtBaklava.host(): BricelEtBaklava,
-    BrokenOvenBaking.host(): BrokenOvenBaking,
-    BudgetBytes.host(): BudgetBytes,
-    CafeDelites.host(): CafeDelites,
-    CaioFlorentina.host(): CaioFlorentina,
-    CakeMeHomeTonight.host(): CakeMeHomeTonight,
-    CakeWhiz.host(): CakeWhiz,
-    CambreaBakes.host(): CambreaBakes,
-    CarlsBadCravings.host(): CarlsBadCravings,
-    CarriesExperimentalKitchen.host(): CarriesExperimentalKitchen,
-    CastIronKeto.host(): CastIronKeto,
-    CastIronSkilletCooking.host(): CastIronSkilletCooking,
-    CdKitchen.host(): CdKitchen,
-    CelebratingSweets.host(): CelebratingSweets,
-    ChefJackOvens.host(): ChefJackOvens,
-    ChefJeanPierre.host(): ChefJeanPierre,
-    Chefkoch.host(): Chefkoch,
-    Chefnini.host(): Chefnini,
-    ChefSavvy.host(): ChefSavvy,
-    ChewOutLoud.host(): ChewOutLoud,
-    ChocolateWithGrace.host(): ChocolateWithGrace,
-    ChooseHomemade.host(): ChooseHomemade,
-    CleanEatingKitchen.host(): CleanEatingKitchen,
-    ClosetCooking.host(): ClosetCooking,
-    CloudyKitchen.host(): CloudyKitchen,
-    ColeyCooks.host(): ColeyCooks,
-    ColleenChristensenNutrition.host(): ColleenChristensenNutrition,
-    ComidinhasDoChef.host(): ComidinhasDoChef,
-    CookedAndLoved.host(): CookedAndLoved,
-    CookFastRecipes.host(): CookFastRecipes,
-    CookieAndKate.host(): CookieAndKate,
-    CookiesAndCups.host(): CookiesAndCups,
-    CookingCircle.host(): CookingCircle,
-    CookingClassy.host(): CookingClassy,
-    CookingLight.host(): CookingLight,
-    CookingLSL.host(): CookingLSL,
-    CookingWithJanica.host(): CookingWithJanica,
-    Cookomix.host(): Cookomix,
-    CookPad.host(): CookPad,
-    CookTalk.host(): CookTalk,
-    CookWell.host(): CookWell,
-    CookWithDana.host(): CookWithDana,
-    CopyKat.host(): CopyKat,
-    CorrieCooks.host(): CorrieCooks,
-    Costco.host(): Costco,
-    CountryLiving.host(): CountryLiving,
-    CrazyForCrust.host(): CrazyForCrust,
-    CreativeCanning.host(): CreativeCanning,
-    Cucchiaio.host(): Cucchiaio,
-    CuisineAZ.host(): CuisineAZ,
-    CuisinezPourBebe.host(): CuisinezPourBebe,
-    CulinaryHill.host(): CulinaryHill,
-    Culy.host(): Culy,
-    Cybercook.host(): Cybercook,
-    DagelijkseKost.host(): DagelijkseKost,
-    DamnDelicious.host(): DamnDelicious,
-    DaringGourmet.host(): DaringGourmet,
-    DashForDinner.host(): DashForDinner,
-    DavidLebovitz.host(): DavidLebovitz,
-    DeliciouslyElla.host(): DeliciouslyElla,
-    DeliciouslySprinkled.host(): DeliciouslySprinkled,
-    Delish.host(): Delish,
-    DelishKitchen.host(): DelishKitchen,
-    DelsCookingTwist.host(): DelsCookingTwist,
-    DinnerAtTheZoo.host(): DinnerAtTheZoo,
-    DinnerThenDessert.host(): DinnerThenDessert,
-    DirectoAlPaladar.host(): DirectoAlPaladar,
-    Dishnz.host(): Dishnz,
-    DobruChutAktualitySK.host(): DobruChutAktualitySK,
-    DomesticateMe.host(): DomesticateMe,
-    DonalSkehan.host(): DonalSkehan,
-    DonnaHay.host(): DonnaHay,
-    Downshiftology.host(): Downshiftology,
-    Dr.host(): Dr,
-    Drinkoteket.host(): Drinkoteket,
-    DrizzleAndDip.host(): DrizzleAndDip,
-    EatingBirdFood.host(): EatingBirdFood,
-    EatingEuropean.host(): EatingEuropean,
-    EatingOnADime.host(): EatingOnADime,
-    EatingWell.host(): EatingWell,
-    EatLiveRun.host(): EatLiveRun,
-    Eatsmarter.host(): Eatsmarter,
-    Eatsmarter.host(domain="de"): Eatsmarter,
-    EatThisMuch.host(): EatThisMuch,
-    EatTolerant.host(): EatTolerant,
-    EatWell101.host(): EatWell101,
-    EatWhatTonight.host(): EatWhatTonight,
-    EDEKA.host(): EDEKA,
-    EditionsLarousse.host(): EditionsLarousse,
-    EggsCa.host(): EggsCa,
-    ElaVegan.host(): ElaVegan,
-    EmilyBites.host(): EmilyBites,
-    EmmiKochtEinfach.host(): EmmiKochtEinfach,
-    Empirecipes.host(): Empirecipes,
-    Epicurious.host(): Epicurious,
-    ErinLivesWhole.host(): ErinLivesWhole,
-    ErinsCozyKitchen.host(): ErinsCozyKitchen,
-    ErrensKitchen.host(): ErrensKitchen,
-    EssenUndTrinken.host(): EssenUndTrinken,
-    EthanChlebowski.host(): EthanChlebowski,
-    EverydayDelicious.host(): EverydayDelicious,
-    EverydayPie.host(): EverydayPie,
-    EvolvingTable.host(): EvolvingTable,
-    FamilyfoodOnTheTable.host(): FamilyfoodOnTheTable,
-    FamilySpice.host(): FamilySpice,
-    Fantabulosity.host(): Fantabulosity,
-    FarmhouseDelivery.host(): FarmhouseDelivery,
-    FarmhouseOnBoone.host(): FarmhouseOnBoone,
-    FarmToJar.host(): FarmToJar,
-    FattoInCasaDaBenedetta.host(): FattoInCasaDaBenedetta,
-    FeastingAtHome.host(): FeastingAtHome,
-    FeelGoodFoodie.host(): FeelGoodFoodie,
-    FelixKitchen.host(): FelixKitchen,
-    Festligare.host(): Festligare,
-    FifteenGram.host(): FifteenGram,
-    FifteenSpatulas.host(): FifteenSpatulas,
-    FigJar.host(): FigJar,
-    FineDiningLovers.host(): FineDiningLovers,
-    FitHealthyMacros.host(): FitHealthyMacros,
-    FitMenCook.host(): FitMenCook,
-    FitSlowCookerQueen.host(): FitSlowCookerQueen,
-    FlavorsByLinbie.host(): FlavorsByLinbie,
-    Food.host(): Food,
-    Food52.host(): Food52,
-    FoodAndWine.host(): FoodAndWine,
-    FoodByMaria.host(): FoodByMaria,
-    FoodFidelity.host(): FoodFidelity,
-    FoodNetwork.host(): FoodNetwork,
-    FoodNetwork.host(domain="com"): FoodNetwork,
-    FoodRepublic.host(): FoodRepublic,
-    ForksOverKnives.host(): ForksOverKnives,
-    ForkToSpoon.host(): ForkToSpoon,
-    FortyAprons.host(): FortyAprons,
-    FranzoesischKochen.host(): FranzoesischKochen,
-    FreshiPrima.host(): FreshiPrima,
-    G750g.host(): G750g,
-    GarlicAndZest.host(): GarlicAndZest,
-    GarnishAndGlaze.host(): GarnishAndGlaze,
-    GesundAktiv.host(): GesundAktiv,
-    GialloZafferano.host(): GialloZafferano,
-    GimmeSomeOven.host(): GimmeSomeOven,
-    GirlGoneGourmet.host(): GirlGoneGourmet,
-    GirlVersusDough.host(): GirlVersusDough,
-    Globo.host(): Globo,
-    GloriousRecipes.host(): GloriousRecipes,
-    GlutenFreeOnAShoeString.host(): GlutenFreeOnAShoeString,
-    Godt.host(): Godt,
-    GoldnPlump.host(): GoldnPlump,
-    GonnaWantSeconds.host(): GonnaWantSeconds,
-    GoodFoodDiscoveries.host(): GoodFoodDiscoveries,
-    GoodHousekeeping.host(): GoodHousekeeping,
-    GoodStuffRecipes.host(): GoodStuffRecipes,
-    GourmetTraveller.host(): GourmetTraveller,
-    GrandbabyCakes.host(): GrandbabyCakes,
-    GrandFrais.host(): GrandFrais,
-    GreatBritishChefs.host(): GreatBritishChefs,
-    GrimGrains.host(): GrimGrains,
-    GroupRecipes.host(): GroupRecipes,
-    HalfBakedHarvest.host(): HalfBakedHarvest,
-    HandleTheHeat.host(): HandleTheHeat,
-    HassanChef.host(): HassanChef,
-    HeadbangersKitchen.host(): HeadbangersKitchen,
-    HealthyWithAChanceOfSprinkles.host(): HealthyWithAChanceOfSprinkles,
-    HeatherChristo.host(): HeatherChristo,
-    HEB.host(): HEB,
-    HelloFresh.host(): HelloFresh,
-    HelloFresh.host(domain="at"): HelloFresh,
-    HelloFresh.host(domain="be"): HelloFresh,
-    HelloFresh.host(domain="ca"): HelloFresh,
-    HelloFresh.host(domain="ch"): HelloFresh,
-    HelloFresh.host(domain="co.nz"): HelloFresh,
-    HelloFresh.host(domain="co.uk"): HelloFresh,
-    HelloFresh.host(domain="com.au"): HelloFresh,
-    HelloFresh.host(domain="de"): HelloFresh,
-    HelloFresh.host(domain="dk"): HelloFresh,
-    HelloFresh.host(domain="es"): HelloFresh,
-    HelloFresh.host(domain="fr"): HelloFresh,
-    HelloFresh.host(domain="ie"): HelloFresh,
-    HelloFresh.host(domain="it"): HelloFresh,
-    HelloFresh.host(domain="lu"): HelloFresh,
-    HelloFresh.host(domain="nl"): HelloFresh,
-    HelloFresh.host(domain="no"): HelloFresh,
-    HelloFresh.host(domain="se"): HelloFresh,
-    HersheyLand.host(): HersheyLand,
-    HilahCooking.host(): HilahCooking,
-    Hofer.host(): Hofer,
-    Hofer.host(domain="hofer.si"): Hofer,
-    Hogarmania.host(): Hogarmania,
-    HomeAndPlate.host(): HomeAndPlate,
-    HomeChef.host(): HomeChef,
-    Hostthetoast.host(): Hostthetoast,
-    HouseOfNashEats.host(): HouseOfNashEats,
-    HouseOfYumm.host(): HouseOfYumm,
-    HowToCook.host(): HowToCook,
-    HowToFeedALoon.host(): HowToFeedALoon,
-    HungryHappens.host(): HungryHappens,
-    IAmAFoodBlog.host(): IAmAFoodBlog,
-    IAmBaker.host(): IAmBaker,
-    Ica.host(): Ica,
-    IG.host(): IG,
-    ImWorthy.host(): ImWorthy,
-    InBloomBakery.host(): InBloomBakery,
-    IndianHealthyRecipes.host(): IndianHealthyRecipes,
-    InGoodFlavor.host(): InGoodFlavor,
-    Innit.host(): Innit,
-    InsanelyGoodRecipes.host(): InsanelyGoodRecipes,
-    Inspiralized.host(): Inspiralized,
-    InspiredTaste.host(): InspiredTaste,
-    IowaGirlEats.host(): IowaGirlEats,
-    IrishCentral.host(): IrishCentral,
-    ItDoesntTasteLikeChicken.host(): ItDoesntTasteLikeChicken,
-    ItsNotAboutNutrition.host(): ItsNotAboutNutrition,
-    IzzyCooking.host(): IzzyCooking,
-    JamieOliver.host(): JamieOliver,
-    JennyCanCook.host(): JennyCanCook,
-    JimCooksFoodGood.host(): JimCooksFoodGood,
-    JoCooks.host(): JoCooks,
-    JoshuaWeissman.host(): JoshuaWeissman,
-    JournalDesFemmes.host(): JournalDesFemmes,
-    Jow.host(): Jow,
-    Joyfoodsunshine.host(): Joyfoodsunshine,
-    JoyfullyMad.host(): JoyfullyMad,
-    JoyTheBaker.host(): JoyTheBaker,
-    JuliasAlbum.host(): JuliasAlbum,
-    JulieGoodwin.host(): JulieGoodwin,
-    Jumbo.host(): Jumbo,
-    JustALittleBitOfBacon.host(): JustALittleBitOfBacon,
-    JustAPinch.host(): JustAPinch,
-    JustATaste.host(): JustATaste,
-    JustBento.host(): JustBento,
-    JustineSnacks.host(): JustineSnacks,
-    JustOneCookbook.host(): JustOneCookbook,
-    KalciRecept.host(): KalciRecept,
-    KaleJunkie.host(): KaleJunkie,
-    KellysCleanKitchen.host(): KellysCleanKitchen,
-    KennethTemple.host(): KennethTemple,
-    KennyMcGovern.host(): KennyMcGovern,
-    KeukenLiefdeNL.host(): KeukenLiefdeNL,
-    KeyToMyLime.host(): KeyToMyLime,
-    KFoods.host(): KFoods,
-    KiddoKitchen.host(): KiddoKitchen,
-    Kikkoman.host(): Kikkoman,
-    KingArthur.host(): KingArthur,
-    KitchenAidAustralia.host(): KitchenAidAustralia,
-    KitchenDivas.host(): KitchenDivas,
-    KitchenDreaming.host(): KitchenDreaming,
-    KitchenSanctuary.host(): KitchenSanctuary,
-    KitchenStories.host(): KitchenStories,
-    Kochbar.host(): Kochbar,
-    Kochbucher.host(): Kochbucher,
-    Koket.host(): Koket,
-    KookJij.host(): KookJij,
-    KristinesKitchenBlog.host(): KristinesKitchenBlog,
-    KrollsKorner.host(): KrollsKorner,
-    KuchniaDomowa.host(): KuchniaDomowa,
-    KuchynaLidla.host(): KuchynaLidla,
-    KwestiaSmaku.host(): KwestiaSmaku,
-    LaCucinaItaliana.host(): LaCucinaItaliana,
-    LaCucinaItaliana.host(domain="com"): LaCucinaItaliana,
-    LanasCooking.host(): LanasCooking,
-    LAtelierDeRoxane.host(): LAtelierDeRoxane,
-    LaurensLatest.host(): LaurensLatest,
-    LazyCatKitchen.host(): LazyCatKitchen,
-    Lecker.host(): Lecker,
-    LeckerSchmecker.host(): LeckerSchmecker,
-    LeCremeDeLaCrumb.host(): LeCremeDeLaCrumb,
-    LeitesCulinaria.host(): LeitesCulinaria,
-    LekkerEnSimpel.host(): LekkerEnSimpel,
-    LetsCampSmore.host(): LetsCampSmore,
-    Leukerecepten.host(): Leukerecepten,
-    LidiasItaly.host(): LidiasItaly,
-    LifestyleOfAFoodie.host(): LifestyleOfAFoodie,
-    LittleFerraroKitchen.host(): LittleFerraroKitchen,
-    LittleSpiceJar.host(): LittleSpiceJar,
-    LittleSpoonFarm.host(): LittleSpoonFarm,
-    LittleSunnyKitchen.host(): LittleSunnyKitchen,
-    LivelyTable.host(): LivelyTable,
-    Lmld.host(): Lmld,
-    LolasCocina.host(): LolasCocina,
-    LoveAndLemons.host(): LoveAndLemons,
-    LoveFood.host(): LoveFood,
-    Lovingitvegan.host(): Lovingitvegan,
-    Maangchi.host(): Maangchi,
-    MadameCuisine.host(): MadameCuisine,
-    MadameLeFigaro.host(): MadameLeFigaro,
-    MadensVerden.host(): MadensVerden,
-    Madsvin.host(): Madsvin,
-    Magimix.host(): Magimix,
-    MakeItDairyFree.host(): MakeItDairyFree,
-    Marmiton.host(): Marmiton,
-    MarthaStewart.host(): MarthaStewart,
-    Matprat.host(): Matprat,
-    McCormick.host(): McCormick,
-    MealPrepManual.host(): MealPrepManual,
-    MeatChurch.host(): MeatChurch,
-    MeganVsKitchen.host(): MeganVsKitchen,
-    Meljoulwan.host(): Meljoulwan,
-    MellisaKNorris.host(): MellisaKNorris,
-    MellosChourico.host(): MellosChourico,
-    MelsKitchenCafe.host(): MelsKitchenCafe,
-    MexicanPlease.host(): MexicanPlease,
-    Migusto.host(): Migusto,
-    Miljuschka.host(): Miljuschka,
-    Mindmegette.host(): Mindmegette,
-    Minimalistbaker.host(): Minimalistbaker,
-    MinistryOfCurry.host(): MinistryOfCurry,
-    Misya.host(): Misya,
-    Mob.host(): Mob,
-    MobKitchen.host(): MobKitchen,
-    ModernHoney.host(): ModernHoney,
-    MollyBaz.host(): MollyBaz,
-    MomOnTimeout.host(): MomOnTimeout,
-    MomsWithCrockPots.host(): MomsWithCrockPots,
-    MoscatoMom.host(): MoscatoMom,
-    MotherThyme.host(): MotherThyme,
-    Moulinex.host(): Moulinex,
-    MundoDeReceitasBimby.host(): MundoDeReceitasBimby,
-    MyBakingAddiction.host(): MyBakingAddiction,
-    MyJewishLearning.host(): MyJewishLearning,
-    MyKidsLickTheBowl.host(): MyKidsLickTheBowl,
-    MyKitchen101.host(): MyKitchen101,
-    MyKitchen101en.host(): MyKitchen101en,
-    MyKoreanKitchen.host(): MyKoreanKitchen,
-    MyRecipes.host(): MyRecipes,
-    MyriadRecipes.host(): MyriadRecipes,
-    MyVegetarianRoots.host(): MyVegetarianRoots,
-    NatashasKitchen.host(): NatashasKitchen,
-    NaturallyElla.host(): NaturallyElla,
-    Ndr.host(): Ndr,
-    NetaCooks.host(): NetaCooks,
-    NewDadsKitchen.host(): NewDadsKitchen,
-    NHSHealthierFamilies.host(): NHSHealthierFamilies,
-    NibbleDish.host(): NibbleDish,
-    NIHHealthyEating.host(): NIHHealthyEating,
-    NinjaTestKitchen.host(): NinjaTestKitchen,
-    NoraCooks.host(): NoraCooks,
-    NoRecipes.host(): NoRecipes,
-    NoSalty.host(): NoSalty,
-    NotEnoughCinnamon.host(): NotEnoughCinnamon,
-    NourishedByNutrition.host(): NourishedByNutrition,
-    NRKMat.host(): NRKMat,
-    Number2Pencil.host(): Number2Pencil,
-    NutritionByNathalie.host(): NutritionByNathalie,
-    NutritionFacts.host(): NutritionFacts,
-    NYTimes.host(): NYTimes,
-    OhSheGlows.host(): OhSheGlows,
-    OhSweetBasil.host(): OhSweetBasil,
-    OkokoRecepten.host(): OkokoRecepten,
-    OmnivoresCookbook.host(): OmnivoresCookbook,
-    OnceUponAChef.host(): OnceUponAChef,
-    OneHundredOneCookBooks.host(): OneHundredOneCookBooks,
-    OneSevenSevenMilkStreet.host(): OneSevenSevenMilkStreet,
-    OneSweetAppetite.host(): OneSweetAppetite,
-    OrganicallyAddison.host(): OrganicallyAddison,
-    OttolenghiBooks.host(): OttolenghiBooks,
-    OurBestBites.host(): OurBestBites,
-    OwenHan.host(): OwenHan,
-    PaleoRunningMomma.host(): PaleoRunningMomma,
-    Panelinha.host(): Panelinha,
-    PaniniHappy.host(): PaniniHappy,
-    PanlasangPinoy.host(): PanlasangPinoy,
-    PastificioSorrentino.host(): PastificioSorrentino,
-    PaulaDeen.host(): PaulaDeen,
-    PeelWithZeal.host(): PeelWithZeal,
-    PersnicketyPlates.host(): PersnicketyPlates,
-    PickUpLimes.host(): PickUpLimes,
-    Picnic.host(): Picnic,
-    PiesAndPlots.host(): PiesAndPlots,
-    PilipinasRecipes.host(): PilipinasRecipes,
-    PinchOfYum.host(): PinchOfYum,
-    PingoDoce.host(): PingoDoce,
-    PinkOwlKitchen.host(): PinkOwlKitchen,
-    PlantYou.host(): PlantYou,
-    PlatingPixels.host(): PlatingPixels,
-    PlatingsAndPairings.host(): PlatingsAndPairings,
-    PlowingThroughLife.host(): PlowingThroughLife,
-    PolishFoodies.host(): PolishFoodies,
-    PoppyCooks.host(): PoppyCooks,
-    PopSugar.host(): PopSugar,
-    PostPunkKitchen.host(): PostPunkKitchen,
-    PotatoRolls.host(): PotatoRolls,
-    PracticalSelfReliance.host(): PracticalSelfReliance,
-    PreppyKitchen.host(): PreppyKitchen,
-    PressureLuckCooking.host(): PressureLuckCooking,
-    PrimalEdgeHealth.host(): PrimalEdgeHealth,
-    ProjectGezond.host(): ProjectGezond,
-    Przepisy.host(): Przepisy,
-    PurelyPope.host(): PurelyPope,
-    PurpleCarrot.host(): PurpleCarrot,
-    QuakerOats.host(): QuakerOats,
-    QuiToque.host(): QuiToque,
-    RachlMansfield.host(): RachlMansfield,
-    RainbowPlantLife.host(): RainbowPlantLife,
-    RealFoodTesco.host(): RealFoodTesco,
-    RealFoodWell.host(): RealFoodWell,
-    RealMomNutrition.host(): RealMomNutrition,
-    RealSimple.host(): RealSimple,
-    ReceitasNestleBR.host(): ReceitasNestleBR,
-    Recept.host(): Recept,
-    ReceptiIndex.host(): ReceptiIndex,
-    ReceptyPreVas.host(): ReceptyPreVas,
-    RecettePlus.host(): RecettePlus,
-    RecipeForPerfection.host(): RecipeForPerfection,
-    RecipeGirl.host(): RecipeGirl,
-    RecipeLand.host(): RecipeLand,
-    RecipeRunner.host(): RecipeRunner,
-    RecipeTinEats.host(): RecipeTinEats,
-    RedHouseSpice.host(): RedHouseSpice,
-    Reishunger.host(): Reishunger,
-    Relish.host(): Relish,
-    Rewe.host(): Rewe,
-    Rezeptwelt.host(): Rezeptwelt,
-    RicardoCuisine.host(): RicardoCuisine,
-    Ricetta.host(): Ricetta,
-    RicettePerBimby.host(): RicettePerBimby,
-    RickBayless.host(): RickBayless,
-    RosannaPansino.host(): RosannaPansino,
-    RutgerBakt.host(): RutgerBakt,
-    SaboresAjinomoto.host(): SaboresAjinomoto,
-    SallysBakingAddiction.host(): SallysBakingAddiction,
-    SallysBlog.host(): SallysBlog,
-    SaltPepperSkillet.host(): SaltPepperSkillet,
-    SamsungFood.host(): SamsungFood,
-    SandwhichTribunal.host(): SandwhichTribunal,
-    Saveur.host(): Saveur,
-    SavoringTheGood.host(): SavoringTheGood,
-    SavoryNothings.host(): SavoryNothings,
-    SavoryThoughts.host(): SavoryThoughts,
-    SavvySavingCouple.host(): SavvySavingCouple,
-    SchoolOfWok.host(): SchoolOfWok,
-    ScrambledAndScrumptious.host(): ScrambledAndScrumptious,
-    ScrummyLane.host(): ScrummyLane,
-    SeriousEats.host(): SeriousEats,
-    SharkNinja.host(): SharkNinja,
-    SheLikesFood.host(): SheLikesFood,
-    SimpleGreenSmoothies.host(): SimpleGreenSmoothies,
-    SimpleHomeEdit.host(): SimpleHomeEdit,
-    SimpleVeganista.host(): SimpleVeganista,
-    SimplyCookit.host(): SimplyCookit,
-    SimplyQuinoa.host(): SimplyQuinoa,
-    SimplyRecipes.host(): SimplyRecipes,
-    SimplyWhisked.host(): SimplyWhisked,
-    SipAndFeast.host(): SipAndFeast,
-    SizzleFish.host(): SizzleFish,
-    SizzlingEats.host(): SizzlingEats,
-    SkinnyTaste.host(): SkinnyTaste,
-    SmallTownWoman.host(): SmallTownWoman,
-    Smulweb.host(): Smulweb,
-    SoBors.host(): SoBors,
-    SoMuchFoodBlog.host(): SoMuchFoodBlog,
-    SouthernBite.host(): SouthernBite,
-    SouthernCastIron.host(): SouthernCastIron,
-    SouthernLiving.host(): SouthernLiving,
-    SpainOnAFork.host(): SpainOnAFork,
-    SpendWithPennies.host(): SpendWithPennies,
-    SpicySouthernKitchen.host(): SpicySouthernKitchen,
-    SpisBedre.host(): SpisBedre,
-    Springlane.host(): Springlane,
-    StacyLing.host(): StacyLing,
-    StaySnatched.host(): StaySnatched,
-    SteamyKitchen.host(): SteamyKitchen,
-    StreetKitchen.host(): StreetKitchen,
-    StrongrFastr.host(): StrongrFastr,
-    SudachiRecipes.host(): SudachiRecipes,
-    SugarHero.host(): SugarHero,
-    SugarMapleFarmhouse.host(): SugarMapleFarmhouse,
-    SugarSpunRun.host(): SugarSpunRun,
-    SunBasket.host(): SunBasket,
-    SundaySupperMovement.host(): SundaySupperMovement,
-    SundPaaBudget.host(): SundPaaBudget,
-    Sunset.host(): Sunset,
-    SweetCsDesigns.host(): SweetCsDesigns,
-    SweetPeasAndSaffron.host(): SweetPeasAndSaffron,
-    SwissMilk.host(): SwissMilk,
-    TableAndDish.host(): TableAndDish,
-    TasteAndTellBlog.host(): TasteAndTellBlog,
-    TasteAtlas.host(): TasteAtlas,
-    TasteAU.host(): TasteAU,
-    TastefullyGrace.host(): TastefullyGrace,
-    Tasteline.host(): Tasteline,
-    TasteOfHome.host(): TasteOfHome,
-    TastesBetterFromScratch.host(): TastesBetterFromScratch,
-    TastesOfLizzyT.host(): TastesOfLizzyT,
-    TastingHistory.host(): TastingHistory,
-    Tasty.host(): Tasty,
-    TastyKitchen.host(): TastyKitchen,
-    TastyOven.host(): TastyOven,
-    TatyanasEverydayFood.host(): TatyanasEverydayFood,
-    TeakAndThyme.host(): TeakAndThyme,
-    TheAlmondEater.host(): TheAlmondEater,
-    TheBigMansWorld.host(): TheBigMansWorld,
-    TheCleverCarrot.host(): TheCleverCarrot,
-    TheCookieRookie.host(): TheCookieRookie,
-    TheCookingGuy.host(): TheCookingGuy,
-    TheCountryCook.host(): TheCountryCook,
-    TheFirstMess.host(): TheFirstMess,
-    TheFoodCharlatan.host(): TheFoodCharlatan,
-    TheFoodieTakesFlight.host(): TheFoodieTakesFlight,
-    TheGlutenFreeAustrian.host(): TheGlutenFreeAustrian,
-    TheGuardian.host(): TheGuardian,
-    TheHappyFoodie.host(): TheHappyFoodie,
-    TheIceCreamConfectionals.host(): TheIceCreamConfectionals,
-    TheKitchenCommunity.host(): TheKitchenCommunity,
-    TheKitchenMagPie.host(): TheKitchenMagPie,
-    TheKitchn.host(): TheKitchn,
-    TheLoopyWhisk.host(): TheLoopyWhisk,
-    TheMagicalSlowCooker.host(): TheMagicalSlowCooker,
-    TheMediterraneDish.host(): TheMediterraneDish,
-    TheModernProper.host(): TheModernProper,
-    TheOldWomanAndTheSea.host(): TheOldWomanAndTheSea,
-    ThePalatableLife.host(): ThePalatableLife,
-    ThePioneerWoman.host(): ThePioneerWoman,
-    ThePlantBasedSchool.host(): ThePlantBasedSchool,
-    TheRecipeCritic.host(): TheRecipeCritic,
-    TheSaltyMarshmallow.host(): TheSaltyMarshmallow,
-    TheSpiceTrain.host(): TheSpiceTrain,
-    TheSpruceEats.host(): TheSpruceEats,
-    TheSuburbanSoapBox.host(): TheSuburbanSoapBox,
-    TheVintageMixer.host(): TheVintageMixer,
-    Thewoksoflife.host(): Thewoksoflife,
-    TheWoodenSkillet.host(): TheWoodenSkillet,
-    Thinlicious.host(): Thinlicious,
-    ThirtySeconds.host(): ThirtySeconds,
-    ThisHealthyTable.host(): ThisHealthyTable,
-    ThreeSixFiveDaysOfBakingAndMore.host(): ThreeSixFiveDaysOfBakingAndMore,
-    TidyMom.host(): TidyMom,
-    TimesOfIndia.host(): TimesOfIndia,
-    TineNo.host(): TineNo,
-    Tofoo.host(): Tofoo,
-    ToriAvey.host(): ToriAvey,
-    TudoGostoso.host(): TudoGostoso,
-    TwentyFourKitchen.host(): TwentyFourKitchen,
-    TwoPeasAndTheirPod.host(): TwoPeasAndTheirPod,
-    UitPaulinesKeukenNL.host(): UitPaulinesKeukenNL,
-    Unsophisticook.host(): Unsophisticook,
-    USAPears.host(): USAPears,
-    USDAMyPlate.host(): USDAMyPlate,
-    Valdemarsro.host(): Valdemarsro,
-    ValentinasCorner.host(): ValentinasCorner,
-    VanillaAndBean.host(): VanillaAndBean,
-    VarechaPravdaSK.host(): VarechaPravdaSK,
-    VeganRicha.host(): VeganRicha,
-    VeganSociety.host(): VeganSociety,
-    Vegetarbloggen.host(): Vegetarbloggen,
-    Vegolosi.host(): Vegolosi,
-    VegRecipesOfIndia.host(): VegRecipesOfIndia,
-    VelocidadCuchara.host(): VelocidadCuchara,
-    VeroniqueCloutier.host(): VeroniqueCloutier,
-    Waitrose.host(): Waitrose,
-    WatchWhatUEat.host(): WatchWhatUEat,
-    WDR.host(): WDR,
-    WeAreNotMartha.host(): WeAreNotMartha,
-    WeDishItUp.host(): WeDishItUp,
-    WeightWatchers.host(): WeightWatchers,
-    WeightWatchersPublic.host(): WeightWatchersPublic,
-    WellPlated.host(): WellPlated,
-    WhatsGabyCooking.host(): WhatsGabyCooking,
-    Whole30.host(): Whole30,
-    WholeFoods.host(): WholeFoods,
-    WholeFoods.host(domain="co.uk"): WholeFoods,
-    WikiCookbook.host(): WikiCookbook,
-    WilliamsSonoma.host(): WilliamsSonoma,
-    WomensWeeklyFood.host(): WomensWeeklyFood,
-    Woop.host(): Woop,
-    WyseGuide.host(): WyseGuide,
-    Xiachufang.host(): Xiachufang,
-    Yamasa.host(): Yamasa,
-    Yemek.host(): Yemek,
-    Yummly.host(): Yummly,
-    ZauberTopf.host(): ZauberTopf,
-    ZeitWochenmarkt.host(): ZeitWochenmarkt,
-    ZenBelly.host(): ZenBelly,
-    ZestfulKitchen.host(): ZestfulKitchen,
-}
+def __getattr__(name: str):
+    # scraper classes (e.g. recipe_scrapers.AllRecipes) are imported on first use
+    if name in _SCRAPER_MODULES:
+        return load_scraper_class(_SCRAPER_MODULES[name], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_SCRAPER_MODULES))
 
 
 def get_supported_urls() -> set[str]:
@@ -1420,7 +65,7 @@ def get_supported_urls() -> set[str]:
 
 def scraper_exists_for(url_path: str) -> bool:
     host_name = get_host_name(url_path)
-    return host_name in get_supported_urls()
+    return SCRAPERS.match(host_name) is not None
 
 
 def scrape_html(
@@ -1431,6 +76,11 @@ def scrape_html(
     supported_only: bool | None = None,
     wild_mode: bool | None = None,
     best_image: bool | None = None,
+    parser: str | None = None,
+    cache_fields: bool | None = None,
+    result_cache: ResultCache | None = None,
+    element_index: bool | None = None,
+    fetcher: Fetcher | None = None,
 ) -> AbstractScraper:
     """
     Accepts optional HTML and a required URL as input, and returns a scraper object.
@@ -1453,6 +103,18 @@ def scrape_html(
         wild_mode (bool | None): deprecated: whether to attempt scraping unsupported domains.
         best_image (bool | None): whether to prefer the highest-quality image when multiple
             are available. Defaults to the configured setting when not provided.
+        parser (str | None): BeautifulSoup tree builder used to parse the HTML (such as
+            'html.parser' or 'lxml'). Defaults to the configured setting when not provided.
+        cache_fields (bool | None): whether to compute each field at most once and reuse
+            the result. Defaults to the configured setting when not provided.
+        result_cache (ResultCache | None): cache of to_json() results, returning the
+            stored result for pages already scraped with identical content. Defaults
+            to the configured setting when not provided.
+        element_index (bool | None): whether to answer common soup lookups from an index
+            of the page's elements built once, instead of walking the whole page for each
+            of them. Defaults to the configured setting when not provided.
+        fetcher (Fetcher | None): fetcher used to download the HTML in online mode.
+            Defaults to a fetcher shared by all calls when not provided.
 
     Raises:
         ElementNotFoundInHtml: Retrieval of data failed because an HTML element was not found.
@@ -1485,16 +147,11 @@ def scrape_html(
         supported_only = not bool(wild_mode)  # wild: true -> supported_only: false
 
     if html is None and online is True:
-        if requests_import_error is not None:
-            msg = (
-                "Unable to import the 'requests' library for use when recipe-scrapers \n"
-                "is operating online.\n"
-                "Did you install using 'pip install recipe-scrapers[online]'?"
-            )
-            raise ImportError(msg) from requests_import_error
+        if fetcher is None:
+            fetcher = get_default_fetcher()
 
         try:
-            html = requests.get(url=org_url, headers=HEADERS).text
+            html = fetcher.fetch(org_url)
         except Exception as e:
             raise Exception(f"Failed to retrieve HTML content from {org_url}.") from e
 
@@ -1506,8 +163,17 @@ def scrape_html(
         raise ValueError(msg)
 
     host_name = get_host_name(org_url)
-    if host_name in SCRAPERS:
-        return SCRAPERS[host_name](html=html, url=org_url, best_image=best_image)
+    scraper_host = SCRAPERS.match(host_name)
+    if scraper_host is not None:
+        return SCRAPERS[scraper_host](
+            html=html,
+            url=org_url,
+            best_image=best_image,
+            parser=parser,
+            cache_fields=cache_fields,
+            result_cache=result_cache,
+            element_index=element_index,
+        )
 
     if supported_only in (None, True):
         msg = (
@@ -1519,7 +185,13 @@ def scrape_html(
         raise WebsiteNotImplementedError(msg)
 
     schema_scraper = SchemaScraperFactory.generate(
-        html=html, url=org_url, best_image=best_image
+        html=html,
+        url=org_url,
+        best_image=best_image,
+        parser=parser,
+        cache_fields=cache_fields,
+        result_cache=result_cache,
+        element_index=element_index,
     )
     if schema_scraper.schema.data:
         return schema_scraper
@@ -1527,6 +199,9 @@ def scrape_html(
     raise NoSchemaFoundInWildMode(org_url)
 
 
-def scrape_me(url: str) -> AbstractScraper:
-    html = urlopen(Request(url, headers=HEADERS)).read().decode("utf-8")
+def scrape_me(url: str, fetcher: Fetcher | None = None) -> AbstractScraper:
+    if fetcher is None and requests_import_error is not None:
+        html = urlopen(Request(url, headers=HEADERS)).read().decode("utf-8")
+    else:
+        html = (fetcher or get_default_fetcher()).fetch(url)
     return scrape_html(html, org_url=url)
@@ -1,6 +1,12 @@
+import hashlib
 import inspect
+import json
+import logging
+import types
 from collections import OrderedDict
-from typing import Optional
+from collections.abc import Iterable
+from functools import cached_property
+from typing import Any, Optional
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
@@ -9,10 +15,19 @@ from recipe_scrapers.__version__ import __version__
 from recipe_scrapers.settings import settings
 
 from ._exceptions import ElementNotFoundInHtml
+from ._element_index import IndexedSoup
 from ._grouping_utils import group_ingredients, IngredientGroup
+from ._head_metadata import HeadMetadata
+from ._html_tree import SHARED_TREE_PARSER, SharedTreeBuilder, parse_html_tree
 from ._opengraph import OpenGraph
+from ._result_cache import ResultCache, source_fingerprint
 from ._schemaorg import SchemaOrg
 
+logger = logging.getLogger(__name__)
+
+# Public attributes of a scraper that are not recipe fields
+JSON_EXCLUDED_NAMES = frozenset({"soup", "links", "to_json", "json_fields"})
+
 # Some sites close their content for 'bots', so user-agent must be supplied
 HEADERS = {
     "User-Agent": f"Mozilla/5.0 (compatible; Windows NT 10.0; Win64; x64; rv:{__version__}) recipe-scrapers/{__version__}"
@@ -21,29 +36,162 @@ HEADERS = {
 
 class AbstractScraper:
     page_data: str
+    _json_fields: tuple[str, ...]
 
     _opengraph_cls = OpenGraph
     _schema_cls = SchemaOrg
 
-    def __init__(self, html: str, url: str, best_image: Optional[bool] = None):
+    # Methods wrapped by plugins having an instance_option, by option
+    _instance_plugin_chains: dict[str, dict] = {}
+
+    def __init__(
+        self,
+        html: str,
+        url: str,
+        best_image: Optional[bool] = None,
+        parser: Optional[str] = None,
+        cache_fields: Optional[bool] = None,
+        result_cache: Optional[ResultCache] = None,
+        element_index: Optional[bool] = None,
+    ):
         self.page_data = html
         self.url = url
-        self.soup = BeautifulSoup(self.page_data, "html.parser")
-        self.opengraph = self._opengraph_cls(self.soup)
-        self.schema = self._schema_cls(self.page_data)
         self.best_image_selection = (
             settings.BEST_IMAGE_SELECTION if best_image is None else bool(best_image)
         )
+        self.html_parser = settings.HTML_PARSER if parser is None else parser
+        self.cache_fields = (
+            settings.CACHE_FIELDS if cache_fields is None else bool(cache_fields)
+        )
+        self.result_cache = (
+            settings.RESULT_CACHE if result_cache is None else result_cache
+        )
+        self.element_index = (
+            settings.ELEMENT_INDEX if element_index is None else bool(element_index)
+        )
+
+        # attach the plugins as instructed in settings.PLUGINS, again whenever
+        # settings changed since they were attached
+        if self.__class__.__dict__.get("_plugins_version") != settings._version:
+            self._attach_plugins()
+        for option, methods in self._instance_plugin_chains.items():
+            if getattr(self, option, False):
+                for name, method in methods.items():
+                    setattr(self, name, types.MethodType(method, self))
 
-        # attach the plugins as instructed in settings.PLUGINS
-        if not hasattr(self.__class__, "plugins_initialized"):
-            for name, _ in inspect.getmembers(self, inspect.ismethod):
-                current_method = getattr(self.__class__, name)
-                for plugin in reversed(settings.PLUGINS):
-                    if plugin.should_run(self.host(), name):
-                        current_method = plugin.run(current_method)
-                setattr(self.__class__, name, current_method)
-            setattr(self.__class__, "plugins_initialized", True)
+    def _attach_plugins(self) -> None:
+        self._build_plugin_chains(self.host())
+
+    @classmethod
+    def _build_plugin_chains(cls, host: str) -> None:
+        # Each method's plugin chain is built once per class; settings and
+        # the host are read once here rather than on every call, and plugins
+        # turned off by settings (see PluginInterface.should_run) are left out.
+        # Chains wrap the methods as defined, never the chains attached to a
+        # base class, which may follow other settings or hosts, and each class
+        # holds its own chains or definitions rather than inheriting those.
+        cls._detach_plugins()
+
+        originals = {}
+        instance_chains: dict[str, dict] = {}
+        plugins = tuple(reversed(settings.PLUGINS))
+        for name in cls._plugin_method_names():
+            definition = cls._unwrapped_method(name)
+            original_method = current_method = definition.__get__(None, cls)
+            for plugin in plugins:
+                if plugin.instance_option is None and plugin.should_run(host, name):
+                    logger.debug(
+                        "Decorating: %s.%s() with %s",
+                        cls.__name__,
+                        name,
+                        plugin.__name__,
+                    )
+                    current_method = plugin.run(current_method)
+            attribute = (
+                definition if current_method is original_method else current_method
+            )
+            if cls.__dict__.get(name) is not attribute:
+                originals[name] = (cls.__dict__.get(name), name in cls.__dict__)
+                setattr(cls, name, attribute)
+            for plugin in plugins:
+                if plugin.instance_option is not None and plugin.should_run(host, name):
+                    methods = instance_chains.setdefault(plugin.instance_option, {})
+                    methods[name] = plugin.run(methods.get(name, current_method))
+        cls._plugin_originals = originals
+        cls._instance_plugin_chains = instance_chains
+        cls._plugins_version = settings._version
+        cls.plugins_initialized = True
+
+    @classmethod
+    def _detach_plugins(cls) -> None:
+        """Restore the methods of the class wrapped by plugins to their definitions."""
+        for name, (method, defined) in cls.__dict__.get(
+            "_plugin_originals", {}
+        ).items():
+            if defined:
+                setattr(cls, name, method)
+            else:
+                delattr(cls, name)
+        cls._plugin_originals = {}
+
+    @classmethod
+    def _unwrapped_method(cls, name: str) -> Any:
+        """
+        The definition of a method, as found in the dict of the class defining
+        it, past the plugin chains attached to the class and its bases.
+        """
+        for klass in cls.__mro__:
+            originals = klass.__dict__.get("_plugin_originals", {})
+            if name in originals:
+                method, defined = originals[name]
+                if defined:
+                    return method
+            elif name in klass.__dict__:
+                return klass.__dict__[name]
+        raise AttributeError(name)
+
+    @classmethod
+    def _plugin_method_names(cls) -> list[str]:
+        # Inspect the class rather than the instance, so that the lazily-built
+        # soup, opengraph and schema attributes are not evaluated here.
+        return [
+            name
+            for name, value in inspect.getmembers(cls)
+            if (inspect.isfunction(value) or inspect.ismethod(value))
+            and not isinstance(inspect.getattr_static(cls, name), staticmethod)
+        ]
+
+    @cached_property
+    def _html_tree(self):
+        # Only used in shared-tree mode, where it backs both soup and schema.
+        return parse_html_tree(self.page_data)
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Parsed HTML of the recipe page, built on first access."""
+        soup_cls = IndexedSoup if self.element_index else BeautifulSoup
+        if self.html_parser != SHARED_TREE_PARSER:
+            return soup_cls(self.page_data, self.html_parser)
+        if self._html_tree is None:
+            return soup_cls(self.page_data, "lxml")
+        return soup_cls(self._html_tree, builder=SharedTreeBuilder())
+
+    @cached_property
+    def head_metadata(self) -> HeadMetadata:
+        """<meta> and <link> tags of the recipe page, gathered on first access."""
+        return HeadMetadata(self.soup)
+
+    @cached_property
+    def opengraph(self) -> OpenGraph:
+        """OpenGraph metadata of the recipe page, built on first access."""
+        return self._opengraph_cls(self.soup, self.head_metadata)
+
+    @cached_property
+    def schema(self) -> SchemaOrg:
+        """Schema.org metadata of the recipe page, extracted on first access."""
+        if self.html_parser == SHARED_TREE_PARSER and self._html_tree is not None:
+            return self._schema_cls(self._html_tree)
+        return self._schema_cls(self.page_data)
 
     def author(self):
         """Author of the recipe."""
@@ -51,9 +199,9 @@ class AbstractScraper:
 
     def canonical_url(self):
         """Canonical or original URL of the recipe."""
-        canonical_link = self.soup.find("link", {"rel": "canonical", "href": True})
-        if canonical_link:
-            return urljoin(self.url, canonical_link["href"])
+        canonical_href = self.head_metadata.link_href("canonical")
+        if canonical_href is not None:
+            return urljoin(self.url, canonical_href)
         return self.url
 
     def site_name(self):
@@ -74,15 +222,9 @@ class AbstractScraper:
 
         # Deprecated: check for a meta http-equiv header
         # See: https://www.w3.org/International/questions/qa-http-and-lang
-        meta_language = self.soup.find(
-            "meta",
-            {
-                "http-equiv": lambda x: x and x.lower() == "content-language",
-                "content": True,
-            },
-        )
-        if meta_language:
-            language = meta_language.get("content").split(",", 1)[0]
+        meta_language = self.head_metadata.content("http-equiv", "content-language")
+        if meta_language is not None:
+            language = meta_language.split(",", 1)[0]
             if language:
                 candidate_languages[language] = True
 
@@ -187,21 +329,91 @@ class AbstractScraper:
 
         return [link.attrs for link in links_html if link["href"] not in invalid_href]
 
-    def to_json(self):
-        """Recipe information in JSON format."""
-        json_dict = {}
-        public_method_names = [
-            method
-            for method in dir(self)
-            if callable(getattr(self, method))
-            if not method.startswith("_") and method not in ["soup", "links", "to_json"]
-        ]
-        for method in public_method_names:
+    @classmethod
+    def json_fields(cls) -> tuple[str, ...]:
+        """Names of the fields included in to_json(), computed once per class."""
+        if "_json_fields" not in cls.__dict__:
+            cls._json_fields = tuple(
+                name
+                for name in dir(cls)
+                if not name.startswith("_")
+                and name not in JSON_EXCLUDED_NAMES
+                and callable(getattr(cls, name))
+            )
+        return cls._json_fields
+
+    def to_json(
+        self, fields: Optional[Iterable[str]] = None, errors: str = "ignore"
+    ) -> dict:
+        """
+        Recipe information in JSON format.
+
+        Args:
+            fields: names of the fields to compute; all fields when not provided.
+            errors: what to do with a field raising an exception: 'ignore' leaves
+                the field out, 'include' reports it in an 'errors' mapping of
+                field name to error message and 'raise' raises it.
+        """
+        if errors not in ("ignore", "include", "raise"):
+            raise ValueError(
+                f"Invalid errors value {errors!r}, valid values are either "
+                "'ignore', 'include' or 'raise'"
+            )
+        json_fields = self.json_fields()
+        if fields is None:
+            fields = json_fields
+        else:
+            fields = tuple(fields)
+            unknown = [field for field in fields if field not in json_fields]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        key = None
+        if self.result_cache is not None:
+            key = self._result_cache_key(fields)
+            cached = self.result_cache.get(key)
+            if cached is not None and not (errors == "raise" and "errors" in cached):
+                if errors != "include":
+                    cached.pop("errors", None)
+                return cached
+
+        json_dict: dict = {}
+        field_errors: dict[str, str] = {}
+        for field in fields:
             try:
-                if method == "ingredient_groups":
-                    json_dict[method] = [i.__dict__ for i in getattr(self, method)()]
+                if field == "ingredient_groups":
+                    json_dict[field] = [i.__dict__ for i in self.ingredient_groups()]
                 else:
-                    json_dict[method] = getattr(self, method)()
-            except Exception:
-                pass
+                    json_dict[field] = getattr(self, field)()
+            except Exception as e:
+                if errors == "raise":
+                    raise
+                field_errors[field] = f"{type(e).__name__}: {e}"
+        if field_errors:
+            json_dict["errors"] = field_errors
+        if key is not None:
+            self.result_cache.set(key, json_dict)
+        if errors != "include":
+            json_dict.pop("errors", None)
         return json_dict
+
+    def _result_cache_key(self, fields: Iterable[str]) -> str:
+        """Key of the to_json() result of the given fields in the result cache."""
+        cls = self.__class__
+        components = [
+            hashlib.sha256(self.page_data.encode("utf-8", "surrogatepass")).hexdigest(),
+            self.url,
+            f"{cls.__module__}.{cls.__qualname__}",
+            source_fingerprint(cls),
+            __version__,
+            [
+                f"{plugin.__module__}.{plugin.__qualname__}"
+                for plugin in settings.PLUGINS
+            ],
+            settings.SUPPRESS_EXCEPTIONS,
+            repr(settings.ON_EXCEPTION_RETURN_VALUES),
+            self.best_image_selection,
+            self.html_parser,
+            list(fields),
+        ]
+        return hashlib.sha256(json.dumps(components).encode("utf-8")).hexdigest()
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from ._abstract import AbstractScraper
+from .settings import settings
+
+# Websites whose recipes are entirely described by their schema.org metadata,
+# by the name of their scraper class. Rather than a module and a class each,
+# they share the SchemaAliasScraper class below: add a row here for a new
+# website that only needs its host to be scraped.
+SCRAPER_ALIASES: dict[str, str] = {
+    "AFullLiving": "afullliving.com",
+    "AkisPetretzikis": "akispetretzikis.com",
+    "AlexandraCooks": "alexandracooks.com",
+    "AllRecipes": "allrecipes.com",
+    "AmbersKitchencooks": "amberskitchencooks.com",
+    "AnItalianInMyKitchen": "anitalianinmykitchen.com",
+    "BakerByNature": "bakerbynature.com",
+    "BakingMischief": "bakingmischief.com",
+    "BarefeetInTheKitchen": "barefeetinthekitchen.com",
+    "BelleOfTheKitchen": "belleofthekitchen.com",
+    "BellyFull": "bellyfull.net",
+    "BetterFoodGuru": "betterfoodguru.com",
+    "BiancaZapatka": "biancazapatka.com",
+    "BiggerBolderBaking": "biggerbolderbaking.com",
+    "BlessThisMessPlease": "blessthismessplease.com",
+    "BlueApron": "blueapron.com",
+    "Breadtopia": "breadtopia.com",
+    "CafeDelites": "cafedelites.com",
+    "CaioFlorentina": "ciaoflorentina.com",
+    "CakeWhiz": "cakewhiz.com",
+    "CastIronKeto": "castironketo.net",
+    "CelebratingSweets": "celebratingsweets.com",
+    "ChefSavvy": "chefsavvy.com",
+    "ClosetCooking": "closetcooking.com",
+    "CloudyKitchen": "cloudykitchen.com",
+    "ColeyCooks": "coleycooks.com",
+    "ColleenChristensenNutrition": "colleenchristensennutrition.com",
+    "CookedAndLoved": "cookedandloved.com",
+    "CookieAndKate": "cookieandkate.com",
+    "CookingClassy": "cookingclassy.com",
+    "CookingLSL": "cookinglsl.com",
+    "CookingWithJanica": "cookingwithjanica.com",
+    "CookWithDana": "cookwithdana.com",
+    "CopyKat": "copykat.com",
+    "CrazyForCrust": "crazyforcrust.com",
+    "Cucchiaio": "cucchiaio.it",
+    "DamnDelicious": "damndelicious.net",
+    "DeliciouslyElla": "deliciouslyella.com",
+    "DelsCookingTwist": "delscookingtwist.com",
+    "DinnerAtTheZoo": "dinneratthezoo.com",
+    "DinnerThenDessert": "dinnerthendessert.com",
+    "EatingBirdFood": "eatingbirdfood.com",
+    "EatingEuropean": "eatingeuropean.com",
+    "EatingWell": "eatingwell.com",
+    "EatTolerant": "eattolerant.de",
+    "EatWhatTonight": "eatwhattonight.com",
+    "EmilyBites": "emilybites.com",
+    "ErrensKitchen": "errenskitchen.com",
+    "EverydayDelicious": "everyday-delicious.com",
+    "EverydayPie": "everydaypie.com",
+    "EvolvingTable": "evolvingtable.com",
+    "FamilySpice": "familyspice.com",
+    "FeastingAtHome": "feastingathome.com",
+    "FifteenSpatulas": "fifteenspatulas.com",
+    "FigJar": "figjar.com",
+    "FitSlowCookerQueen": "fitslowcookerqueen.com",
+    "Food52": "food52.com",
+    "FoodByMaria": "foodbymaria.com",
+    "GarnishAndGlaze": "garnishandglaze.com",
+    "GirlGoneGourmet": "girlgonegourmet.com",
+    "GirlVersusDough": "girlversusdough.com",
+    "Globo": "receitas.globo.com",
+    "Godt": "godt.no",
+    "GonnaWantSeconds": "gonnawantseconds.com",
+    "HealthyWithAChanceOfSprinkles": "healthywithachanceofsprinkles.com",
+    "HeatherChristo": "heatherchristo.com",
+    "Hostthetoast": "hostthetoast.com",
+    "HouseOfNashEats": "houseofnasheats.com",
+    "HouseOfYumm": "houseofyumm.com",
+    "IAmBaker": "iambaker.net",
+    "Ica": "ica.se",
+    "ImWorthy": "im-worthy.com",
+    "IndianHealthyRecipes": "indianhealthyrecipes.com",
+    "Inspiralized": "inspiralized.com",
+    "IzzyCooking": "izzycooking.com",
+    "JimCooksFoodGood": "jimcooksfoodgood.com",
+    "Jow": "jow.fr",
+    "JuliasAlbum": "juliasalbum.com",
+    "Jumbo": "jumbo.com",
+    "JustALittleBitOfBacon": "justalittlebitofbacon.com",
+    "JustATaste": "justataste.com",
+    "JustineSnacks": "justinesnacks.com",
+    "KennethTemple": "kennethtemple.com",
+    "KitchenStories": "kitchenstories.com",
+    "Kochbar": "kochbar.de",
+    "Koket": "koket.se",
+    "KristinesKitchenBlog": "kristineskitchenblog.com",
+    "LanasCooking": "lanascooking.com",
+    "LaurensLatest": "laurenslatest.com",
+    "LeCremeDeLaCrumb": "lecremedelacrumb.com",
+    "LeitesCulinaria": "leitesculinaria.com",
+    "LetsCampSmore": "letscampsmore.com",
+    "Leukerecepten": "leukerecepten.nl",
+    "LittleSpiceJar": "littlespicejar.com",
+    "LittleSpoonFarm": "littlespoonfarm.com",
+    "Lovingitvegan": "lovingitvegan.com",
+    "MadensVerden": "madensverden.dk",
+    "Madsvin": "madsvin.com",
+    "Marmiton": "marmiton.org",
+    "MarthaStewart": "marthastewart.com",
+    "MeganVsKitchen": "meganvskitchen.com",
+    "MexicanPlease": "mexicanplease.com",
+    "Miljuschka": "miljuschka.nl",
+    "Minimalistbaker": "minimalistbaker.com",
+    "MomOnTimeout": "momontimeout.com",
+    "MyBakingAddiction": "mybakingaddiction.com",
+    "MyJewishLearning": "myjewishlearning.com",
+    "MyRecipes": "myrecipes.com",
+    "MyriadRecipes": "myriadrecipes.com",
+    "MyVegetarianRoots": "myvegetarianroots.com",
+    "NatashasKitchen": "natashaskitchen.com",
+    "NewDadsKitchen": "newdadskitchen.com",
+    "NoraCooks": "noracooks.com",
+    "NotEnoughCinnamon": "notenoughcinnamon.com",
+    "NourishedByNutrition": "nourishedbynutrition.com",
+    "NutritionFacts": "nutritionfacts.org",
+    "OhSheGlows": "ohsheglows.com",
+    "OrganicallyAddison": "organicallyaddison.com",
+    "PaleoRunningMomma": "paleorunningmomma.com",
+    "PanlasangPinoy": "panlasangpinoy.com",
+    "PiesAndPlots": "piesandplots.net",
+    "PilipinasRecipes": "pilipinasrecipes.com",
+    "PinchOfYum": "pinchofyum.com",
+    "PressureLuckCooking": "pressureluckcooking.com",
+    "PurelyPope": "purelypope.com",
+    "RainbowPlantLife": "rainbowplantlife.com",
+    "RealFoodWell": "realfoodwell.com",
+    "RealSimple": "realsimple.com",
+    "Recept": "recept.se",
+    "RecipeForPerfection": "recipeforperfection.com",
+    "RecipeGirl": "recipegirl.com",
+    "RecipeRunner": "reciperunner.com",
+    "RecipeTinEats": "recipetineats.com",
+    "RedHouseSpice": "redhousespice.com",
+    "Relish": "relish.com",
+    "SandwhichTribunal": "sandwichtribunal.com",
+    "Saveur": "saveur.com",
+    "SavoryThoughts": "savorythoughts.com",
+    "SeriousEats": "seriouseats.com",
+    "SimpleVeganista": "simple-veganista.com",
+    "SimplyQuinoa": "simplyquinoa.com",
+    "SimplyWhisked": "simplywhisked.com",
+    "SipAndFeast": "sipandfeast.com",
+    "SmallTownWoman": "smalltownwoman.com",
+    "SoBors": "sobors.hu",
+    "SoMuchFoodBlog": "somuchfoodblog.com",
+    "SouthernBite": "southernbite.com",
+    "SpainOnAFork": "spainonafork.com",
+    "Springlane": "springlane.de",
+    "SudachiRecipes": "sudachirecipes.com",
+    "SugarHero": "sugarhero.com",
+    "SugarMapleFarmhouse": "sugarmaplefarmhouse.com",
+    "SweetCsDesigns": "sweetcsdesigns.com",
+    "SweetPeasAndSaffron": "sweetpeasandsaffron.com",
+    "SwissMilk": "swissmilk.ch",
+    "TableAndDish": "tableanddish.com",
+    "TasteAndTellBlog": "tasteandtellblog.com",
+    "TastesOfLizzyT": "tastesoflizzyt.com",
+    "TatyanasEverydayFood": "tatyanaseverydayfood.com",
+    "TeakAndThyme": "teakandthyme.com",
+    "TheAlmondEater": "thealmondeater.com",
+    "TheBigMansWorld": "thebigmansworld.com",
+    "TheCookieRookie": "thecookierookie.com",
+    "TheCountryCook": "thecountrycook.net",
+    "TheFirstMess": "thefirstmess.com",
+    "TheFoodCharlatan": "thefoodcharlatan.com",
+    "TheFoodieTakesFlight": "thefoodietakesflight.com",
+    "TheGuardian": "theguardian.com",
+    "TheLoopyWhisk": "theloopywhisk.com",
+    "TheMediterraneDish": "themediterraneandish.com",
+    "ThePalatableLife": "thepalatablelife.com",
+    "TheSaltyMarshmallow": "thesaltymarshmallow.com",
+    "Thewoksoflife": "thewoksoflife.com",
+    "TheWoodenSkillet": "thewoodenskillet.com",
+    "ThisHealthyTable": "thishealthytable.com",
+    "ThreeSixFiveDaysOfBakingAndMore": "365daysofbakingandmore.com",
+    "ToriAvey": "toriavey.com",
+    "TwoPeasAndTheirPod": "twopeasandtheirpod.com",
+    "ValentinasCorner": "valentinascorner.com",
+    "VanillaAndBean": "vanillaandbean.com",
+    "VeganRicha": "veganricha.com",
+    "VegRecipesOfIndia": "vegrecipesofindia.com",
+    "WeAreNotMartha": "wearenotmartha.com",
+    "WhatsGabyCooking": "whatsgabycooking.com",
+    "WyseGuide": "wyseguide.com",
+    "Yemek": "yemek.com",
+    "ZestfulKitchen": "zestfulkitchen.com",
+}
+
+_alias_classes: dict[str, type[SchemaAliasScraper]] = {}
+
+
+class SchemaAliasScraper(AbstractScraper):
+    """
+    Scraper shared by the websites listed in SCRAPER_ALIASES.
+
+    Each website gets a thin subclass, named after it and only defining its
+    host, created on first use. Unless a plugin is restricted to specific hosts,
+    the plugins wrap the methods of this class once for all the websites.
+    """
+
+    _host = ""
+
+    @classmethod
+    def host(cls):
+        return cls._host
+
+    def _attach_plugins(self) -> None:
+        cls = self.__class__
+        if any("*" not in plugin.run_on_hosts for plugin in settings.PLUGINS):
+            super()._attach_plugins()
+            return
+
+        base = SchemaAliasScraper
+        if base.__dict__.get("_plugins_version") != settings._version:
+            base._build_plugin_chains(base.host())
+        if cls is not base:
+            # drop the chains built for the website while a plugin was
+            # restricted to some hosts, to use those of the base class
+            cls._detach_plugins()
+            cls._instance_plugin_chains = base._instance_plugin_chains
+            cls._plugins_version = base._plugins_version
+            cls.plugins_initialized = True
+
+
+def alias_scraper(class_name: str) -> type[SchemaAliasScraper]:
+    """The scraper class of a website listed in SCRAPER_ALIASES."""
+    if class_name not in _alias_classes:
+        _alias_classes[class_name] = type(
+            class_name,
+            (SchemaAliasScraper,),
+            {"_host": SCRAPER_ALIASES[class_name], "__module__": __name__},
+        )
+    return _alias_classes[class_name]
+
+
+def __getattr__(name: str):
+    # alias classes are resolved like module attributes, e.g. when unpickling
+    if name in SCRAPER_ALIASES:
+        return alias_scraper(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
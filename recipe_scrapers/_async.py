@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any
+
+from ._batch import ScrapeResult, _scrape_json
+from ._fetcher import DEFAULT_TIMEOUT, Fetcher
+from ._utils import get_host_name
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST_LIMIT = 4
+
+
+class AsyncFetcher:
+    """
+    Fetches pages for asyncio code, without blocking the event loop.
+
+    Requests go through a Fetcher, so that connections to a host are pooled
+    and reused, and run on a thread pool of `concurrency` threads. At most
+    `per_host_limit` requests to the same host are in flight at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetcher: Fetcher | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    ):
+        self._owns_fetcher = fetcher is None
+        if fetcher is None:
+            fetcher = Fetcher(
+                timeout=timeout, pool_size=max(concurrency, per_host_limit)
+            )
+        self.fetcher = fetcher
+        self.per_host_limit = per_host_limit
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> AsyncFetcher:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_fetcher:
+            self.fetcher.close()
+
+    async def fetch(self, url: str) -> str:
+        """Download the HTML of a page."""
+        host = get_host_name(url)
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        async with self._host_limits[host]:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.fetcher.fetch, url)
+
+
+async def scrape_url(
+    url: str,
+    *,
+    fields: Iterable[str] | None = None,
+    fetcher: AsyncFetcher | None = None,
+    executor: Executor | None = None,
+    **options: Any,
+) -> dict:
+    """
+    Download and scrape a recipe page from asyncio code.
+
+    The page is downloaded by the given fetcher (a new one by default) and scraped
+    by the given executor (the event loop's default one by default). Scraping is
+    CPU-bound: pass a ProcessPoolExecutor to scrape several pages in parallel.
+
+    Args:
+        url (str): URL of the recipe.
+        fields (Iterable[str] | None): fields to include in the result; all fields
+            when not provided.
+        fetcher (AsyncFetcher | None): fetcher used to download the page.
+        executor (Executor | None): executor running the scraper.
+        **options: keyword arguments passed to scrape_html() (e.g. supported_only).
+
+    Returns:
+        dict: the to_json() data of the recipe, with the errors of individual
+            fields reported in its 'errors' entry.
+    """
+    if fetcher is None:
+        async with AsyncFetcher() as fetcher:
+            return await scrape_url(
+                url, fields=fields, fetcher=fetcher, executor=executor, **options
+            )
+
+    html = await fetcher.fetch(url)
+    if fields is not None:
+        fields = tuple(fields)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, _scrape_json, html, url, fields, options
+    )
+
+
+async def scrape_urls(
+    urls: Iterable[str],
+    *,
+    fields: Iterable[str] | None = None,
+    fetcher: AsyncFetcher | None = None,
+    executor: Executor | None = None,
+    **options: Any,
+) -> list[ScrapeResult]:
+    """
+    Download and scrape many recipe pages concurrently from asyncio code.
+
+    Takes the same arguments as scrape_url(). Failures do not interrupt the other
+    pages: they are reported in the 'error' of their result.
+
+    Returns:
+        list[ScrapeResult]: the result of each URL, in the order of the input.
+    """
+    if fetcher is None:
+        async with AsyncFetcher() as fetcher:
+            return await scrape_urls(
+                urls, fields=fields, fetcher=fetcher, executor=executor, **options
+            )
+
+    if fields is not None:
+        fields = tuple(fields)
+    urls = list(urls)
+    outcomes = await asyncio.gather(
+        *(
+            scrape_url(
+                url, fields=fields, fetcher=fetcher, executor=executor, **options
+            )
+            for url in urls
+        ),
+        return_exceptions=True,
+    )
+
+    results = []
+    for index, (url, outcome) in enumerate(zip(urls, outcomes)):
+        if isinstance(outcome, Exception):
+            error = f"{type(outcome).__name__}: {outcome}"
+            results.append(ScrapeResult(index, url, error=error))
+        else:
+            results.append(ScrapeResult(index, url, data=outcome))
+    return results
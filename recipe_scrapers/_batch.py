@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from ._utils import get_host_name
+
+DEFAULT_CHUNK_SIZE = 8
+
+
+@dataclass
+class ScrapeResult:
+    index: int  # position of the item in the input
+    url: str
+    data: dict | None = None  # to_json() of the scraper, None when scraping failed
+    error: str | None = None  # "ExceptionType: message" when scraping failed
+
+
+def _scrape_json(
+    html: str, url: str, fields: tuple[str, ...] | None, options: dict[str, Any]
+) -> dict:
+    """Scrape a page into its to_json() data, reporting the errors of fields."""
+    from . import scrape_html
+
+    scraper = scrape_html(html, url, **options)
+    return scraper.to_json(fields=fields, errors="include")
+
+
+def _scrape_chunk(
+    chunk: list[tuple[int, str, str]],
+    fields: tuple[str, ...] | None,
+    options: dict[str, Any],
+) -> list[ScrapeResult]:
+    """Scrape a chunk of (index, html, url) items inside a worker process."""
+    results = []
+    for index, html, url in chunk:
+        try:
+            data = _scrape_json(html, url, fields, options)
+        except Exception as e:
+            results.append(ScrapeResult(index, url, error=f"{type(e).__name__}: {e}"))
+        else:
+            results.append(ScrapeResult(index, url, data=data))
+    return results
+
+
+def _host_chunks(
+    window: list[tuple[int, tuple[str, str]]], chunk_size: int
+) -> Iterator[list[tuple[int, str, str]]]:
+    """Split a window of enumerated (html, url) items into chunks of a single host."""
+    by_host: dict[str, list[tuple[int, str, str]]] = {}
+    for index, (html, url) in window:
+        try:
+            host = get_host_name(url)
+        except Exception:
+            host = url
+        by_host.setdefault(host, []).append((index, html, url))
+
+    for host_items in by_host.values():
+        for start in range(0, len(host_items), chunk_size):
+            yield host_items[start : start + chunk_size]
+
+
+def scrape_many(
+    items: Iterable[tuple[str, str]],
+    *,
+    workers: int | None = None,
+    fields: Iterable[str] | None = None,
+    ordered: bool = True,
+    max_in_flight: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **options: Any,
+) -> Iterator[ScrapeResult]:
+    """
+    Scrape many (html, url) pairs across a pool of worker processes.
+
+    Items are read lazily from the input, grouped by host and sent to the workers
+    in chunks, so that each worker keeps scraping the same few websites and their
+    scraper classes only initialize their plugins once. At most max_in_flight
+    items are read ahead of the results yielded so far.
+
+    Args:
+        items (Iterable[tuple[str, str]]): (html, url) pairs to scrape.
+        workers (int | None): number of worker processes; the CPU count by default.
+        fields (Iterable[str] | None): fields to include in each result's data; all
+            fields when not provided.
+        ordered (bool): whether to yield the results in the order of the input items,
+            or as soon as they are ready.
+        max_in_flight (int | None): maximum number of items read but not yielded yet.
+        chunk_size (int): maximum number of items sent to a worker at once.
+        **options: keyword arguments passed to scrape_html() (e.g. supported_only).
+
+    Yields:
+        ScrapeResult: the index, URL and to_json() data of each item, or the error
+            raised while scraping it. Errors of individual fields are reported in the
+            'errors' entry of the data.
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if max_in_flight is None:
+        max_in_flight = workers * chunk_size * 4
+    elif max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    chunk_size = min(chunk_size, max_in_flight)
+    if fields is not None:
+        fields = tuple(fields)
+
+    remaining = enumerate(items)
+    exhausted = False
+    in_flight = 0
+    next_index = 0
+    buffered: dict[int, ScrapeResult] = {}
+    pending: set[Future] = set()
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            capacity = max_in_flight - in_flight
+            if not exhausted and (capacity >= chunk_size or not pending):
+                window = list(islice(remaining, capacity))
+                exhausted = len(window) < capacity
+                for chunk in _host_chunks(window, chunk_size):
+                    pending.add(executor.submit(_scrape_chunk, chunk, fields, options))
+                in_flight += len(window)
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    if not ordered:
+                        in_flight -= 1
+                        yield result
+                    else:
+                        buffered[result.index] = result
+
+            while next_index in buffered:
+                in_flight -= 1
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from functools import cached_property
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from bs4.element import ResultSet
+
+# Attributes indexed by value, besides the tag name
+INDEXED_ATTRIBUTES = ("id", "class", "itemprop", "property")
+
+# CSS selectors answered from the index: lists of complex selectors made of
+# compound selectors, each an optional tag name followed by ids, classes and
+# attribute conditions, e.g. 'li.ingredient' or '.wprm-recipe-ingredient-group h4,
+# span[itemprop="recipeIngredient"]'. Selectors using anything else (pseudo-classes,
+# escapes, case-insensitive attribute matching, namespaces) are answered by
+# soupsieve alone.
+SELECTOR_TAG_REGEX = re.compile(r"\*|[^\W\d][\w-]*")
+SELECTOR_TOKEN_REGEX = re.compile(
+    r"#(?P<id>-?[^\W\d][\w-]*)"
+    r"|\.(?P<class_name>-?[^\W\d][\w-]*)"
+    r"|\[(?P<attribute>[^\W\d][\w-]*)"
+    r"(?:(?P<operator>[~|^$*]?=)"
+    r"(?:\"(?P<double_quoted>[^\"\\]*)\"|'(?P<single_quoted>[^'\\]*)'|(?P<bare>[\w-]+)))?\]"
+)
+SELECTOR_SEPARATOR_REGEX = re.compile(r"\s*(?P<separator>[,>+~])\s*|\s+")
+
+
+def _attribute_keys(value) -> set[str]:
+    """Index keys of an attribute value: its words and the whole value."""
+    if isinstance(value, list):
+        return {*value, " ".join(value)}
+    return {*value.split(), value}
+
+
+def _compound_selector_keys(
+    selector: str, position: int
+) -> tuple[list[tuple[str, str]], int] | None:
+    """Index keys of the compound selector at a position, and the position after it."""
+    keys = []
+    start = position
+    tag = SELECTOR_TAG_REGEX.match(selector, position)
+    if tag is not None:
+        position = tag.end()
+        if tag.group() != "*":
+            keys.append(("name", tag.group().lower()))
+    while token := SELECTOR_TOKEN_REGEX.match(selector, position):
+        position = token.end()
+        if token["id"]:
+            keys.append(("id", token["id"]))
+        elif token["class_name"]:
+            keys.append(("class", token["class_name"]))
+        elif token["attribute"] in INDEXED_ATTRIBUTES and token["operator"] == "=":
+            value = token["double_quoted"] or token["single_quoted"] or token["bare"]
+            if value:
+                keys.append((token["attribute"], value))
+    if position == start:
+        return None
+    return keys, position
+
+
+def selector_keys(selector: str) -> list[list[tuple[str, str]]] | None:
+    """
+    Index keys that the elements matching a selector have: for each selector of
+    the list, the keys of its last compound selector, e.g. [[("name", "h4")],
+    [("class", "ingredient")]] for '.group h4, .ingredient'. None when the
+    selector cannot be answered from the index.
+    """
+    selector = selector.strip()
+    alternatives = []
+    position = 0
+    while True:
+        compound = _compound_selector_keys(selector, position)
+        if compound is None:
+            return None
+        keys, position = compound
+        if position == len(selector):
+            alternatives.append(keys)
+            break
+        separator = SELECTOR_SEPARATOR_REGEX.match(selector, position)
+        if separator is None:
+            return None
+        position = separator.end()
+        if separator["separator"] == ",":
+            alternatives.append(keys)
+    if not all(alternatives):
+        return None
+    return alternatives
+
+
+class ElementIndex:
+    """
+    Tags of a document by name, id, class, itemprop and property, gathered in a
+    single traversal. Each key lists its tags in document order.
+
+    Tags are indexed by every word of their attribute values, by the whole
+    values, and by the presence of the attributes (True), so the tags of a key
+    are a superset of the tags matching the key in find() and select(), to be
+    checked with the exact rules of the lookup.
+    """
+
+    def __init__(self, root: Tag):
+        self._tags: dict[tuple[str, str | bool], list[Tag]] = defaultdict(list)
+        self._positions: dict[int, int] = {}
+        for element in root.descendants:
+            if not isinstance(element, Tag):
+                continue
+            self._positions[id(element)] = len(self._positions)
+            self._tags["name", element.name.lower()].append(element)
+            for attribute in INDEXED_ATTRIBUTES:
+                value = element.attrs.get(attribute)
+                if value is None:
+                    continue
+                self._tags[attribute, True].append(element)
+                for key in _attribute_keys(value):
+                    self._tags[attribute, key].append(element)
+
+    def candidates(self, alternatives: list[list[tuple[str, str | bool]]]) -> list[Tag]:
+        """
+        Tags having all the keys of any of the alternatives, and possibly others,
+        in document order: those of the rarest key of each alternative.
+        """
+        tags = [
+            min((self._tags.get(key, []) for key in keys), key=len)
+            for keys in alternatives
+        ]
+        if len(tags) == 1:
+            return tags[0]
+        union = {id(tag): tag for candidates in tags for tag in candidates}
+        return sorted(union.values(), key=lambda tag: self._positions[id(tag)])
+
+
+def _matches(tag: Tag, names: set[str] | None, attrs: dict) -> bool:
+    """Whether a tag matches find() arguments, as BeautifulSoup compares them."""
+    if names is not None and tag.name not in names:
+        return False
+    for attribute, expected in attrs.items():
+        value = tag.get(attribute)
+        if value is None:
+            return False
+        if expected is True:
+            continue
+        if isinstance(value, list):
+            if expected not in value and expected != " ".join(value):
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+class IndexedSoup(BeautifulSoup):
+    """
+    BeautifulSoup document answering common find(), find_all(), select() and
+    select_one() lookups from an ElementIndex, built on the first lookup,
+    rather than by walking the whole document for each of them.
+
+    Lookups by tag names, or by id, class, itemprop or property matched against
+    a string or True, and CSS selectors ending with such conditions, take their
+    candidates from the index and check them with the rules of the lookup, so
+    that results are the same and in the same order. Other lookups walk the
+    document as usual.
+
+    Tags removed from the document after the index is built are skipped, but
+    tags added, renamed or given other attributes are not indexed until
+    reindex() is called.
+    """
+
+    @cached_property
+    def element_index(self) -> ElementIndex:
+        return ElementIndex(self)
+
+    def reindex(self) -> None:
+        """Rebuild the index on the next lookup, after editing the document."""
+        self.__dict__.pop("element_index", None)
+
+    def find(self, name=None, attrs=None, recursive=True, string=None, **kwargs):
+        query = self._find_query(name, attrs, recursive, string, kwargs)
+        if query is None:
+            return super().find(
+                name, {} if attrs is None else attrs, recursive, string, **kwargs
+            )
+        tags = self._indexed_find_all(*query, limit=1)
+        return tags[0] if tags else None
+
+    def find_all(
+        self, name=None, attrs=None, recursive=True, string=None, limit=None, **kwargs
+    ):
+        query = self._find_query(name, attrs, recursive, string, kwargs)
+        if query is None:
+            return super().find_all(
+                name, {} if attrs is None else attrs, recursive, string, limit, **kwargs
+            )
+        return ResultSet(None, self._indexed_find_all(*query, limit=limit))
+
+    def select_one(self, selector, namespaces=None, **kwargs):
+        alternatives = None if namespaces or kwargs else selector_keys(selector)
+        if alternatives is None:
+            return super().select_one(selector, namespaces, **kwargs)
+        tags = self._indexed_select(selector, alternatives, limit=1)
+        return tags[0] if tags else None
+
+    def select(self, selector, namespaces=None, limit=None, **kwargs):
+        alternatives = None if namespaces or kwargs else selector_keys(selector)
+        if alternatives is None:
+            return super().select(selector, namespaces, limit, **kwargs)
+        return ResultSet(None, self._indexed_select(selector, alternatives, limit))
+
+    @staticmethod
+    def _find_query(name, attrs, recursive, string, kwargs):
+        """
+        (tag names, attributes, index keys of each alternative) of a find()
+        lookup answerable from the index, or None.
+        """
+        if not recursive or string is not None:
+            return None
+        if name is None:
+            names = None
+        elif isinstance(name, str):
+            names = [name]
+        elif isinstance(name, (list, tuple)) and name:
+            names = list(name)
+        else:
+            return None
+        if names is not None and not all(
+            isinstance(name, str) and name and ":" not in name for name in names
+        ):
+            return None
+
+        if attrs is None:
+            attrs = {}
+        elif isinstance(attrs, str):
+            attrs = {"class": attrs}
+        elif not isinstance(attrs, dict):
+            return None
+        attrs = dict(attrs)
+        for argument, value in kwargs.items():
+            attribute = "class" if argument == "class_" else argument
+            if argument == "text" or argument.startswith("_") or attribute in attrs:
+                return None
+            attrs[attribute] = value
+
+        keys = []
+        for attribute, value in attrs.items():
+            if value is not True and (not isinstance(value, str) or not value):
+                return None
+            if attribute in INDEXED_ATTRIBUTES:
+                keys.append((attribute, value))
+        if names is not None:
+            alternatives = [[("name", name.lower()), *keys] for name in names]
+            return set(names), attrs, alternatives
+        if not keys:
+            return None
+        return None, attrs, [keys]
+
+    def _contains(self, tag: Tag) -> bool:
+        parent = tag.parent
+        while parent is not None:
+            if parent is self:
+                return True
+            parent = parent.parent
+        return False
+
+    def _indexed_find_all(self, names, attrs, alternatives, limit=None) -> list[Tag]:
+        tags = []
+        for tag in self.element_index.candidates(alternatives):
+            if self._contains(tag) and _matches(tag, names, attrs):
+                tags.append(tag)
+                if len(tags) == limit:
+                    break
+        return tags
+
+    def _indexed_select(self, selector, alternatives, limit=None) -> list[Tag]:
+        compiled = soupsieve.compile(selector)
+        tags = []
+        for tag in self.element_index.candidates(alternatives):
+            if self._contains(tag) and compiled.match(tag):
+                tags.append(tag)
+                if len(tags) == limit:
+                    break
+        return tags
@@ -1,4 +1,5 @@
 from ._abstract import AbstractScraper
+from ._result_cache import ResultCache
 from ._utils import get_host_name
 from typing import Optional
 
@@ -48,5 +49,22 @@ class SchemaScraperFactory:
             return self.schema.description()
 
     @classmethod
-    def generate(cls, html, url, best_image: Optional[bool] = None):
-        return cls.SchemaScraper(html=html, url=url, best_image=best_image)
+    def generate(
+        cls,
+        html,
+        url,
+        best_image: Optional[bool] = None,
+        parser: Optional[str] = None,
+        cache_fields: Optional[bool] = None,
+        result_cache: Optional[ResultCache] = None,
+        element_index: Optional[bool] = None,
+    ):
+        return cls.SchemaScraper(
+            html=html,
+            url=url,
+            best_image=best_image,
+            parser=parser,
+            cache_fields=cache_fields,
+            result_cache=result_cache,
+            element_index=element_index,
+        )
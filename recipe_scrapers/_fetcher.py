@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+
+from bs4.dammit import EncodingDetector
+
+try:
+    # requests is an optional dependency; we can provide better error messages
+    # when we know that it's unavailable before a user attempts a web request
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
+except ImportError as e:
+    requests_import_error: Exception | None = e
+else:
+    requests_import_error = None
+
+from ._abstract import HEADERS
+from ._exceptions import RecipeScrapersExceptions
+from ._http_cache import HTTPCache
+
+DEFAULT_TIMEOUT = (5.0, 20.0)  # seconds to connect, seconds between received bytes
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_POOL_SIZE = 10
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLarge(RecipeScrapersExceptions):
+    """The page downloaded is larger than the size limit of the fetcher."""
+
+    def __init__(self, url, max_bytes):
+        self.url = url
+        self.max_bytes = max_bytes
+        message = f"Response from {url} is larger than {max_bytes} bytes."
+        super().__init__(message)
+
+
+def _check_requests_available() -> None:
+    if requests_import_error is not None:
+        msg = (
+            "Unable to import the 'requests' library for use when recipe-scrapers \n"
+            "is operating online.\n"
+            "Did you install using 'pip install recipe-scrapers[online]'?"
+        )
+        raise ImportError(msg) from requests_import_error
+
+
+class Fetcher:
+    """
+    Downloads recipe pages over a reusable HTTP session.
+
+    Connections are pooled per host and kept alive between requests, so that
+    fetching many pages from the same website only pays for the TCP and TLS
+    handshakes once. Responses are requested compressed (gzip, and brotli when
+    the brotli package is installed), failed requests are retried with an
+    exponential backoff, and downloads larger than `max_bytes` are aborted.
+    With an HTTPCache, pages are only downloaded again once they expired from
+    the cache and the website reports that they changed.
+
+    A fetcher can be shared between threads, and should be closed when done.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        headers: dict[str, str] | None = None,
+        cache: HTTPCache | None = None,
+    ):
+        _check_requests_available()
+
+        self.timeout = timeout
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.session.headers.update(headers or {})
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> Fetcher:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def get(self, url: str, headers: dict[str, str] | None = None):
+        """
+        Send a GET request, and read its body within the size limit.
+
+        Returns:
+            requests.Response: the response, with its body already read.
+
+        Raises:
+            ResponseTooLarge: When the body is larger than the size limit.
+            requests.RequestException: When the request failed.
+        """
+        response = self.session.get(
+            url, headers=headers, timeout=self.timeout, stream=True
+        )
+        with response:
+            content_length = response.headers.get("Content-Length", "")
+            if content_length.isdigit() and int(content_length) > self.max_bytes:
+                raise ResponseTooLarge(url, self.max_bytes)
+
+            body = bytearray()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                body += chunk
+                if len(body) > self.max_bytes:
+                    raise ResponseTooLarge(url, self.max_bytes)
+            response._content = bytes(body)
+        return response
+
+    def fetch(self, url: str) -> str:
+        """
+        Download the HTML of a page.
+
+        The page is decoded with the charset of its Content-Type header, else with
+        the encoding declared in the HTML, else as UTF-8.
+
+        Raises:
+            ResponseTooLarge: When the page is larger than the size limit.
+            requests.RequestException: When the request failed.
+        """
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None and cached.is_fresh(self.cache.ttl):
+            return decode_html(cached.content, cached.content_type)
+
+        response = self.get(url, headers=cached.validators() if cached else None)
+        if cached is not None and response.status_code == 304:
+            self.cache.revalidated(
+                url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            return decode_html(cached.content, cached.content_type)
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "")
+        if self.cache is not None:
+            self.cache.store(
+                url,
+                response.content,
+                content_type=content_type,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return decode_html(response.content, content_type)
+
+
+def decode_html(content: bytes, content_type: str = "") -> str:
+    """Decode the body of an HTML response."""
+    encoding = None
+    if "charset=" in content_type.lower():
+        encoding = requests.utils.get_encoding_from_headers(
+            {"content-type": content_type}
+        )
+    if encoding is None:
+        encoding = EncodingDetector.find_declared_encoding(content, is_html=True)
+    try:
+        return content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+_default_fetcher: Fetcher | None = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_default_fetcher() -> Fetcher:
+    """The fetcher shared by scrape_html() and scrape_me() when none is given."""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = Fetcher()
+        return _default_fetcher
@@ -1,31 +1,17 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+import re
 from dataclasses import dataclass
+from functools import cached_property
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from ._utils import normalize_string
 
 
-def normalize_fractions(text: str) -> str:
-    """Normalize Unicode fractions to ASCII fractions for consistent matching.
-
-    This function converts Unicode fraction characters (like ½, ¼, ¾) to their
-    ASCII equivalents (like 1/2, 1/4, 3/4) to ensure consistent matching
-    in ingredient grouping.
-
-    Parameters
-    ----------
-    text : str
-        The text string that may contain Unicode fractions.
-
-    Returns
-    -------
-    str
-        The text with Unicode fractions converted to ASCII fractions.
-    """
-    fraction_map = {
+FRACTIONS_TABLE = str.maketrans(
+    {
         "½": "1/2",
         "⅓": "1/3",
         "⅔": "2/3",
@@ -42,11 +28,27 @@ def normalize_fractions(text: str) -> str:
         "⅝": "5/8",
         "⅞": "7/8",
     }
+)
 
-    for unicode_frac, ascii_frac in fraction_map.items():
-        text = text.replace(unicode_frac, ascii_frac)
 
-    return text
+def normalize_fractions(text: str) -> str:
+    """Normalize Unicode fractions to ASCII fractions for consistent matching.
+
+    This function converts Unicode fraction characters (like ½, ¼, ¾) to their
+    ASCII equivalents (like 1/2, 1/4, 3/4) to ensure consistent matching
+    in ingredient grouping.
+
+    Parameters
+    ----------
+    text : str
+        The text string that may contain Unicode fractions.
+
+    Returns
+    -------
+    str
+        The text with Unicode fractions converted to ASCII fractions.
+    """
+    return text.translate(FRACTIONS_TABLE)
 
 
 DEFAULT_GROUPINGS: list[tuple[str, list[str], list[str]]] = [
@@ -75,6 +77,90 @@ DEFAULT_GROUPINGS: list[tuple[str, list[str], list[str]]] = [
 ]
 
 
+# selectors made of tag names, classes, ids and combinators, which only match
+# elements under or with all of their classes (no ",", :not(), ...)
+SIMPLE_SELECTOR_REGEX = re.compile(r"[-\w\s.#>+~*]+")
+CLASS_SELECTOR_REGEX = re.compile(r"\.(-?[_a-zA-Z][-\w]*)")
+
+
+class SoupIndex:
+    """
+    Selections of a document, each computed once.
+
+    The class names used in the document are collected in one pass, so that
+    selectors requiring a class the document does not use (e.g. the selectors
+    of recipe plugins absent from the page) are rejected with set lookups,
+    without being run. The same pass numbers the tags, so that selections can
+    be merged in document order.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self._selections: dict[str, list[Tag]] = {}
+
+    @cached_property
+    def _scan(self) -> tuple[set[str], dict[int, int]]:
+        names = set()
+        positions = {}
+        for element in self.soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            positions[id(element)] = len(positions)
+            classes = element.get("class")
+            if classes is None:
+                continue
+            if isinstance(classes, str):
+                classes = classes.split()
+            names.update(name.lower() for name in classes)
+        return names, positions
+
+    @property
+    def class_names(self) -> set[str]:
+        """Class names used in the document, lowercased."""
+        return self._scan[0]
+
+    @property
+    def positions(self) -> dict[int, int]:
+        """Document order of the tags, by id."""
+        return self._scan[1]
+
+    def may_match(self, selector: str) -> bool:
+        """False when the selector requires a class the document does not use."""
+        if not SIMPLE_SELECTOR_REGEX.fullmatch(selector):
+            return True
+        return all(
+            name.lower() in self.class_names
+            for name in CLASS_SELECTOR_REGEX.findall(selector)
+        )
+
+    def select(self, selector: str) -> list[Tag]:
+        if selector not in self._selections:
+            self._selections[selector] = (
+                self.soup.select(selector) if self.may_match(selector) else []
+            )
+        return self._selections[selector]
+
+    def merge(self, *selections: list[Tag]) -> list[Tag]:
+        """Tags of the selections, each once, in document order."""
+        tags = []
+        for tag in heapq.merge(*selections, key=lambda tag: self.positions[id(tag)]):
+            if not tags or tag is not tags[-1]:
+                tags.append(tag)
+        return tags
+
+
+def detect_grouping(index: SoupIndex) -> tuple[str, str] | None:
+    """The first (heading, element) selectors of DEFAULT_GROUPINGS matching a page."""
+    for _, heading_opts, element_opts in DEFAULT_GROUPINGS:
+        for heading_sel in heading_opts:
+            if not index.select(heading_sel):
+                continue
+            for element_sel in element_opts:
+                if index.select(element_sel):
+                    return heading_sel, element_sel
+    return None
+
+
 @dataclass
 class IngredientGroup:
     ingredients: list[str]
@@ -118,6 +204,122 @@ def score_sentence_similarity(first: str, second: str) -> float:
     return 2 * intersection / (len(first_bigrams) + len(second_bigrams))
 
 
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _assign(scores: list[list[float]]) -> list[int]:
+    """
+    The column assigned to each row of a score matrix with no more rows than
+    columns, using each column at most once, with the highest total score.
+
+    Hungarian algorithm (with potentials), in O(rows² × columns).
+    """
+    rows = len(scores)
+    columns = len(scores[0]) if scores else 0
+    infinity = float("inf")
+    # 1-indexed; column_rows[j] is the row assigned to column j (0: none), and
+    # column 0 holds the row being assigned
+    row_potentials = [0.0] * (rows + 1)
+    column_potentials = [0.0] * (columns + 1)
+    column_rows = [0] * (columns + 1)
+    previous_columns = [0] * (columns + 1)
+    for row in range(1, rows + 1):
+        column_rows[0] = row
+        column = 0
+        min_slacks = [infinity] * (columns + 1)
+        visited = [False] * (columns + 1)
+        while column_rows[column] != 0:
+            visited[column] = True
+            current_row = column_rows[column]
+            row_scores = scores[current_row - 1]
+            delta = infinity
+            next_column = 0
+            for j in range(1, columns + 1):
+                if visited[j]:
+                    continue
+                slack = (
+                    -row_scores[j - 1]
+                    - row_potentials[current_row]
+                    - column_potentials[j]
+                )
+                if slack < min_slacks[j]:
+                    min_slacks[j] = slack
+                    previous_columns[j] = column
+                if min_slacks[j] < delta:
+                    delta = min_slacks[j]
+                    next_column = j
+            for j in range(columns + 1):
+                if visited[j]:
+                    row_potentials[column_rows[j]] += delta
+                    column_potentials[j] -= delta
+                else:
+                    min_slacks[j] -= delta
+            column = next_column
+        while column != 0:
+            previous_column = previous_columns[column]
+            column_rows[column] = column_rows[previous_column]
+            column = previous_column
+
+    assignment = [0] * rows
+    for column in range(1, columns + 1):
+        if column_rows[column] != 0:
+            assignment[column_rows[column] - 1] = column - 1
+    return assignment
+
+
+class IngredientMatcher:
+    """
+    Matches texts with the most similar of a list of ingredients.
+
+    The ingredients are normalized, and their bigrams computed, once, so that
+    matching a text only normalizes the text and computes its own bigrams.
+    Similarity is score_sentence_similarity().
+    """
+
+    def __init__(self, ingredients: list[str]):
+        self.ingredients = ingredients
+        self._normalized = [normalize_fractions(item) for item in ingredients]
+        self._bigrams = [_bigrams(item) for item in self._normalized]
+
+    def scores(self, text: str) -> list[float]:
+        """Similarity of a text with each ingredient."""
+        text = normalize_fractions(text)
+        if len(text) < 2:
+            return [1 if text == item else 0 for item in self._normalized]
+        text_bigrams = _bigrams(text)
+        return [
+            (
+                1
+                if text == item
+                else (
+                    2 * len(text_bigrams & bigrams) / (len(text_bigrams) + len(bigrams))
+                    if len(item) >= 2
+                    else 0
+                )
+            )
+            for item, bigrams in zip(self._normalized, self._bigrams)
+        ]
+
+    def best_match(self, text: str) -> int:
+        """Index of the ingredient most similar to a text (the first one on ties)."""
+        scores = self.scores(text)
+        return max(range(len(scores)), key=scores.__getitem__)
+
+    def assign(self, texts: list[str]) -> list[str]:
+        """
+        Match each text with a distinct ingredient (there are at most as many
+        texts as ingredients).
+
+        Each text gets its most similar ingredient when no two texts share it;
+        otherwise the pairing with the highest total similarity is chosen.
+        """
+        indexes = [self.best_match(text) for text in texts]
+        if len(set(indexes)) != len(indexes):
+            indexes = _assign([self.scores(text) for text in texts])
+        return [self.ingredients[index] for index in indexes]
+
+
 def best_match(test_string: str, target_strings: list[str]) -> str:
     """Find the best match for a given test string within a list of target strings.
 
@@ -138,16 +340,8 @@ def best_match(test_string: str, target_strings: list[str]) -> str:
     str
         The string from target_strings that has the highest similarity score with test_string.
     """
-    normalized_test = normalize_fractions(test_string)
-    normalized_targets = [normalize_fractions(target) for target in target_strings]
-
-    scores = [
-        score_sentence_similarity(normalized_test, target)
-        for target in normalized_targets
-    ]
-    best_match_index = max(range(len(scores)), key=scores.__getitem__)
-
-    return target_strings[best_match_index]
+    matcher = IngredientMatcher(target_strings)
+    return target_strings[matcher.best_match(test_string)]
 
 
 def group_ingredients(
@@ -189,40 +383,40 @@ def group_ingredients(
         If the number of elements selected does not match the length of ingredients_list.
     """
 
+    index = SoupIndex(soup)
     if group_heading is None or group_element is None:
-        for _, heading_opts, element_opts in DEFAULT_GROUPINGS:
-            for heading_sel in heading_opts:
-                for element_sel in element_opts:
-                    if soup.select(heading_sel) and soup.select(element_sel):
-                        group_heading = heading_sel
-                        group_element = element_sel
-                        break
-                if group_heading and group_element:
-                    break
-            if group_heading and group_element:
-                break
+        detected = detect_grouping(index)
+        if detected is not None:
+            group_heading, group_element = detected
 
     if not group_heading or not group_element:
         return [IngredientGroup(ingredients=ingredients_list)]
 
-    found_ingredients = soup.select(group_element)
+    found_ingredients = index.select(group_element)
     if len(found_ingredients) != len(ingredients_list):
         raise ValueError(
             f"Found {len(found_ingredients)} grouped ingredients but was expecting to find {len(ingredients_list)}."
         )
 
-    groupings: dict[str | None, list[str]] = defaultdict(list)
+    heading_elements = index.select(group_heading)
+    headings = {id(heading) for heading in heading_elements}
+    group_headings: list[str | None] = []
+    texts: list[str] = []
+    groupings: dict[str | None, list[str]] = {}
     current_heading: str | None = None
-    elements = soup.select(f"{group_heading}, {group_element}")
-    for element in elements:
-        if element in element.parent.select(group_heading):
+    for element in index.merge(heading_elements, found_ingredients):
+        if id(element) in headings:
             current_heading = normalize_string(element.get_text()) or None
             if current_heading not in groupings:
                 groupings[current_heading] = []
         else:
-            ingredient_text = normalize_string(element.get_text())
-            matched_ingredient = best_match(ingredient_text, ingredients_list)
-            groupings[current_heading].append(matched_ingredient)
+            groupings.setdefault(current_heading, [])  # groups keep the page order
+            group_headings.append(current_heading)
+            texts.append(normalize_string(element.get_text()))
+
+    matched_ingredients = IngredientMatcher(ingredients_list).assign(texts)
+    for heading, matched_ingredient in zip(group_headings, matched_ingredients):
+        groupings[heading].append(matched_ingredient)
 
     return [
         IngredientGroup(purpose=heading, ingredients=items)
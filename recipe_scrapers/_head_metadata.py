@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Optional
+
+from bs4 import BeautifulSoup, Tag
+
+# <meta> properties (or names) giving an image of the page
+IMAGE_META_PROPERTIES = frozenset(
+    {
+        "og:image",
+        "og:image:url",
+        "og:image:secure_url",
+        "twitter:image",
+        "twitter:image:src",
+    }
+)
+IMAGE_DIMENSION_PROPERTIES = {"og:image:width": "width", "og:image:height": "height"}
+
+DIMENSION_REGEX = re.compile(r"\d+")
+
+# Attributes of <meta> tags indexed by value
+META_ATTRIBUTES = ("property", "name", "http-equiv")
+
+
+def _attribute_values(value) -> set[str]:
+    """Values matching an attribute in find(): each value of a multi-valued one too."""
+    if isinstance(value, list):
+        return {*value, " ".join(value)}
+    return {value}
+
+
+class HeadMetadata:
+    """
+    <meta> and <link> tags of a page, gathered in a single traversal, for the
+    OpenGraph data, language(), canonical_url() and the image plugins to share.
+
+    Tags are collected from the whole document, as they are often found out of
+    <head>, and their lookups match attributes as find() does, except for
+    http-equiv values, compared case-insensitively.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self._meta: dict[tuple[str, str], list[Tag]] = defaultdict(list)
+        self._links: dict[str, list[Tag]] = defaultdict(list)
+        images: dict[str, dict] = {}
+        current_image: Optional[dict] = None
+
+        # One walk over the document, faster than find_all(["meta", "link"])
+        for tag in soup.descendants:
+            if not isinstance(tag, Tag) or tag.name not in ("meta", "link"):
+                continue
+            if tag.name == "link":
+                rel = tag.get("rel")
+                if rel is not None:
+                    for value in _attribute_values(rel):
+                        self._links[value].append(tag)
+                continue
+
+            for attribute in META_ATTRIBUTES:
+                value = tag.get(attribute)
+                if value is None:
+                    continue
+                for key in _attribute_values(value):
+                    if attribute == "http-equiv":
+                        key = key.lower()
+                    self._meta[attribute, key].append(tag)
+
+            prop = (tag.get("property") or tag.get("name") or "").lower()
+            content = tag.get("content")
+            if not content:
+                continue
+            if prop in IMAGE_META_PROPERTIES:
+                url = content.strip()
+                current_image = images.setdefault(
+                    url, {"url": url, "width": None, "height": None, "sources": set()}
+                )
+                source = "twitter" if prop.startswith("twitter:") else "opengraph"
+                current_image["sources"].add(source)
+            elif prop in IMAGE_DIMENSION_PROPERTIES and current_image is not None:
+                dimension = IMAGE_DIMENSION_PROPERTIES[prop]
+                match = DIMENSION_REGEX.search(content)
+                if match is not None:
+                    current_image[dimension] = max(
+                        int(match.group()), current_image[dimension] or 0
+                    )
+                current_image["sources"].add("opengraph")
+
+        # Image URLs in document order, with the largest og:image:width/height
+        # following them and the sources (opengraph or twitter) giving them
+        self.images: list[dict] = list(images.values())
+
+    def meta(self, attribute: str, value: str) -> list[Tag]:
+        """<meta> tags with a property, name or http-equiv value, in document order."""
+        if attribute == "http-equiv":
+            value = value.lower()
+        return self._meta.get((attribute, value), [])
+
+    def content(self, attribute: str, value: str) -> Optional[str]:
+        """Content of the first <meta> tag with the value and a content attribute."""
+        for tag in self.meta(attribute, value):
+            content = tag.get("content")
+            if content is not None:
+                return content
+        return None
+
+    def links(self, rel: str) -> list[Tag]:
+        """<link> tags of a relation, in document order."""
+        return self._links.get(rel, [])
+
+    def link_href(self, rel: str) -> Optional[str]:
+        """href of the first <link> tag of a relation having one."""
+        for tag in self.links(rel):
+            href = tag.get("href")
+            if href is not None:
+                return href
+        return None
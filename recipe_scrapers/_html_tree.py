@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import lxml.html
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
+
+# Parser name selecting the shared-tree mode: the page is parsed once by lxml,
+# and both extruct and BeautifulSoup are built from that single tree.
+SHARED_TREE_PARSER = "lxml-shared"
+
+_WALK_EVENTS = ("start", "end", "comment", "pi")
+
+
+def parse_html_tree(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse HTML into an lxml document, or None if there is nothing to parse."""
+    parser = lxml.html.HTMLParser(encoding="utf-8", default_doctype=False)
+    try:
+        return lxml.html.document_fromstring(html.encode("utf-8"), parser=parser)
+    except etree.ParserError:
+        return None
+
+
+class SharedTreeBuilder(LXMLTreeBuilder):
+    """
+    BeautifulSoup tree builder that reads an already-parsed lxml document
+    instead of parsing markup, replaying the same events lxml would send
+    to the regular lxml tree builder while parsing.
+    """
+
+    NAME = SHARED_TREE_PARSER
+    ALTERNATE_NAMES = []
+    features = [NAME]
+
+    def prepare_markup(self, markup, *args, **kwargs):
+        yield markup, None, None, False
+
+    def feed(self, markup) -> None:
+        tree = markup.getroottree()
+        docinfo = tree.docinfo
+        if docinfo.doctype:
+            self.doctype(docinfo.root_name, docinfo.public_id, docinfo.system_url)
+
+        for event, element in etree.iterwalk(tree, events=_WALK_EVENTS):
+            if event == "start":
+                self.start(element.tag, element.attrib)
+                if element.text:
+                    self.data(element.text)
+                continue
+
+            if event == "end":
+                self.end(element.tag)
+            elif event == "comment":
+                self.comment(element.text or "")
+            elif event == "pi":
+                self.pi(element.target, element.text or "")
+            if element.tail:
+                self.data(element.tail)
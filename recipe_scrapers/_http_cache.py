@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    content: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    stored_at: float  # time of the last download or revalidation
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Headers of a conditional request revalidating this response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Cache of downloaded pages, stored in a directory on the local disk.
+
+    Response bodies are stored once per distinct content, in files named by the
+    SHA-256 of that content, and an SQLite index maps each URL to its body and
+    validators. Responses younger than `ttl` seconds are served from the cache;
+    older ones are revalidated with If-None-Match / If-Modified-Since requests.
+    When the bodies stored exceed `max_size` bytes, the least recently used
+    responses are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        self.path = pathlib.Path(path).expanduser()
+        self.ttl = ttl
+        self.max_size = max_size
+        self._objects = self.path / "objects"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path / "index.sqlite", check_same_thread=False, isolation_level=None
+        )
+        self._db.execute(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def get(self, url: str) -> CachedResponse | None:
+        """The response stored for a URL, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest, content_type, etag, last_modified, stored_at "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            digest, content_type, etag, last_modified, stored_at = row
+            try:
+                content = self._object_path(digest).read_bytes()
+            except FileNotFoundError:
+                self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+        return CachedResponse(
+            url, content, content_type, etag, last_modified, stored_at
+        )
+
+    def store(
+        self,
+        url: str,
+        content: bytes,
+        *,
+        content_type: str = "",
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedResponse:
+        """Store the response downloaded for a URL."""
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        now = time.time()
+        with self._lock:
+            if not object_path.exists():
+                object_path.parent.mkdir(exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    dir=object_path.parent, delete=False
+                ) as temporary:
+                    temporary.write(content)
+                os.replace(temporary.name, object_path)
+
+            previous = self._db.execute(
+                "SELECT digest FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    digest,
+                    len(content),
+                    content_type,
+                    etag,
+                    last_modified,
+                    now,
+                    now,
+                ),
+            )
+            if previous is not None and previous[0] != digest:
+                self._delete_object_if_unused(previous[0])
+            self._evict()
+        return CachedResponse(url, content, content_type, etag, last_modified, now)
+
+    def revalidated(
+        self,
+        url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """
+        Record that the server confirmed the response stored for a URL, along
+        with the validators of its 304 response, if any.
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (time.time(), etag, last_modified, url),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            digests = self._db.execute("SELECT DISTINCT digest FROM responses")
+            for (digest,) in digests.fetchall():
+                self._object_path(digest).unlink(missing_ok=True)
+            self._db.execute("DELETE FROM responses")
+
+    def size(self) -> int:
+        """Bytes of the response bodies stored."""
+        with self._lock:
+            return self._size()
+
+    def _size(self) -> int:
+        (size,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT DISTINCT digest, size FROM responses)"
+        ).fetchone()
+        return size
+
+    def _evict(self) -> None:
+        size = self._size()
+        if size <= self.max_size:
+            return
+        rows = self._db.execute(
+            "SELECT url, digest, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for url, digest, object_size in rows:
+            if size <= self.max_size:
+                break
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            if self._delete_object_if_unused(digest):
+                size -= object_size
+
+    def _delete_object_if_unused(self, digest: str) -> bool:
+        used = self._db.execute(
+            "SELECT 1 FROM responses WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if used is None:
+            self._object_path(digest).unlink(missing_ok=True)
+        return used is None
+
+    def _object_path(self, digest: str) -> pathlib.Path:
+        return self._objects / digest[:2] / digest
@@ -0,0 +1,760 @@
+"""
+Host -> (module, class name) of every scraper in recipe_scrapers/_scrapers.py.
+
+Generated by scripts/generate_manifest.py, do not edit by hand.
+"""
+
+SCRAPER_MANIFEST: dict[str, tuple[str, str]] = {
+    "101cookbooks.com": ("onehundredonecookbooks", "OneHundredOneCookBooks"),
+    "15gram.be": ("fifteengram", "FifteenGram"),
+    "177milkstreet.com": ("onesevensevenmilkstreet", "OneSevenSevenMilkStreet"),
+    "24kitchen.nl": ("twentyfourkitchen", "TwentyFourKitchen"),
+    "30seconds.com": ("thirtyseconds", "ThirtySeconds"),
+    "365daysofbakingandmore.com": ("_aliases", "ThreeSixFiveDaysOfBakingAndMore"),
+    "40aprons.com": ("fortyaprons", "FortyAprons"),
+    "750g.com": ("g750g", "G750g"),
+    "abeautifulmess.com": ("abeautifulmess", "ABeautifulMess"),
+    "aberlehome.com": ("aberlehome", "AberleHome"),
+    "abuelascounter.com": ("abuelascounter", "AbuelasCounter"),
+    "acouplecooks.com": ("acouplecooks", "ACoupleCooks"),
+    "acozykitchen.com": ("acozykitchen", "ACozyKitchen"),
+    "addapinch.com": ("addapinch", "AddAPinch"),
+    "adozensundays.com": ("adozensundays", "ADozenSundays"),
+    "adrianasbestrecipes.com": ("adrianasbestrecipes", "AdrianasBestRecipes"),
+    "afarmgirlsdabbles.com": ("afarmgirlsdabbles", "AFarmGirlsDabbles"),
+    "afghankitchenrecipes.com": ("afghankitchenrecipes", "AfghanKitchenRecipes"),
+    "aflavorjournal.com": ("aflavorjournal", "AFlavorJournal"),
+    "africanbites.com": ("africanbites", "AfricanBites"),
+    "afullliving.com": ("_aliases", "AFullLiving"),
+    "ah.be": ("albertheijn", "AlbertHeijn"),
+    "ah.nl": ("albertheijn", "AlbertHeijn"),
+    "ahealthysliceoflife.com": ("ahealthysliceoflife", "AHealthySliceOfLife"),
+    "akispetretzikis.com": ("_aliases", "AkisPetretzikis"),
+    "albert.cz": ("albertcz", "AlbertCz"),
+    "aldi-nord.de": ("aldinord", "AldiNord"),
+    "aldi-sued.de": ("aldisued", "AldiSued"),
+    "aldi-suisse.ch": ("aldisuisse", "AldiSuisse"),
+    "aldi.com.au": ("aldi", "Aldi"),
+    "aldi.es": ("aldinord", "AldiNord"),
+    "aldi.fr": ("aldinord", "AldiNord"),
+    "aldi.hu": ("aldisued", "AldiSued"),
+    "aldi.it": ("aldisued", "AldiSued"),
+    "aldi.lu": ("aldinord", "AldiNord"),
+    "aldi.nl": ("aldinord", "AldiNord"),
+    "aldi.pl": ("aldinord", "AldiNord"),
+    "aldi.pt": ("aldinord", "AldiNord"),
+    "alexandracooks.com": ("_aliases", "AlexandraCooks"),
+    "alisoneroman.com": ("alisoneroman", "AlisoneRoman"),
+    "alittlebityummy.com": ("alittlebityummy", "ALittleBitYummy"),
+    "allnutritious.com": ("allnutritious", "AllNutritious"),
+    "allrecipes.com": ("_aliases", "AllRecipes"),
+    "allsavoryrecipes.com": ("allsavoryrecipes", "AllSavoryRecipes"),
+    "allthehealthythings.com": ("allthehealthythings", "AllTheHealthyThings"),
+    "alltommat.se": ("alltommat", "AlltOmMat"),
+    "altonbrown.com": ("altonbrown", "AltonBrown"),
+    "amazingoriental.com": ("amazingoriental", "AmazingOriental"),
+    "amazingribs.com": ("amazingribs", "AmazingRibs"),
+    "amberskitchencooks.com": ("_aliases", "AmbersKitchencooks"),
+    "ambitiouskitchen.com": ("ambitiouskitchen", "AmbitiousKitchen"),
+    "ameessavorydish.com": ("ameessavorydish", "AmeesSavoryDish"),
+    "americastestkitchen.com": ("americastestkitchen", "AmericasTestKitchen"),
+    "andy-cooks.com": ("andycooks", "AndyCooks"),
+    "anitalianinmykitchen.com": ("_aliases", "AnItalianInMyKitchen"),
+    "app.samsungfood.com": ("samsungfood", "SamsungFood"),
+    "archanaskitchen.com": ("archanaskitchen", "ArchanasKitchen"),
+    "argiro.gr": ("argiro", "Argiro"),
+    "arla.se": ("arla", "Arla"),
+    "asweetpeachef.com": ("asweetpeachef", "ASweetPeaChef"),
+    "atelierdeschefs.fr": ("atelierdeschefs", "AtelierDesChefs"),
+    "aubreyskitchen.com": ("aubreyskitchen", "AubreysKitchen"),
+    "averiecooks.com": ("averiecooks", "AverieCooks"),
+    "bake-eat-repeat.com": ("bakeeatrepeat", "BakeEatRepeat"),
+    "bakeitwithlove.com": ("bakeitwithlove", "BakeItWithLove"),
+    "bakels.co.uk": ("bakels", "Bakels"),
+    "bakels.com.au": ("bakels", "Bakels"),
+    "bakerbynature.com": ("_aliases", "BakerByNature"),
+    "bakewithzoha.com": ("bakewithzoha", "BakeWithZoha"),
+    "baking-sense.com": ("bakingsense", "BakingSense"),
+    "bakingmischief.com": ("_aliases", "BakingMischief"),
+    "barefeetinthekitchen.com": ("_aliases", "BarefeetInTheKitchen"),
+    "barefootcontessa.com": ("barefootcontessa", "BareFootContessa"),
+    "barefootinthepines.com": ("barefootinthepines", "BarefootInThePines"),
+    "bbc.co.uk": ("bbcfood", "BBCFood"),
+    "bbc.com": ("bbcfood", "BBCFood"),
+    "bbcgoodfood.com": ("bbcgoodfood", "BBCGoodFood"),
+    "belleofthekitchen.com": ("_aliases", "BelleOfTheKitchen"),
+    "bellyfull.net": ("_aliases", "BellyFull"),
+    "bestrecipes.com.au": ("bestrecipes", "BestRecipes"),
+    "betterfoodguru.com": ("_aliases", "BetterFoodGuru"),
+    "bettybossi.ch": ("bettybossi", "BettyBossi"),
+    "bettycrocker.com": ("bettycrocker", "BettyCrocker"),
+    "beyondfrosting.com": ("beyondfrosting", "BeyondFrosting"),
+    "biancazapatka.com": ("_aliases", "BiancaZapatka"),
+    "biggerbolderbaking.com": ("_aliases", "BiggerBolderBaking"),
+    "bigoven.com": ("bigoven", "BigOven"),
+    "billyparisi.com": ("billyparisi", "BillyParisi"),
+    "bitsofcarey.com": ("bitsofcarey", "BitsOfCarey"),
+    "blessthismessplease.com": ("_aliases", "BlessThisMessPlease"),
+    "blogghetti.com": ("blogghetti", "Blogghetti"),
+    "blogosferathermomix.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "blueapron.com": ("_aliases", "BlueApron"),
+    "bluejeanchef.com": ("bluejeanchef", "BlueJeanChef"),
+    "bodybuilding.com": ("bodybuilding", "Bodybuilding"),
+    "bofrost.de": ("bofrost", "Bofrost"),
+    "bonappetit.com": ("bonappetit", "BonAppetit"),
+    "bongeats.com": ("bongeats", "BongEats"),
+    "books.ottolenghi.co.uk": ("ottolenghibooks", "OttolenghiBooks"),
+    "bowlofdelicious.com": ("bowlofdelicious", "BowlOfDelicious"),
+    "breadtopia.com": ("_aliases", "Breadtopia"),
+    "brewersfriend.com": ("brewersfriend", "BrewersFriend"),
+    "briceletbaklava.ch": ("briceletbaklava", "BricelEtBaklava"),
+    "brokenovenbaking.com": ("brokenovenbaking", "BrokenOvenBaking"),
+    "budgetbytes.com": ("budgetbytes", "BudgetBytes"),
+    "cafedelites.com": ("_aliases", "CafeDelites"),
+    "cakemehometonight.com": ("cakemehometonight", "CakeMeHomeTonight"),
+    "cakewhiz.com": ("_aliases", "CakeWhiz"),
+    "cambreabakes.com": ("cambreabakes", "CambreaBakes"),
+    "carlsbadcravings.com": ("carlsbadcravings", "CarlsBadCravings"),
+    "carriesexperimentalkitchen.com": (
+        "carriesexperimentalkitchen",
+        "CarriesExperimentalKitchen",
+    ),
+    "castironketo.net": ("_aliases", "CastIronKeto"),
+    "castironskilletcooking.com": ("castironskilletcooking", "CastIronSkilletCooking"),
+    "cdkitchen.com": ("cdkitchen", "CdKitchen"),
+    "celebratingsweets.com": ("_aliases", "CelebratingSweets"),
+    "chefjackovens.com": ("chefjackovens", "ChefJackOvens"),
+    "chefjeanpierre.com": ("chefjeanpierre", "ChefJeanPierre"),
+    "chefkoch.de": ("chefkoch", "Chefkoch"),
+    "chefnini.com": ("chefnini", "Chefnini"),
+    "chefsavvy.com": ("_aliases", "ChefSavvy"),
+    "chewoutloud.com": ("chewoutloud", "ChewOutLoud"),
+    "chocolatewithgrace.com": ("chocolatewithgrace", "ChocolateWithGrace"),
+    "choosehomemade.org": ("choosehomemade", "ChooseHomemade"),
+    "ciaoflorentina.com": ("_aliases", "CaioFlorentina"),
+    "claudia.abril.com.br": ("abril", "Abril"),
+    "cleaneatingkitchen.com": ("cleaneatingkitchen", "CleanEatingKitchen"),
+    "closetcooking.com": ("_aliases", "ClosetCooking"),
+    "cloudykitchen.com": ("_aliases", "CloudyKitchen"),
+    "coleycooks.com": ("_aliases", "ColeyCooks"),
+    "colleenchristensennutrition.com": ("_aliases", "ColleenChristensenNutrition"),
+    "comidinhasdochef.com": ("comidinhasdochef", "ComidinhasDoChef"),
+    "cook-talk.com": ("cooktalk", "CookTalk"),
+    "cookedandloved.com": ("_aliases", "CookedAndLoved"),
+    "cookfastrecipes.com": ("cookfastrecipes", "CookFastRecipes"),
+    "cookieandkate.com": ("_aliases", "CookieAndKate"),
+    "cookiesandcups.com": ("cookiesandcups", "CookiesAndCups"),
+    "cooking.nytimes.com": ("nytimes", "NYTimes"),
+    "cookingcircle.com": ("cookingcircle", "CookingCircle"),
+    "cookingclassy.com": ("_aliases", "CookingClassy"),
+    "cookinglight.com": ("cookinglight", "CookingLight"),
+    "cookinglsl.com": ("_aliases", "CookingLSL"),
+    "cookingwithjanica.com": ("_aliases", "CookingWithJanica"),
+    "cookomix.com": ("cookomix", "Cookomix"),
+    "cookpad.com": ("cookpad", "CookPad"),
+    "cookwell.com": ("cookwell", "CookWell"),
+    "cookwithdana.com": ("_aliases", "CookWithDana"),
+    "copykat.com": ("_aliases", "CopyKat"),
+    "corriecooks.com": ("corriecooks", "CorrieCooks"),
+    "costco.com": ("costco", "Costco"),
+    "countryliving.com": ("countryliving", "CountryLiving"),
+    "crazyforcrust.com": ("_aliases", "CrazyForCrust"),
+    "creativecanning.com": ("creativecanning", "CreativeCanning"),
+    "cucchiaio.it": ("_aliases", "Cucchiaio"),
+    "cuisine.journaldesfemmes.fr": ("journaldesfemmes", "JournalDesFemmes"),
+    "cuisineaz.com": ("cuisineaz", "CuisineAZ"),
+    "cuisinez-pour-bebe.fr": ("cuisinezpourbebe", "CuisinezPourBebe"),
+    "culinaryhill.com": ("culinaryhill", "CulinaryHill"),
+    "culy.nl": ("culy", "Culy"),
+    "cybercook.com.br": ("cybercook", "Cybercook"),
+    "dagelijksekost.vrt.be": ("dagelijksekost", "DagelijkseKost"),
+    "damndelicious.net": ("_aliases", "DamnDelicious"),
+    "daringgourmet.com": ("daringgourmet", "DaringGourmet"),
+    "dashfordinner.com": ("dashfordinner", "DashForDinner"),
+    "davidlebovitz.com": ("davidlebovitz", "DavidLebovitz"),
+    "deliciouslyella.com": ("_aliases", "DeliciouslyElla"),
+    "deliciouslysprinkled.com": ("deliciouslysprinkled", "DeliciouslySprinkled"),
+    "delish.com": ("delish", "Delish"),
+    "delishkitchen.tv": ("delishkitchen", "DelishKitchen"),
+    "delscookingtwist.com": ("_aliases", "DelsCookingTwist"),
+    "dinneratthezoo.com": ("_aliases", "DinnerAtTheZoo"),
+    "dinnerthendessert.com": ("_aliases", "DinnerThenDessert"),
+    "directoalpaladar.com": ("directoalpaladar", "DirectoAlPaladar"),
+    "dish.co.nz": ("dishnz", "Dishnz"),
+    "dobruchut.aktuality.sk": ("dobruchutaktualitysk", "DobruChutAktualitySK"),
+    "domesticate-me.com": ("domesticateme", "DomesticateMe"),
+    "donalskehan.com": ("donalskehan", "DonalSkehan"),
+    "donnahay.com.au": ("donnahay", "DonnaHay"),
+    "downshiftology.com": ("downshiftology", "Downshiftology"),
+    "dr.dk": ("dr", "Dr"),
+    "drinkoteket.se": ("drinkoteket", "Drinkoteket"),
+    "drizzleanddip.com": ("drizzleanddip", "DrizzleAndDip"),
+    "eatingbirdfood.com": ("_aliases", "EatingBirdFood"),
+    "eatingeuropean.com": ("_aliases", "EatingEuropean"),
+    "eatingonadime.com": ("eatingonadime", "EatingOnADime"),
+    "eatingwell.com": ("_aliases", "EatingWell"),
+    "eatliverun.com": ("eatliverun", "EatLiveRun"),
+    "eatsmarter.com": ("eatsmarter", "Eatsmarter"),
+    "eatsmarter.de": ("eatsmarter", "Eatsmarter"),
+    "eatthismuch.com": ("eatthismuch", "EatThisMuch"),
+    "eattolerant.de": ("_aliases", "EatTolerant"),
+    "eatwell101.com": ("eatwell101", "EatWell101"),
+    "eatwhattonight.com": ("_aliases", "EatWhatTonight"),
+    "edeka.de": ("edeka", "EDEKA"),
+    "editions-larousse.fr": ("editionslarousse", "EditionsLarousse"),
+    "eggs.ca": ("eggsca", "EggsCa"),
+    "elavegan.com": ("elavegan", "ElaVegan"),
+    "emilybites.com": ("_aliases", "EmilyBites"),
+    "emmikochteinfach.de": ("emmikochteinfach", "EmmiKochtEinfach"),
+    "empirecipes.com": ("empirecipes", "Empirecipes"),
+    "en.wikibooks.org": ("wikicookbook", "WikiCookbook"),
+    "epicurious.com": ("epicurious", "Epicurious"),
+    "erinliveswhole.com": ("erinliveswhole", "ErinLivesWhole"),
+    "erinscozykitchen.com": ("erinscozykitchen", "ErinsCozyKitchen"),
+    "errenskitchen.com": ("_aliases", "ErrensKitchen"),
+    "essen-und-trinken.de": ("essenundtrinken", "EssenUndTrinken"),
+    "ethanchlebowski.com": ("ethanchlebowski", "EthanChlebowski"),
+    "everyday-delicious.com": ("_aliases", "EverydayDelicious"),
+    "everydaypie.com": ("_aliases", "EverydayPie"),
+    "evolvingtable.com": ("_aliases", "EvolvingTable"),
+    "familyfoodonthetable.com": ("familyfoodonthetable", "FamilyfoodOnTheTable"),
+    "familyspice.com": ("_aliases", "FamilySpice"),
+    "fantabulosity.com": ("fantabulosity", "Fantabulosity"),
+    "farmhouseonboone.com": ("farmhouseonboone", "FarmhouseOnBoone"),
+    "farmtojar.com": ("farmtojar", "FarmToJar"),
+    "fattoincasadabenedetta.it": ("fattoincasadabenedetta", "FattoInCasaDaBenedetta"),
+    "feastingathome.com": ("_aliases", "FeastingAtHome"),
+    "feelgoodfoodie.net": ("feelgoodfoodie", "FeelGoodFoodie"),
+    "felix.kitchen": ("felixkitchen", "FelixKitchen"),
+    "festligare.se": ("festligare", "Festligare"),
+    "fifteenspatulas.com": ("_aliases", "FifteenSpatulas"),
+    "figjar.com": ("_aliases", "FigJar"),
+    "finedininglovers.com": ("finedininglovers", "FineDiningLovers"),
+    "fithealthymacros.com": ("fithealthymacros", "FitHealthyMacros"),
+    "fitmencook.com": ("fitmencook", "FitMenCook"),
+    "fitslowcookerqueen.com": ("_aliases", "FitSlowCookerQueen"),
+    "flavorsbylinbie.com": ("flavorsbylinbie", "FlavorsByLinbie"),
+    "food.com": ("food", "Food"),
+    "food52.com": ("_aliases", "Food52"),
+    "foodandwine.com": ("foodandwine", "FoodAndWine"),
+    "foodbymaria.com": ("_aliases", "FoodByMaria"),
+    "foodfidelity.com": ("foodfidelity", "FoodFidelity"),
+    "foodnetwork.co.uk": ("foodnetwork", "FoodNetwork"),
+    "foodnetwork.com": ("foodnetwork", "FoodNetwork"),
+    "foodrepublic.com": ("foodrepublic", "FoodRepublic"),
+    "forksoverknives.com": ("forksoverknives", "ForksOverKnives"),
+    "forktospoon.com": ("forktospoon", "ForkToSpoon"),
+    "franzoesischkochen.de": ("franzoesischkochen", "FranzoesischKochen"),
+    "fresh.iprima.cz": ("freshiprima", "FreshiPrima"),
+    "garlicandzest.com": ("garlicandzest", "GarlicAndZest"),
+    "garnishandglaze.com": ("_aliases", "GarnishAndGlaze"),
+    "gesund-aktiv.com": ("gesundaktiv", "GesundAktiv"),
+    "gimmesomeoven.com": ("gimmesomeoven", "GimmeSomeOven"),
+    "girlgonegourmet.com": ("_aliases", "GirlGoneGourmet"),
+    "girlversusdough.com": ("_aliases", "GirlVersusDough"),
+    "gloriousrecipes.com": ("gloriousrecipes", "GloriousRecipes"),
+    "glutenfreeonashoestring.com": (
+        "glutenfreeonashoestring",
+        "GlutenFreeOnAShoeString",
+    ),
+    "godt.no": ("_aliases", "Godt"),
+    "goldnplump.com": ("goldnplump", "GoldnPlump"),
+    "gonnawantseconds.com": ("_aliases", "GonnaWantSeconds"),
+    "goodfooddiscoveries.com": ("goodfooddiscoveries", "GoodFoodDiscoveries"),
+    "goodhousekeeping.com": ("goodhousekeeping", "GoodHousekeeping"),
+    "goodstuff.recipes": ("goodstuffrecipes", "GoodStuffRecipes"),
+    "gourmettraveller.com.au": ("gourmettraveller", "GourmetTraveller"),
+    "grandbaby-cakes.com": ("grandbabycakes", "GrandbabyCakes"),
+    "grandfrais.com": ("grandfrais", "GrandFrais"),
+    "greatbritishchefs.com": ("greatbritishchefs", "GreatBritishChefs"),
+    "grimgrains.com": ("grimgrains", "GrimGrains"),
+    "grouprecipes.com": ("grouprecipes", "GroupRecipes"),
+    "halfbakedharvest.com": ("halfbakedharvest", "HalfBakedHarvest"),
+    "handletheheat.com": ("handletheheat", "HandleTheHeat"),
+    "hassanchef.com": ("hassanchef", "HassanChef"),
+    "headbangerskitchen.com": ("headbangerskitchen", "HeadbangersKitchen"),
+    "healthyeating.nhlbi.nih.gov": ("nihhealthyeating", "NIHHealthyEating"),
+    "healthywithachanceofsprinkles.com": ("_aliases", "HealthyWithAChanceOfSprinkles"),
+    "heatherchristo.com": ("_aliases", "HeatherChristo"),
+    "heb.com": ("heb", "HEB"),
+    "hellofresh.at": ("hellofresh", "HelloFresh"),
+    "hellofresh.be": ("hellofresh", "HelloFresh"),
+    "hellofresh.ca": ("hellofresh", "HelloFresh"),
+    "hellofresh.ch": ("hellofresh", "HelloFresh"),
+    "hellofresh.co.nz": ("hellofresh", "HelloFresh"),
+    "hellofresh.co.uk": ("hellofresh", "HelloFresh"),
+    "hellofresh.com": ("hellofresh", "HelloFresh"),
+    "hellofresh.com.au": ("hellofresh", "HelloFresh"),
+    "hellofresh.de": ("hellofresh", "HelloFresh"),
+    "hellofresh.dk": ("hellofresh", "HelloFresh"),
+    "hellofresh.es": ("hellofresh", "HelloFresh"),
+    "hellofresh.fr": ("hellofresh", "HelloFresh"),
+    "hellofresh.ie": ("hellofresh", "HelloFresh"),
+    "hellofresh.it": ("hellofresh", "HelloFresh"),
+    "hellofresh.lu": ("hellofresh", "HelloFresh"),
+    "hellofresh.nl": ("hellofresh", "HelloFresh"),
+    "hellofresh.no": ("hellofresh", "HelloFresh"),
+    "hellofresh.se": ("hellofresh", "HelloFresh"),
+    "hersheyland.com": ("hersheyland", "HersheyLand"),
+    "hilahcooking.com": ("hilahcooking", "HilahCooking"),
+    "hofer.at": ("hofer", "Hofer"),
+    "hofer.si": ("hofer", "Hofer"),
+    "hogarmania.com": ("hogarmania", "Hogarmania"),
+    "homeandplate.com": ("homeandplate", "HomeAndPlate"),
+    "homechef.com": ("homechef", "HomeChef"),
+    "hostthetoast.com": ("_aliases", "Hostthetoast"),
+    "houseofnasheats.com": ("_aliases", "HouseOfNashEats"),
+    "houseofyumm.com": ("_aliases", "HouseOfYumm"),
+    "howtocook.recipes": ("howtocook", "HowToCook"),
+    "howtofeedaloon.com": ("howtofeedaloon", "HowToFeedALoon"),
+    "hungryhappens.net": ("hungryhappens", "HungryHappens"),
+    "iamafoodblog.com": ("iamafoodblog", "IAmAFoodBlog"),
+    "iambaker.net": ("_aliases", "IAmBaker"),
+    "ica.se": ("_aliases", "Ica"),
+    "im-worthy.com": ("_aliases", "ImWorthy"),
+    "inbloombakery.com": ("inbloombakery", "InBloomBakery"),
+    "indianhealthyrecipes.com": ("_aliases", "IndianHealthyRecipes"),
+    "ingoodflavor.com": ("ingoodflavor", "InGoodFlavor"),
+    "innit.com": ("innit", "Innit"),
+    "insanelygoodrecipes.com": ("insanelygoodrecipes", "InsanelyGoodRecipes"),
+    "inspiralized.com": ("_aliases", "Inspiralized"),
+    "inspiredtaste.net": ("inspiredtaste", "InspiredTaste"),
+    "iowagirleats.com": ("iowagirleats", "IowaGirlEats"),
+    "irishcentral.com": ("irishcentral", "IrishCentral"),
+    "itdoesnttastelikechicken.com": (
+        "itdoesnttastelikechicken",
+        "ItDoesntTasteLikeChicken",
+    ),
+    "itsnotaboutnutrition.com": ("itsnotaboutnutrition", "ItsNotAboutNutrition"),
+    "izzycooking.com": ("_aliases", "IzzyCooking"),
+    "jamieoliver.com": ("jamieoliver", "JamieOliver"),
+    "jennycancook.com": ("jennycancook", "JennyCanCook"),
+    "jimcooksfoodgood.com": ("_aliases", "JimCooksFoodGood"),
+    "jocooks.com": ("jocooks", "JoCooks"),
+    "joshuaweissman.com": ("joshuaweissman", "JoshuaWeissman"),
+    "jow.fr": ("_aliases", "Jow"),
+    "joyfoodsunshine.com": ("joyfoodsunshine", "Joyfoodsunshine"),
+    "joyfullymad.com": ("joyfullymad", "JoyfullyMad"),
+    "joythebaker.com": ("joythebaker", "JoyTheBaker"),
+    "juliasalbum.com": ("_aliases", "JuliasAlbum"),
+    "juliegoodwin.com.au": ("juliegoodwin", "JulieGoodwin"),
+    "jumbo.com": ("_aliases", "Jumbo"),
+    "justalittlebitofbacon.com": ("_aliases", "JustALittleBitOfBacon"),
+    "justapinch.com": ("justapinch", "JustAPinch"),
+    "justataste.com": ("_aliases", "JustATaste"),
+    "justbento.com": ("justbento", "JustBento"),
+    "justinesnacks.com": ("_aliases", "JustineSnacks"),
+    "justonecookbook.com": ("justonecookbook", "JustOneCookbook"),
+    "kalcirecept.hu": ("kalcirecept", "KalciRecept"),
+    "kalejunkie.com": ("kalejunkie", "KaleJunkie"),
+    "kellyscleankitchen.com": ("kellyscleankitchen", "KellysCleanKitchen"),
+    "kennethtemple.com": ("_aliases", "KennethTemple"),
+    "kennymcgovern.com": ("kennymcgovern", "KennyMcGovern"),
+    "keukenliefde.nl": ("keukenliefdenl", "KeukenLiefdeNL"),
+    "keytomylime.com": ("keytomylime", "KeyToMyLime"),
+    "kfoods.com": ("kfoods", "KFoods"),
+    "kiddokitchen.se": ("kiddokitchen", "KiddoKitchen"),
+    "kikkoman.eu": ("kikkoman", "Kikkoman"),
+    "kingarthurbaking.com": ("kingarthur", "KingArthur"),
+    "kitchenaid.com.au": ("kitchenaidaustralia", "KitchenAidAustralia"),
+    "kitchendivas.com": ("kitchendivas", "KitchenDivas"),
+    "kitchendreaming.com": ("kitchendreaming", "KitchenDreaming"),
+    "kitchensanctuary.com": ("kitchensanctuary", "KitchenSanctuary"),
+    "kitchenstories.com": ("_aliases", "KitchenStories"),
+    "kochbar.de": ("_aliases", "Kochbar"),
+    "kochbucher.com": ("kochbucher", "Kochbucher"),
+    "koket.se": ("_aliases", "Koket"),
+    "kookjij.nl": ("kookjij", "KookJij"),
+    "kristineskitchenblog.com": ("_aliases", "KristinesKitchenBlog"),
+    "krollskorner.com": ("krollskorner", "KrollsKorner"),
+    "kuchnia-domowa.pl": ("kuchniadomowa", "KuchniaDomowa"),
+    "kuchynalidla.sk": ("kuchynalidla", "KuchynaLidla"),
+    "kwestiasmaku.com": ("kwestiasmaku", "KwestiaSmaku"),
+    "lacucinaitaliana.com": ("lacucinaitaliana", "LaCucinaItaliana"),
+    "lacucinaitaliana.it": ("lacucinaitaliana", "LaCucinaItaliana"),
+    "lanascooking.com": ("_aliases", "LanasCooking"),
+    "latelierderoxane.com": ("latelierderoxane", "LAtelierDeRoxane"),
+    "laurenslatest.com": ("_aliases", "LaurensLatest"),
+    "lazycatkitchen.com": ("lazycatkitchen", "LazyCatKitchen"),
+    "lecker.de": ("lecker", "Lecker"),
+    "leckerschmecker.me": ("leckerschmecker", "LeckerSchmecker"),
+    "lecremedelacrumb.com": ("_aliases", "LeCremeDeLaCrumb"),
+    "leitesculinaria.com": ("_aliases", "LeitesCulinaria"),
+    "lekkerensimpel.com": ("lekkerensimpel", "LekkerEnSimpel"),
+    "letscampsmore.com": ("_aliases", "LetsCampSmore"),
+    "leukerecepten.nl": ("_aliases", "Leukerecepten"),
+    "lidiasitaly.com": ("lidiasitaly", "LidiasItaly"),
+    "lifestyleofafoodie.com": ("lifestyleofafoodie", "LifestyleOfAFoodie"),
+    "littleferrarokitchen.com": ("littleferrarokitchen", "LittleFerraroKitchen"),
+    "littlespicejar.com": ("_aliases", "LittleSpiceJar"),
+    "littlespoonfarm.com": ("_aliases", "LittleSpoonFarm"),
+    "littlesunnykitchen.com": ("littlesunnykitchen", "LittleSunnyKitchen"),
+    "livelytable.com": ("livelytable", "LivelyTable"),
+    "lmld.org": ("lmld", "Lmld"),
+    "lolascocina.com": ("lolascocina", "LolasCocina"),
+    "loveandlemons.com": ("loveandlemons", "LoveAndLemons"),
+    "lovefood.com": ("lovefood", "LoveFood"),
+    "lovingitvegan.com": ("_aliases", "Lovingitvegan"),
+    "maangchi.com": ("maangchi", "Maangchi"),
+    "madame.lefigaro.fr": ("madamelefigaro", "MadameLeFigaro"),
+    "madamecuisine.de": ("madamecuisine", "MadameCuisine"),
+    "madensverden.dk": ("_aliases", "MadensVerden"),
+    "madsvin.com": ("_aliases", "Madsvin"),
+    "magimix.com": ("magimix", "Magimix"),
+    "makeitdairyfree.com": ("makeitdairyfree", "MakeItDairyFree"),
+    "marmiton.org": ("_aliases", "Marmiton"),
+    "marthastewart.com": ("_aliases", "MarthaStewart"),
+    "matprat.no": ("matprat", "Matprat"),
+    "mccormick.com": ("mccormick", "McCormick"),
+    "mealprepmanual.com": ("mealprepmanual", "MealPrepManual"),
+    "meatchurch.com": ("meatchurch", "MeatChurch"),
+    "meganvskitchen.com": ("_aliases", "MeganVsKitchen"),
+    "melissaknorris.com": ("mellisaknorris", "MellisaKNorris"),
+    "meljoulwan.com": ("meljoulwan", "Meljoulwan"),
+    "melloschourico.com": ("melloschourico", "MellosChourico"),
+    "melskitchencafe.com": ("melskitchencafe", "MelsKitchenCafe"),
+    "mexicanplease.com": ("_aliases", "MexicanPlease"),
+    "migusto.migros.ch": ("migusto", "Migusto"),
+    "miljuschka.nl": ("_aliases", "Miljuschka"),
+    "mindmegette.hu": ("mindmegette", "Mindmegette"),
+    "minimalistbaker.com": ("_aliases", "Minimalistbaker"),
+    "ministryofcurry.com": ("ministryofcurry", "MinistryOfCurry"),
+    "misya.info": ("misya", "Misya"),
+    "mob.co.uk": ("mob", "Mob"),
+    "mobkitchen.co.uk": ("mobkitchen", "MobKitchen"),
+    "modernhoney.com": ("modernhoney", "ModernHoney"),
+    "mollybaz.com": ("mollybaz", "MollyBaz"),
+    "momontimeout.com": ("_aliases", "MomOnTimeout"),
+    "momswithcrockpots.com": ("momswithcrockpots", "MomsWithCrockPots"),
+    "moscatomom.com": ("moscatomom", "MoscatoMom"),
+    "motherthyme.com": ("motherthyme", "MotherThyme"),
+    "moulinex.fr": ("moulinex", "Moulinex"),
+    "mundodereceitasbimby.com.pt": ("mundodereceitasbimby", "MundoDeReceitasBimby"),
+    "mybakingaddiction.com": ("_aliases", "MyBakingAddiction"),
+    "myjewishlearning.com": ("_aliases", "MyJewishLearning"),
+    "mykidslickthebowl.com": ("mykidslickthebowl", "MyKidsLickTheBowl"),
+    "mykitchen101.com": ("mykitchen101", "MyKitchen101"),
+    "mykitchen101en.com": ("mykitchen101en", "MyKitchen101en"),
+    "mykoreankitchen.com": ("mykoreankitchen", "MyKoreanKitchen"),
+    "myplate.gov": ("usdamyplate", "USDAMyPlate"),
+    "myrecipes.com": ("_aliases", "MyRecipes"),
+    "myriadrecipes.com": ("_aliases", "MyriadRecipes"),
+    "myvegetarianroots.com": ("_aliases", "MyVegetarianRoots"),
+    "natashaskitchen.com": ("_aliases", "NatashasKitchen"),
+    "naturallyella.com": ("naturallyella", "NaturallyElla"),
+    "ndr.de": ("ndr", "Ndr"),
+    "netacooks.com": ("netacooks", "NetaCooks"),
+    "newdadskitchen.com": ("_aliases", "NewDadsKitchen"),
+    "nhs.uk": ("nhshealthierfamilies", "NHSHealthierFamilies"),
+    "nibbledish.com": ("nibbledish", "NibbleDish"),
+    "ninjatestkitchen.eu": ("ninjatestkitchen", "NinjaTestKitchen"),
+    "noracooks.com": ("_aliases", "NoraCooks"),
+    "norecipes.com": ("norecipes", "NoRecipes"),
+    "nosalty.hu": ("nosalty", "NoSalty"),
+    "notenoughcinnamon.com": ("_aliases", "NotEnoughCinnamon"),
+    "nourishedbynutrition.com": ("_aliases", "NourishedByNutrition"),
+    "nrk.no": ("nrkmat", "NRKMat"),
+    "number-2-pencil.com": ("number2pencil", "Number2Pencil"),
+    "nutritionbynathalie.com": ("nutritionbynathalie", "NutritionByNathalie"),
+    "nutritionfacts.org": ("_aliases", "NutritionFacts"),
+    "ohsheglows.com": ("_aliases", "OhSheGlows"),
+    "ohsweetbasil.com": ("ohsweetbasil", "OhSweetBasil"),
+    "okokorecepten.nl": ("okokorecepten", "OkokoRecepten"),
+    "omnivorescookbook.com": ("omnivorescookbook", "OmnivoresCookbook"),
+    "onceuponachef.com": ("onceuponachef", "OnceUponAChef"),
+    "onesweetappetite.com": ("onesweetappetite", "OneSweetAppetite"),
+    "organicallyaddison.com": ("_aliases", "OrganicallyAddison"),
+    "ourbestbites.com": ("ourbestbites", "OurBestBites"),
+    "owen-han.com": ("owenhan", "OwenHan"),
+    "paleorunningmomma.com": ("_aliases", "PaleoRunningMomma"),
+    "panelinha.com.br": ("panelinha", "Panelinha"),
+    "paninihappy.com": ("paninihappy", "PaniniHappy"),
+    "panlasangpinoy.com": ("_aliases", "PanlasangPinoy"),
+    "pastificiosorrentino.com": ("pastificiosorrentino", "PastificioSorrentino"),
+    "pauladeen.com": ("pauladeen", "PaulaDeen"),
+    "peelwithzeal.com": ("peelwithzeal", "PeelWithZeal"),
+    "persnicketyplates.com": ("persnicketyplates", "PersnicketyPlates"),
+    "pickuplimes.com": ("pickuplimes", "PickUpLimes"),
+    "picnic.app": ("picnic", "Picnic"),
+    "piesandplots.net": ("_aliases", "PiesAndPlots"),
+    "pilipinasrecipes.com": ("_aliases", "PilipinasRecipes"),
+    "pinchofyum.com": ("_aliases", "PinchOfYum"),
+    "pingodoce.pt": ("pingodoce", "PingoDoce"),
+    "pinkowlkitchen.com": ("pinkowlkitchen", "PinkOwlKitchen"),
+    "plantyou.com": ("plantyou", "PlantYou"),
+    "platingpixels.com": ("platingpixels", "PlatingPixels"),
+    "platingsandpairings.com": ("platingsandpairings", "PlatingsAndPairings"),
+    "plowingthroughlife.com": ("plowingthroughlife", "PlowingThroughLife"),
+    "polishfoodies.com": ("polishfoodies", "PolishFoodies"),
+    "poppycooks.com": ("poppycooks", "PoppyCooks"),
+    "popsugar.com": ("popsugar", "PopSugar"),
+    "potatorolls.com": ("potatorolls", "PotatoRolls"),
+    "practicalselfreliance.com": ("practicalselfreliance", "PracticalSelfReliance"),
+    "preppykitchen.com": ("preppykitchen", "PreppyKitchen"),
+    "pressureluckcooking.com": ("_aliases", "PressureLuckCooking"),
+    "primaledgehealth.com": ("primaledgehealth", "PrimalEdgeHealth"),
+    "projectgezond.nl": ("projectgezond", "ProjectGezond"),
+    "przepisy.pl": ("przepisy", "Przepisy"),
+    "purelypope.com": ("_aliases", "PurelyPope"),
+    "purplecarrot.com": ("purplecarrot", "PurpleCarrot"),
+    "quakeroats.com": ("quakeroats", "QuakerOats"),
+    "quitoque.fr": ("quitoque", "QuiToque"),
+    "rachlmansfield.com": ("rachlmansfield", "RachlMansfield"),
+    "rainbowplantlife.com": ("_aliases", "RainbowPlantLife"),
+    "realfood.tesco.com": ("realfoodtesco", "RealFoodTesco"),
+    "realfoodwell.com": ("_aliases", "RealFoodWell"),
+    "realmomnutrition.com": ("realmomnutrition", "RealMomNutrition"),
+    "realsimple.com": ("_aliases", "RealSimple"),
+    "receitas.globo.com": ("_aliases", "Globo"),
+    "receitas.ig.com.br": ("ig", "IG"),
+    "receitasnestle.com.br": ("receitasnestlebr", "ReceitasNestleBR"),
+    "recept.se": ("_aliases", "Recept"),
+    "recepti.index.hr": ("receptiindex", "ReceptiIndex"),
+    "receptyprevas.sk": ("receptyprevas", "ReceptyPreVas"),
+    "recette.plus": ("recetteplus", "RecettePlus"),
+    "recipe.yamasa.com": ("yamasa", "Yamasa"),
+    "recipeforperfection.com": ("_aliases", "RecipeForPerfection"),
+    "recipegirl.com": ("_aliases", "RecipeGirl"),
+    "recipeland.com": ("recipeland", "RecipeLand"),
+    "reciperunner.com": ("_aliases", "RecipeRunner"),
+    "recipes.farmhousedelivery.com": ("farmhousedelivery", "FarmhouseDelivery"),
+    "recipes.timesofindia.com": ("timesofindia", "TimesOfIndia"),
+    "recipetineats.com": ("_aliases", "RecipeTinEats"),
+    "redhousespice.com": ("_aliases", "RedHouseSpice"),
+    "reishunger.de": ("reishunger", "Reishunger"),
+    "relish.com": ("_aliases", "Relish"),
+    "rewe.de": ("rewe", "Rewe"),
+    "rezeptwelt.de": ("rezeptwelt", "Rezeptwelt"),
+    "ricardocuisine.com": ("ricardocuisine", "RicardoCuisine"),
+    "ricetta.it": ("ricetta", "Ricetta"),
+    "ricette.giallozafferano.it": ("giallozafferano", "GialloZafferano"),
+    "ricetteperbimby.it": ("ricetteperbimby", "RicettePerBimby"),
+    "rickbayless.com": ("rickbayless", "RickBayless"),
+    "rosannapansino.com": ("rosannapansino", "RosannaPansino"),
+    "rutgerbakt.nl": ("rutgerbakt", "RutgerBakt"),
+    "saboresajinomoto.com.br": ("saboresajinomoto", "SaboresAjinomoto"),
+    "sallys-blog.de": ("sallysblog", "SallysBlog"),
+    "sallysbakingaddiction.com": ("sallysbakingaddiction", "SallysBakingAddiction"),
+    "saltpepperskillet.com": ("saltpepperskillet", "SaltPepperSkillet"),
+    "sandwichtribunal.com": ("_aliases", "SandwhichTribunal"),
+    "saveur.com": ("_aliases", "Saveur"),
+    "savoringthegood.com": ("savoringthegood", "SavoringTheGood"),
+    "savorynothings.com": ("savorynothings", "SavoryNothings"),
+    "savorythoughts.com": ("_aliases", "SavoryThoughts"),
+    "savvysavingcouple.net": ("savvysavingcouple", "SavvySavingCouple"),
+    "schoolofwok.co.uk": ("schoolofwok", "SchoolOfWok"),
+    "scrambledandscrumptious.com": (
+        "scrambledandscrumptious",
+        "ScrambledAndScrumptious",
+    ),
+    "scrummylane.com": ("scrummylane", "ScrummyLane"),
+    "seriouseats.com": ("_aliases", "SeriousEats"),
+    "sharkninja.com": ("sharkninja", "SharkNinja"),
+    "shelikesfood.com": ("shelikesfood", "SheLikesFood"),
+    "simple-veganista.com": ("_aliases", "SimpleVeganista"),
+    "simplegreensmoothies.com": ("simplegreensmoothies", "SimpleGreenSmoothies"),
+    "simplehomeedit.com": ("simplehomeedit", "SimpleHomeEdit"),
+    "simply-cookit.com": ("simplycookit", "SimplyCookit"),
+    "simplyquinoa.com": ("_aliases", "SimplyQuinoa"),
+    "simplyrecipes.com": ("simplyrecipes", "SimplyRecipes"),
+    "simplywhisked.com": ("_aliases", "SimplyWhisked"),
+    "sipandfeast.com": ("_aliases", "SipAndFeast"),
+    "sizzlefish.com": ("sizzlefish", "SizzleFish"),
+    "sizzlingeats.com": ("sizzlingeats", "SizzlingEats"),
+    "skinnytaste.com": ("skinnytaste", "SkinnyTaste"),
+    "smalltownwoman.com": ("_aliases", "SmallTownWoman"),
+    "smulweb.nl": ("smulweb", "Smulweb"),
+    "sobors.hu": ("_aliases", "SoBors"),
+    "somuchfoodblog.com": ("_aliases", "SoMuchFoodBlog"),
+    "southernbite.com": ("_aliases", "SouthernBite"),
+    "southerncastiron.com": ("southerncastiron", "SouthernCastIron"),
+    "southernliving.com": ("southernliving", "SouthernLiving"),
+    "spainonafork.com": ("_aliases", "SpainOnAFork"),
+    "spendwithpennies.com": ("spendwithpennies", "SpendWithPennies"),
+    "spicysouthernkitchen.com": ("spicysouthernkitchen", "SpicySouthernKitchen"),
+    "spisbedre.dk": ("spisbedre", "SpisBedre"),
+    "springlane.de": ("_aliases", "Springlane"),
+    "stacyling.com": ("stacyling", "StacyLing"),
+    "staysnatched.com": ("staysnatched", "StaySnatched"),
+    "steamykitchen.com": ("steamykitchen", "SteamyKitchen"),
+    "streetkitchen.hu": ("streetkitchen", "StreetKitchen"),
+    "strongrfastr.com": ("strongrfastr", "StrongrFastr"),
+    "sudachirecipes.com": ("_aliases", "SudachiRecipes"),
+    "sugarhero.com": ("_aliases", "SugarHero"),
+    "sugarmaplefarmhouse.com": ("_aliases", "SugarMapleFarmhouse"),
+    "sugarspunrun.com": ("sugarspunrun", "SugarSpunRun"),
+    "sunbasket.com": ("sunbasket", "SunBasket"),
+    "sundaysuppermovement.com": ("sundaysuppermovement", "SundaySupperMovement"),
+    "sundpaabudget.dk": ("sundpaabudget", "SundPaaBudget"),
+    "sunset.com": ("sunset", "Sunset"),
+    "sweetcsdesigns.com": ("_aliases", "SweetCsDesigns"),
+    "sweetpeasandsaffron.com": ("_aliases", "SweetPeasAndSaffron"),
+    "swissmilk.ch": ("_aliases", "SwissMilk"),
+    "tableanddish.com": ("_aliases", "TableAndDish"),
+    "taste.com.au": ("tasteau", "TasteAU"),
+    "tasteandtellblog.com": ("_aliases", "TasteAndTellBlog"),
+    "tasteatlas.com": ("tasteatlas", "TasteAtlas"),
+    "tastefullygrace.com": ("tastefullygrace", "TastefullyGrace"),
+    "tasteline.com": ("tasteline", "Tasteline"),
+    "tasteofhome.com": ("tasteofhome", "TasteOfHome"),
+    "tastesbetterfromscratch.com": (
+        "tastesbetterfromscratch",
+        "TastesBetterFromScratch",
+    ),
+    "tastesoflizzyt.com": ("_aliases", "TastesOfLizzyT"),
+    "tastinghistory.com": ("tastinghistory", "TastingHistory"),
+    "tasty.co": ("tasty", "Tasty"),
+    "tastykitchen.com": ("tastykitchen", "TastyKitchen"),
+    "tastyoven.com": ("tastyoven", "TastyOven"),
+    "tatyanaseverydayfood.com": ("_aliases", "TatyanasEverydayFood"),
+    "teakandthyme.com": ("_aliases", "TeakAndThyme"),
+    "thealmondeater.com": ("_aliases", "TheAlmondEater"),
+    "thebigmansworld.com": ("_aliases", "TheBigMansWorld"),
+    "theclevercarrot.com": ("theclevercarrot", "TheCleverCarrot"),
+    "thecookierookie.com": ("_aliases", "TheCookieRookie"),
+    "thecookingguy.com": ("thecookingguy", "TheCookingGuy"),
+    "thecountrycook.net": ("_aliases", "TheCountryCook"),
+    "thefirstmess.com": ("_aliases", "TheFirstMess"),
+    "thefoodcharlatan.com": ("_aliases", "TheFoodCharlatan"),
+    "thefoodietakesflight.com": ("_aliases", "TheFoodieTakesFlight"),
+    "theglutenfreeaustrian.com": ("theglutenfreeaustrian", "TheGlutenFreeAustrian"),
+    "theguardian.com": ("_aliases", "TheGuardian"),
+    "thehappyfoodie.co.uk": ("thehappyfoodie", "TheHappyFoodie"),
+    "theicecreamconfectionals.com": (
+        "theicecreamconfectionals",
+        "TheIceCreamConfectionals",
+    ),
+    "thekitchencommunity.org": ("thekitchencommunity", "TheKitchenCommunity"),
+    "thekitchenmagpie.com": ("thekitchenmagpie", "TheKitchenMagPie"),
+    "thekitchn.com": ("thekitchn", "TheKitchn"),
+    "theloopywhisk.com": ("_aliases", "TheLoopyWhisk"),
+    "themagicalslowcooker.com": ("themagicalslowcooker", "TheMagicalSlowCooker"),
+    "themediterraneandish.com": ("_aliases", "TheMediterraneDish"),
+    "themodernproper.com": ("themodernproper", "TheModernProper"),
+    "theoldwomanandthesea.com": ("theoldwomanandthesea", "TheOldWomanAndTheSea"),
+    "thepalatablelife.com": ("_aliases", "ThePalatableLife"),
+    "thepioneerwoman.com": ("thepioneerwoman", "ThePioneerWoman"),
+    "theplantbasedschool.com": ("theplantbasedschool", "ThePlantBasedSchool"),
+    "theppk.com": ("postpunkkitchen", "PostPunkKitchen"),
+    "therecipecritic.com": ("therecipecritic", "TheRecipeCritic"),
+    "thermomix-albacete.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-alcala.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-algeciras.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-alicante.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-almeria.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-alzira.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-badajoz.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-barcelona-centro.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-barcelona.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-bilbao.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-burgos.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-caceres.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-cadiz.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-cartagena.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-castellon.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-ceuta.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-ciudadreal.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-cordoba.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-coruna.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-doshermanas.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-elche.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-esplugues.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-fuenlabrada.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-fuerteventura.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-gijon.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-girona.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-granada.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-huelva.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-jaen.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-jerez.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-lanzarote.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-laspalmas.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-leon.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-lleida.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-madrid-centro.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-madrid-mendezalvaro.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-majadahonda.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-malaga-centro.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-malaga.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-mallorca.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-manresa.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-marbella.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-mataro.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-mostoles.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-murcia.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-orense.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-pamplona.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-plasencia.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-pontevedra.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-sabadell.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-salamanca.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-sansebastian.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-santander.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-sevilla-aljarafe.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-sevilla.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-ssreyes.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-talavera.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-tarragona.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-tenerife.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-tenerifesur.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-toledo.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-valencia.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-valladolid.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-vic.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-vigo.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-vitoria.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-zamora.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomix-zaragoza.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thermomixasturias.es": ("blogosferathermomix", "BlogosferaThermomix"),
+    "thesaltymarshmallow.com": ("_aliases", "TheSaltyMarshmallow"),
+    "thespicetrain.com": ("thespicetrain", "TheSpiceTrain"),
+    "thespruceeats.com": ("thespruceeats", "TheSpruceEats"),
+    "thesuburbansoapbox.com": ("thesuburbansoapbox", "TheSuburbanSoapBox"),
+    "thevintagemixer.com": ("thevintagemixer", "TheVintageMixer"),
+    "thewoksoflife.com": ("_aliases", "Thewoksoflife"),
+    "thewoodenskillet.com": ("_aliases", "TheWoodenSkillet"),
+    "thinlicious.com": ("thinlicious", "Thinlicious"),
+    "thishealthytable.com": ("_aliases", "ThisHealthyTable"),
+    "tidymom.net": ("tidymom", "TidyMom"),
+    "tine.no": ("tineno", "TineNo"),
+    "tofoo.co.uk": ("tofoo", "Tofoo"),
+    "toriavey.com": ("_aliases", "ToriAvey"),
+    "tudogostoso.com.br": ("tudogostoso", "TudoGostoso"),
+    "twopeasandtheirpod.com": ("_aliases", "TwoPeasAndTheirPod"),
+    "uitpaulineskeuken.nl": ("uitpaulineskeukennl", "UitPaulinesKeukenNL"),
+    "unsophisticook.com": ("unsophisticook", "Unsophisticook"),
+    "usapears.org": ("usapears", "USAPears"),
+    "valdemarsro.dk": ("valdemarsro", "Valdemarsro"),
+    "valentinascorner.com": ("_aliases", "ValentinasCorner"),
+    "vanillaandbean.com": ("_aliases", "VanillaAndBean"),
+    "varecha.pravda.sk": ("varechapravdask", "VarechaPravdaSK"),
+    "veganricha.com": ("_aliases", "VeganRicha"),
+    "vegansociety.com": ("vegansociety", "VeganSociety"),
+    "vegetarbloggen.no": ("vegetarbloggen", "Vegetarbloggen"),
+    "vegolosi.it": ("vegolosi", "Vegolosi"),
+    "vegrecipesofindia.com": ("_aliases", "VegRecipesOfIndia"),
+    "velocidadcuchara.com": ("velocidadcuchara", "VelocidadCuchara"),
+    "veroniquecloutier.com": ("veroniquecloutier", "VeroniqueCloutier"),
+    "waitrose.com": ("waitrose", "Waitrose"),
+    "watchwhatueat.com": ("watchwhatueat", "WatchWhatUEat"),
+    "wearenotmartha.com": ("_aliases", "WeAreNotMartha"),
+    "wedishitup.com": ("wedishitup", "WeDishItUp"),
+    "weightwatchers.com": ("weightwatcherspublic", "WeightWatchersPublic"),
+    "wellplated.com": ("wellplated", "WellPlated"),
+    "whatsgabycooking.com": ("_aliases", "WhatsGabyCooking"),
+    "whole30.com": ("whole30", "Whole30"),
+    "wholefoodsmarket.co.uk": ("wholefoods", "WholeFoods"),
+    "wholefoodsmarket.com": ("wholefoods", "WholeFoods"),
+    "williams-sonoma.com": ("williamssonoma", "WilliamsSonoma"),
+    "womensweeklyfood.com.au": ("womensweeklyfood", "WomensWeeklyFood"),
+    "woop.co.nz": ("woop", "Woop"),
+    "www1.wdr.de": ("wdr", "WDR"),
+    "wyseguide.com": ("_aliases", "WyseGuide"),
+    "xiachufang.com": ("xiachufang", "Xiachufang"),
+    "yemek.com": ("_aliases", "Yemek"),
+    "yummly.com": ("yummly", "Yummly"),
+    "zaubertopf.de": ("zaubertopf", "ZauberTopf"),
+    "zeit.de": ("zeitwochenmarkt", "ZeitWochenmarkt"),
+    "zenbelly.com": ("zenbelly", "ZenBelly"),
+    "zestfulkitchen.com": ("_aliases", "ZestfulKitchen"),
+}
@@ -1,21 +1,25 @@
+from typing import Optional
+
 from ._exceptions import OpenGraphException
+from ._head_metadata import HeadMetadata
 
 
 class OpenGraph:
-    def __init__(self, soup):
+    def __init__(self, soup, metadata: Optional[HeadMetadata] = None):
         self.soup = soup
+        self.metadata = HeadMetadata(soup) if metadata is None else metadata
 
     def site_name(self):
-        meta = self.soup.find("meta", {"property": "og:site_name"})
-        meta = meta or self.soup.find("meta", {"name": "og:site_name"})
+        meta = self.metadata.meta("property", "og:site_name")
+        meta = meta or self.metadata.meta("name", "og:site_name")
         if not meta:
             raise OpenGraphException("Site name not found in OpenGraph metadata.")
 
-        return meta.get("content")
+        return meta[0].get("content")
 
     def image(self):
-        image = self.soup.find("meta", {"property": "og:image", "content": True})
-        if not image:
+        image = self.metadata.content("property", "og:image")
+        if image is None:
             raise OpenGraphException("Image not found in OpenGraph metadata.")
 
-        return image.get("content")
+        return image
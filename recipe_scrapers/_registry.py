@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from functools import cached_property
+
+from ._abstract import AbstractScraper
+
+
+def load_scraper_class(module: str, class_name: str) -> type[AbstractScraper]:
+    """Import a scraper class from its module within recipe_scrapers."""
+    return getattr(importlib.import_module(f".{module}", __package__), class_name)
+
+
+class HostSuffixTrie:
+    """
+    Matches hosts with the registered host they are equal to or a subdomain of.
+
+    Registered hosts are stored label by label from the top-level domain, e.g.
+    com -> allrecipes, so that matching a host walks its labels once, from the
+    last one, and returns the longest registered suffix: "m.allrecipes.com" and
+    "es.allrecipes.com" match "allrecipes.com", while "myallrecipes.com" does not.
+    """
+
+    _HOST = None  # key of the registered host ending at a node; labels are str
+
+    def __init__(self, hosts: Iterable[str]):
+        self._root: dict = {}
+        for host in hosts:
+            self.add(host)
+
+    def add(self, host: str) -> None:
+        """Register a host."""
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.setdefault(label, {})
+        node[self._HOST] = host
+
+    def match(self, host: str) -> str | None:
+        """The registered host matching a host, or None."""
+        node = self._root
+        matched = None
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            matched = node.get(self._HOST, matched)
+        return matched
+
+
+class ScraperRegistry(MutableMapping[str, type[AbstractScraper]]):
+    """
+    Mapping of hosts to the scraper classes supporting them.
+
+    Hosts are listed by a static manifest of host -> (module, class name), so
+    that listing and looking up hosts does not import any scraper module. The
+    module of a scraper is imported the first time its class is requested.
+
+    Scraper classes can be added or replaced as in a dict, e.g.
+    SCRAPERS["example.com"] = ExampleScraper, and are then supported for the
+    subdomains of their host too.
+    """
+
+    def __init__(self, manifest: Mapping[str, tuple[str, str]]):
+        # host -> (module, class name), or the scraper class once registered
+        self._manifest: dict[str, tuple[str, str] | type[AbstractScraper]] = dict(
+            manifest
+        )
+        self._classes: dict[tuple[str, str], type[AbstractScraper]] = {}
+
+    def __getitem__(self, host: str) -> type[AbstractScraper]:
+        location = self._manifest[host]
+        if not isinstance(location, tuple):
+            return location
+        if location not in self._classes:
+            self._classes[location] = load_scraper_class(*location)
+        return self._classes[location]
+
+    def __setitem__(self, host: str, scraper: type[AbstractScraper]) -> None:
+        self._manifest[host] = scraper
+        if "_suffixes" in self.__dict__:
+            self._suffixes.add(host)
+
+    def __delitem__(self, host: str) -> None:
+        del self._manifest[host]
+        self.__dict__.pop("_suffixes", None)
+
+    def __contains__(self, host: object) -> bool:
+        return host in self._manifest
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._manifest)
+
+    def __len__(self) -> int:
+        return len(self._manifest)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} hosts)"
+
+    @cached_property
+    def _suffixes(self) -> HostSuffixTrie:
+        return HostSuffixTrie(self._manifest)
+
+    def match(self, host: str) -> str | None:
+        """
+        The registered host supporting a host: the host itself, or the registered
+        host it is a subdomain of (e.g. "m.allrecipes.com" -> "allrecipes.com").
+        None when no scraper supports the host.
+        """
+        if host in self._manifest:
+            return host
+        return self._suffixes.match(host)
+
+    def class_locations(self) -> dict[str, str]:
+        """Module of each scraper class of the manifest, by class name."""
+        return {
+            location[1]: location[0]
+            for location in self._manifest.values()
+            if isinstance(location, tuple)
+        }
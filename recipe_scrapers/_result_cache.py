@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .__version__ import __version__
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+_source_fingerprints: dict[type, str] = {}
+
+
+def source_fingerprint(cls: type) -> str:
+    """Hash of the source files of a scraper class and of the classes it extends."""
+    if cls not in _source_fingerprints:
+        digest = hashlib.sha256()
+        for klass in cls.__mro__:
+            try:
+                source_file = inspect.getsourcefile(klass)
+            except TypeError:  # built-in classes, e.g. object
+                continue
+            if source_file is not None and os.path.exists(source_file):
+                digest.update(pathlib.Path(source_file).read_bytes())
+        _source_fingerprints[cls] = digest.hexdigest()
+    return _source_fingerprints[cls]
+
+
+class ResultCache:
+    """
+    Cache of to_json() results, shared by the scrapers given the cache.
+
+    Results are stored by key: a hash of the HTML of the page, the scraper class
+    and the source of its module, the library version and the settings changing
+    the results (see AbstractScraper._result_cache_key()). Pages scraped again
+    with identical content return the stored result without being parsed, and
+    results are invalidated when the library or the scraper changes.
+
+    Subclasses implement get() and set() to choose where results are stored.
+    """
+
+    def get(self, key: str) -> dict | None:
+        raise NotImplementedError("This should be implemented.")
+
+    def set(self, key: str, value: dict) -> None:
+        raise NotImplementedError("This should be implemented.")
+
+    def clear(self) -> None:
+        raise NotImplementedError("This should be implemented.")
+
+
+class MemoryResultCache(ResultCache):
+    """Keeps the `max_entries` most recently used results in memory."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._results: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            if key not in self._results:
+                return None
+            self._results.move_to_end(key)
+            return copy.deepcopy(self._results[key])
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._results[key] = copy.deepcopy(value)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+
+class SQLiteResultCache(ResultCache):
+    """
+    Stores results as JSON in an SQLite database file, so that they are kept
+    across runs. Results stored by other versions of the library are deleted
+    when the database is opened, and results holding values JSON cannot
+    represent (e.g. sets returned by a custom scraper) are not stored.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = pathlib.Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, version TEXT NOT NULL, value TEXT NOT NULL)"
+        )
+        self._db.execute("DELETE FROM results WHERE version != ?", (__version__,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: dict) -> None:
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug("Result not cached, it cannot be stored as JSON: %s", e)
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, __version__, serialized),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM results")
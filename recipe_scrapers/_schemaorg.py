@@ -2,10 +2,11 @@
 # find a package that parses https://schema.org/Recipe properly (or create one ourselves).
 from __future__ import annotations
 
+import json
+import logging
+import re
 from itertools import chain
 
-import extruct
-
 from recipe_scrapers.settings import settings
 
 from ._exceptions import SchemaOrgException
@@ -15,100 +16,225 @@ from ._utils import (
     get_minutes,
     get_yields,
     normalize_string,
+    normalize_strings,
 )
 
 SCHEMA_ORG_HOST = "schema.org"
 
 SYNTAXES = ["json-ld", "microdata"]
 
+JSON_LD_SCRIPT_PATTERN = re.compile(
+    r"<script\b[^>]*?\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# String literals are matched first so that their contents are left untouched.
+JSON_REPAIR_PATTERN = re.compile(
+    r'"(?:\\.|[^"\\])*"'  # string literals
+    r"|,(?=\s*[\]}])"  # trailing commas
+    r"|/\*.*?\*/"  # block comments
+    r"|//[^\n]*"  # line comments
+    r"|<!--|-->",  # HTML comment markers
+    re.DOTALL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _json_ld_scripts(page_data):
+    if isinstance(page_data, str):
+        if "application/ld+json" not in page_data:
+            return []
+        return JSON_LD_SCRIPT_PATTERN.findall(page_data)
+    # page_data is an lxml tree that has already been parsed
+    return [
+        script.text_content()
+        for script in page_data.iter("script")
+        if script.get("type", "").strip().lower() == "application/ld+json"
+    ]
+
+
+def _repair_json(match):
+    token = match.group()
+    return token if token.startswith('"') else ""
+
+
+def load_json_ld(script: str):
+    """
+    Decode the contents of a JSON-LD script block, tolerating common breakage
+    found on recipe websites: raw newlines inside strings, trailing commas,
+    comments and trailing semicolons.
+    """
+    try:
+        return json.loads(script, strict=False)
+    except ValueError:
+        pass
+    repaired = JSON_REPAIR_PATTERN.sub(_repair_json, script).strip().rstrip(";")
+    return json.loads(repaired, strict=False)
+
 
 class SchemaOrg:
     @staticmethod
-    def _contains_schematype(item, schematype):
+    def _schematypes(item):
         itemtype = item.get("@type", "")
         itemtypes = itemtype if isinstance(itemtype, list) else [itemtype]
-        return schematype.lower() in "\n".join(itemtypes).lower()
-
-    def _find_entity(self, item, schematype):
-        if self._contains_schematype(item, schematype):
-            return item
-        for graph in item.get("@graph", []):
-            for node in graph if isinstance(graph, list) else [graph]:
-                if not isinstance(node, dict):
-                    continue
-                if self._contains_schematype(node, schematype):
-                    return node
+        # "Recipe", "schema:Recipe" and "https://schema.org/Recipe" are all recipes
+        return {
+            t.rsplit("/", 1)[-1].rsplit(":", 1)[-1].lower()
+            for t in itemtypes
+            if isinstance(t, str)
+        }
+
+    @classmethod
+    def _contains_schematype(cls, item, schematype):
+        return schematype.lower() in cls._schematypes(item)
+
+    @staticmethod
+    def _graph_nodes(item):
+        graph = item.get("@graph", [])
+        if isinstance(graph, dict):
+            graph = list(graph.values())
+        elif not isinstance(graph, list):
+            graph = [graph]
+        for entry in graph:
+            for node in entry if isinstance(entry, list) else [entry]:
+                if isinstance(node, dict):
+                    yield node
+
+    def _index_entities(self, item, nodes=None):
+        """
+        Index an item and the nodes of its @graph by (lowercase) schema type,
+        and add them to nodes by @id, if given.
+        """
+        entities = {}
+        for node in chain([item], self._graph_nodes(item)):
+            for schematype in self._schematypes(node):
+                entities.setdefault(schematype, []).append(node)
+            node_id = node.get("@id")
+            # keep the first node describing an entity, over bare references
+            if (
+                nodes is not None
+                and isinstance(node_id, str)
+                and (node_id not in nodes or nodes[node_id].keys() == {"@id"})
+            ):
+                nodes[node_id] = node
+        return entities
+
+    def _resolve(self, node):
+        """
+        The node an {"@id": ...} reference points to, else the node itself,
+        e.g. when it describes the entity inline.
+        """
+        if isinstance(node, dict) and node.keys() <= {"@id", "@type"}:
+            node_id = node.get("@id")
+            if isinstance(node_id, str):
+                return self.nodes.get(node_id, node)
+        return node
+
+    def _find_recipe(self, item, entities):
+        if SCHEMA_ORG_HOST not in item.get("@context", ""):
+            return None
+
+        # If the item itself is a recipe, then use it directly as our datasource
+        if "recipe" in entities:
+            recipe = entities["recipe"][0]
+        # If the item is a webpage and describes a recipe entity, use the entity as our datasource
+        elif self._contains_schematype(item, "WebPage") and (
+            recipe := item.get("mainEntity", {})
+        ):
+            pass
+        else:
+            return None
+        if not isinstance(recipe, dict) or not self._contains_schematype(
+            recipe, "Recipe"
+        ):
+            return None
+        return recipe
+
+    @staticmethod
+    def _extract_json_ld(page_data):
+        items = []
+        for script in _json_ld_scripts(page_data):
+            try:
+                data = load_json_ld(script)
+            except ValueError as e:
+                logger.debug("Failed to decode JSON-LD script: %s", e)
+                continue
+            for item in data if isinstance(data, list) else [data]:
+                if item and isinstance(item, dict):
+                    items.append(item)
+        return items
+
+    def _extract_microdata(self, page_data):
+        # imported on first use: extruct and its dependencies are slow to import,
+        # and most pages are handled by the JSON-LD fast path
+        import extruct
+
+        return extruct.extract(
+            page_data,
+            syntaxes=["microdata"],
+            errors="log" if settings.LOG_LEVEL <= 10 else "ignore",
+            uniform=True,
+        ).get("microdata", [])
 
     def __init__(self, page_data):
+        # page_data is either the HTML of the page, or an lxml tree of it that
+        # has already been parsed (see recipe_scrapers._html_tree)
         self.format = None
         self.data = {}
         self.people = {}
-        self.ratingsdata = {}
+        # nodes of the page by @id, resolving {"@id": ...} references
+        self.nodes = {}
         self.website_name = None
+        # (data, index of its entities), see _data_entities()
+        self._data_index = None
+
+        # Each item is traversed once, and everything below is looked up from
+        # its index of entities by schema type, or from the nodes by @id.
+        indexed = [
+            ("json-ld", item, self._index_entities(item, self.nodes))
+            for item in self._extract_json_ld(page_data)
+        ]
+        recipes = [
+            (syntax, recipe)
+            for syntax, item, entities in indexed
+            if (recipe := self._find_recipe(item, entities))
+        ]
 
-        data = extruct.extract(
-            page_data,
-            syntaxes=SYNTAXES,
-            errors="log" if settings.LOG_LEVEL <= 10 else "ignore",
-            uniform=True,
-        )
-
-        # Extract website data
-        for syntax in SYNTAXES:
-            syntax_data = data.get(syntax, [])
-            for item in syntax_data:
-                website = self._find_entity(item, "WebSite")
-                if website:
-                    self.website_name = website.get("name")
-
-        # Extract person references
-        for syntax in SYNTAXES:
-            syntax_data = data.get(syntax, [])
-            for item in syntax_data:
-                if person := self._find_entity(item, "Person"):
-                    key = person.get("@id") or person.get("url")
-                    if key:
-                        self.people[key] = person
-
-        # Extract ratings data
-        for syntax in SYNTAXES:
-            syntax_data = data.get(syntax, [])
-            for item in syntax_data:
-                rating = self._find_entity(item, "AggregateRating")
-                if rating:
-                    rating_id = rating.get("@id")
-                    if rating_id:
-                        self.ratingsdata[rating_id] = rating
-
-        for syntax in SYNTAXES:
-            for item in data.get(syntax, []):
-                if SCHEMA_ORG_HOST not in item.get("@context", ""):
-                    continue
-
-                # If the item itself is a recipe, then use it directly as our datasource
-                if recipe := self._find_entity(item, "Recipe"):
-                    pass
-                # If the item is a webpage and describes a recipe entity, use the entity as our datasource
-                elif self._contains_schematype(item, "WebPage") and (
-                    recipe := item.get("mainEntity", {})
-                ):
-                    pass
-                else:
-                    continue
-                if not self._contains_schematype(recipe, "Recipe"):
-                    continue
-
-                self.data = self.data or recipe
-                for prop in ("@id", "name"):
-                    existing_value = self.data.get(prop)
-                    encountered_value = recipe.get(prop)
-                    if existing_value and encountered_value == existing_value:
-                        if syntax != self.format:
-                            pass  # TODO: single recipe represented using multiple formats; what should we do?
-                        self.format = syntax
-                        self.data.update(
-                            {k: self.data.get(k, v) for k, v in recipe.items()}
-                        )
+        # JSON-LD is decoded directly from the script blocks of the page; the
+        # (much slower) microdata extraction only runs when that yields no recipe
+        if not recipes:
+            microdata = [
+                ("microdata", item, self._index_entities(item, self.nodes))
+                for item in self._extract_microdata(page_data)
+            ]
+            indexed += microdata
+            recipes = [
+                (syntax, recipe)
+                for syntax, item, entities in microdata
+                if (recipe := self._find_recipe(item, entities))
+            ]
+
+        for _, _, entities in indexed:
+            if website := entities.get("website"):
+                self.website_name = website[0].get("name")
+
+            for person in entities.get("person", []):
+                key = person.get("@id") or person.get("url")
+                if key:
+                    self.people[key] = person
+
+        for syntax, recipe in recipes:
+            self.data = self.data or recipe
+            for prop in ("@id", "name"):
+                existing_value = self.data.get(prop)
+                encountered_value = recipe.get(prop)
+                if existing_value and encountered_value == existing_value:
+                    if syntax != self.format:
+                        pass  # TODO: single recipe represented using multiple formats; what should we do?
+                    self.format = syntax
+                    self.data.update(
+                        {k: self.data.get(k, v) for k, v in recipe.items()}
+                    )
 
     def site_name(self):
         if not self.website_name:
@@ -140,9 +266,12 @@ class SchemaOrg:
         ):
             author = author[0]
         if author and isinstance(author, dict):
-            author_key = author.get("@id") or author.get("url")
-            if author_key and author_key in self.people:
-                author = self.people[author_key]
+            resolved = self._resolve(author)
+            if resolved is author:
+                author_key = author.get("@id") or author.get("url")
+                if isinstance(author_key, str) and author_key in self.people:
+                    resolved = self.people[author_key]
+            author = resolved
         if author and isinstance(author, dict):
             author = author.get("name")
         if author:
@@ -202,6 +331,7 @@ class SchemaOrg:
             # Could contain a dict
             image = image[0]
 
+        image = self._resolve(image)
         if isinstance(image, dict):
             image = image.get("url")
 
@@ -253,7 +383,7 @@ class SchemaOrg:
         return result
 
     def nutrients(self):
-        nutrients = self.data.get("nutrition", {})
+        nutrients = self._resolve(self.data.get("nutrition", {}))
         cleaned_nutrients = {}
 
         for key, val in nutrients.items():
@@ -331,14 +461,20 @@ class SchemaOrg:
 
         return instructions
 
+    def _data_entities(self):
+        """Index of the entities of self.data, kept until self.data is replaced."""
+        if self._data_index is None or self._data_index[0] is not self.data:
+            self._data_index = (self.data, self._index_entities(self.data))
+        return self._data_index[1]
+
+    def _aggregate_rating(self):
+        ratings = self.data.get("aggregateRating")
+        if not ratings:
+            ratings = self._data_entities().get("aggregaterating", [None])[0]
+        return self._resolve(ratings)
+
     def ratings(self):
-        ratings = self.data.get("aggregateRating") or self._find_entity(
-            self.data, "AggregateRating"
-        )
-        if ratings and isinstance(ratings, dict):
-            rating_id = ratings.get("@id")
-            if rating_id and rating_id in self.ratingsdata:
-                ratings = self.ratingsdata[rating_id]
+        ratings = self._aggregate_rating()
         if ratings and isinstance(ratings, dict):
             ratings = ratings.get("ratingValue")
         if ratings:
@@ -346,13 +482,8 @@ class SchemaOrg:
         raise SchemaOrgException("No ratingValue in SchemaOrg.")
 
     def ratings_count(self):
-        ratings = self.data.get("aggregateRating") or self._find_entity(
-            self.data, "AggregateRating"
-        )
+        ratings = self._aggregate_rating()
         if isinstance(ratings, dict):
-            rating_id = ratings.get("@id")
-            if rating_id:
-                ratings = self.ratingsdata.get(rating_id, ratings)
             ratings = ratings.get("ratingCount") or ratings.get("reviewCount")
         if ratings:
             return int(float(ratings)) if float(ratings) != 0 else None
@@ -388,7 +519,7 @@ class SchemaOrg:
             raise SchemaOrgException("No keywords data in SchemaOrg")
         if keywords:
             if isinstance(keywords, list):
-                keywords = [normalize_string(k) for k in keywords]
+                keywords = normalize_strings(keywords)
                 keywords = ", ".join(keywords)
             else:
                 keywords = normalize_string(keywords)
@@ -0,0 +1,1020 @@
+"""
+Registry of the scraper classes, by the host of the websites they support.
+
+This module imports every scraper: it is not imported by recipe_scrapers at
+runtime, which loads scrapers lazily from the generated _manifest.py instead.
+After adding or changing an entry here, regenerate the manifest with:
+
+    python scripts/generate_manifest.py
+"""
+
+from __future__ import annotations
+
+from ._abstract import AbstractScraper
+from ._aliases import SCRAPER_ALIASES, alias_scraper
+from .abeautifulmess import ABeautifulMess
+from .aberlehome import AberleHome
+from .abril import Abril
+from .abuelascounter import AbuelasCounter
+from .acouplecooks import ACoupleCooks
+from .acozykitchen import ACozyKitchen
+from .addapinch import AddAPinch
+from .adozensundays import ADozenSundays
+from .adrianasbestrecipes import AdrianasBestRecipes
+from .afarmgirlsdabbles import AFarmGirlsDabbles
+from .afghankitchenrecipes import AfghanKitchenRecipes
+from .aflavorjournal import AFlavorJournal
+from .africanbites import AfricanBites
+from .ahealthysliceoflife import AHealthySliceOfLife
+from .albertcz import AlbertCz
+from .albertheijn import AlbertHeijn
+from .aldi import Aldi
+from .aldinord import AldiNord
+from .aldisued import AldiSued
+from .aldisuisse import AldiSuisse
+from .alisoneroman import AlisoneRoman
+from .alittlebityummy import ALittleBitYummy
+from .allnutritious import AllNutritious
+from .allsavoryrecipes import AllSavoryRecipes
+from .allthehealthythings import AllTheHealthyThings
+from .alltommat import AlltOmMat
+from .altonbrown import AltonBrown
+from .amazingoriental import AmazingOriental
+from .amazingribs import AmazingRibs
+from .ambitiouskitchen import AmbitiousKitchen
+from .ameessavorydish import AmeesSavoryDish
+from .americastestkitchen import AmericasTestKitchen
+from .andycooks import AndyCooks
+from .archanaskitchen import ArchanasKitchen
+from .argiro import Argiro
+from .arla import Arla
+from .asweetpeachef import ASweetPeaChef
+from .atelierdeschefs import AtelierDesChefs
+from .aubreyskitchen import AubreysKitchen
+from .averiecooks import AverieCooks
+from .bakeeatrepeat import BakeEatRepeat
+from .bakeitwithlove import BakeItWithLove
+from .bakels import Bakels
+from .bakewithzoha import BakeWithZoha
+from .bakingsense import BakingSense
+from .barefootcontessa import BareFootContessa
+from .barefootinthepines import BarefootInThePines
+from .bbcfood import BBCFood
+from .bbcgoodfood import BBCGoodFood
+from .bestrecipes import BestRecipes
+from .bettybossi import BettyBossi
+from .bettycrocker import BettyCrocker
+from .beyondfrosting import BeyondFrosting
+from .bigoven import BigOven
+from .billyparisi import BillyParisi
+from .bitsofcarey import BitsOfCarey
+from .blogghetti import Blogghetti
+from .blogosferathermomix import BlogosferaThermomix
+from .bluejeanchef import BlueJeanChef
+from .bodybuilding import Bodybuilding
+from .bofrost import Bofrost
+from .bonappetit import BonAppetit
+from .bongeats import BongEats
+from .bowlofdelicious import BowlOfDelicious
+from .brewersfriend import BrewersFriend
+from .briceletbaklava import BricelEtBaklava
+from .brokenovenbaking import BrokenOvenBaking
+from .budgetbytes import BudgetBytes
+from .cakemehometonight import CakeMeHomeTonight
+from .cambreabakes import CambreaBakes
+from .carlsbadcravings import CarlsBadCravings
+from .carriesexperimentalkitchen import CarriesExperimentalKitchen
+from .castironskilletcooking import CastIronSkilletCooking
+from .cdkitchen import CdKitchen
+from .chefjackovens import ChefJackOvens
+from .chefjeanpierre import ChefJeanPierre
+from .chefkoch import Chefkoch
+from .chefnini import Chefnini
+from .chewoutloud import ChewOutLoud
+from .chocolatewithgrace import ChocolateWithGrace
+from .choosehomemade import ChooseHomemade
+from .cleaneatingkitchen import CleanEatingKitchen
+from .comidinhasdochef import ComidinhasDoChef
+from .cookfastrecipes import CookFastRecipes
+from .cookiesandcups import CookiesAndCups
+from .cookingcircle import CookingCircle
+from .cookinglight import CookingLight
+from .cookomix import Cookomix
+from .cookpad import CookPad
+from .cooktalk import CookTalk
+from .cookwell import CookWell
+from .corriecooks import CorrieCooks
+from .costco import Costco
+from .countryliving import CountryLiving
+from .creativecanning import CreativeCanning
+from .cuisineaz import CuisineAZ
+from .cuisinezpourbebe import CuisinezPourBebe
+from .culinaryhill import CulinaryHill
+from .culy import Culy
+from .cybercook import Cybercook
+from .dagelijksekost import DagelijkseKost
+from .daringgourmet import DaringGourmet
+from .dashfordinner import DashForDinner
+from .davidlebovitz import DavidLebovitz
+from .deliciouslysprinkled import DeliciouslySprinkled
+from .delish import Delish
+from .delishkitchen import DelishKitchen
+from .directoalpaladar import DirectoAlPaladar
+from .dishnz import Dishnz
+from .dobruchutaktualitysk import DobruChutAktualitySK
+from .domesticateme import DomesticateMe
+from .donalskehan import DonalSkehan
+from .donnahay import DonnaHay
+from .downshiftology import Downshiftology
+from .dr import Dr
+from .drinkoteket import Drinkoteket
+from .drizzleanddip import DrizzleAndDip
+from .eatingonadime import EatingOnADime
+from .eatliverun import EatLiveRun
+from .eatsmarter import Eatsmarter
+from .eatthismuch import EatThisMuch
+from .eatwell101 import EatWell101
+from .edeka import EDEKA
+from .editionslarousse import EditionsLarousse
+from .eggsca import EggsCa
+from .elavegan import ElaVegan
+from .emmikochteinfach import EmmiKochtEinfach
+from .empirecipes import Empirecipes
+from .epicurious import Epicurious
+from .erinliveswhole import ErinLivesWhole
+from .erinscozykitchen import ErinsCozyKitchen
+from .essenundtrinken import EssenUndTrinken
+from .ethanchlebowski import EthanChlebowski
+from .familyfoodonthetable import FamilyfoodOnTheTable
+from .fantabulosity import Fantabulosity
+from .farmhousedelivery import FarmhouseDelivery
+from .farmhouseonboone import FarmhouseOnBoone
+from .farmtojar import FarmToJar
+from .fattoincasadabenedetta import FattoInCasaDaBenedetta
+from .feelgoodfoodie import FeelGoodFoodie
+from .felixkitchen import FelixKitchen
+from .festligare import Festligare
+from .fifteengram import FifteenGram
+from .finedininglovers import FineDiningLovers
+from .fithealthymacros import FitHealthyMacros
+from .fitmencook import FitMenCook
+from .flavorsbylinbie import FlavorsByLinbie
+from .food import Food
+from .foodandwine import FoodAndWine
+from .foodfidelity import FoodFidelity
+from .foodnetwork import FoodNetwork
+from .foodrepublic import FoodRepublic
+from .forksoverknives import ForksOverKnives
+from .forktospoon import ForkToSpoon
+from .fortyaprons import FortyAprons
+from .franzoesischkochen import FranzoesischKochen
+from .freshiprima import FreshiPrima
+from .g750g import G750g
+from .garlicandzest import GarlicAndZest
+from .gesundaktiv import GesundAktiv
+from .giallozafferano import GialloZafferano
+from .gimmesomeoven import GimmeSomeOven
+from .gloriousrecipes import GloriousRecipes
+from .glutenfreeonashoestring import GlutenFreeOnAShoeString
+from .goldnplump import GoldnPlump
+from .goodfooddiscoveries import GoodFoodDiscoveries
+from .goodhousekeeping import GoodHousekeeping
+from .goodstuffrecipes import GoodStuffRecipes
+from .gourmettraveller import GourmetTraveller
+from .grandbabycakes import GrandbabyCakes
+from .grandfrais import GrandFrais
+from .greatbritishchefs import GreatBritishChefs
+from .grimgrains import GrimGrains
+from .grouprecipes import GroupRecipes
+from .halfbakedharvest import HalfBakedHarvest
+from .handletheheat import HandleTheHeat
+from .hassanchef import HassanChef
+from .headbangerskitchen import HeadbangersKitchen
+from .heb import HEB
+from .hellofresh import HelloFresh
+from .hersheyland import HersheyLand
+from .hilahcooking import HilahCooking
+from .hofer import Hofer
+from .hogarmania import Hogarmania
+from .homeandplate import HomeAndPlate
+from .homechef import HomeChef
+from .howtocook import HowToCook
+from .howtofeedaloon import HowToFeedALoon
+from .hungryhappens import HungryHappens
+from .iamafoodblog import IAmAFoodBlog
+from .ig import IG
+from .inbloombakery import InBloomBakery
+from .ingoodflavor import InGoodFlavor
+from .innit import Innit
+from .insanelygoodrecipes import InsanelyGoodRecipes
+from .inspiredtaste import InspiredTaste
+from .iowagirleats import IowaGirlEats
+from .irishcentral import IrishCentral
+from .itdoesnttastelikechicken import ItDoesntTasteLikeChicken
+from .itsnotaboutnutrition import ItsNotAboutNutrition
+from .jamieoliver import JamieOliver
+from .jennycancook import JennyCanCook
+from .jocooks import JoCooks
+from .joshuaweissman import JoshuaWeissman
+from .journaldesfemmes import JournalDesFemmes
+from .joyfoodsunshine import Joyfoodsunshine
+from .joyfullymad import JoyfullyMad
+from .joythebaker import JoyTheBaker
+from .juliegoodwin import JulieGoodwin
+from .justapinch import JustAPinch
+from .justbento import JustBento
+from .justonecookbook import JustOneCookbook
+from .kalcirecept import KalciRecept
+from .kalejunkie import KaleJunkie
+from .kellyscleankitchen import KellysCleanKitchen
+from .kennymcgovern import KennyMcGovern
+from .keukenliefdenl import KeukenLiefdeNL
+from .keytomylime import KeyToMyLime
+from .kfoods import KFoods
+from .kiddokitchen import KiddoKitchen
+from .kikkoman import Kikkoman
+from .kingarthur import KingArthur
+from .kitchenaidaustralia import KitchenAidAustralia
+from .kitchendivas import KitchenDivas
+from .kitchendreaming import KitchenDreaming
+from .kitchensanctuary import KitchenSanctuary
+from .kochbucher import Kochbucher
+from .kookjij import KookJij
+from .krollskorner import KrollsKorner
+from .kuchniadomowa import KuchniaDomowa
+from .kuchynalidla import KuchynaLidla
+from .kwestiasmaku import KwestiaSmaku
+from .lacucinaitaliana import LaCucinaItaliana
+from .latelierderoxane import LAtelierDeRoxane
+from .lazycatkitchen import LazyCatKitchen
+from .lecker import Lecker
+from .leckerschmecker import LeckerSchmecker
+from .lekkerensimpel import LekkerEnSimpel
+from .lidiasitaly import LidiasItaly
+from .lifestyleofafoodie import LifestyleOfAFoodie
+from .littleferrarokitchen import LittleFerraroKitchen
+from .littlesunnykitchen import LittleSunnyKitchen
+from .livelytable import LivelyTable
+from .lmld import Lmld
+from .lolascocina import LolasCocina
+from .loveandlemons import LoveAndLemons
+from .lovefood import LoveFood
+from .maangchi import Maangchi
+from .madamecuisine import MadameCuisine
+from .madamelefigaro import MadameLeFigaro
+from .magimix import Magimix
+from .makeitdairyfree import MakeItDairyFree
+from .matprat import Matprat
+from .mccormick import McCormick
+from .mealprepmanual import MealPrepManual
+from .meatchurch import MeatChurch
+from .meljoulwan import Meljoulwan
+from .mellisaknorris import MellisaKNorris
+from .melloschourico import MellosChourico
+from .melskitchencafe import MelsKitchenCafe
+from .migusto import Migusto
+from .mindmegette import Mindmegette
+from .ministryofcurry import MinistryOfCurry
+from .misya import Misya
+from .mob import Mob
+from .mobkitchen import MobKitchen
+from .modernhoney import ModernHoney
+from .mollybaz import MollyBaz
+from .momswithcrockpots import MomsWithCrockPots
+from .moscatomom import MoscatoMom
+from .motherthyme import MotherThyme
+from .moulinex import Moulinex
+from .mundodereceitasbimby import MundoDeReceitasBimby
+from .mykidslickthebowl import MyKidsLickTheBowl
+from .mykitchen101 import MyKitchen101
+from .mykitchen101en import MyKitchen101en
+from .mykoreankitchen import MyKoreanKitchen
+from .naturallyella import NaturallyElla
+from .ndr import Ndr
+from .netacooks import NetaCooks
+from .nhshealthierfamilies import NHSHealthierFamilies
+from .nibbledish import NibbleDish
+from .nihhealthyeating import NIHHealthyEating
+from .ninjatestkitchen import NinjaTestKitchen
+from .norecipes import NoRecipes
+from .nosalty import NoSalty
+from .nrkmat import NRKMat
+from .number2pencil import Number2Pencil
+from .nutritionbynathalie import NutritionByNathalie
+from .nytimes import NYTimes
+from .ohsweetbasil import OhSweetBasil
+from .okokorecepten import OkokoRecepten
+from .omnivorescookbook import OmnivoresCookbook
+from .onceuponachef import OnceUponAChef
+from .onehundredonecookbooks import OneHundredOneCookBooks
+from .onesevensevenmilkstreet import OneSevenSevenMilkStreet
+from .onesweetappetite import OneSweetAppetite
+from .ottolenghibooks import OttolenghiBooks
+from .ourbestbites import OurBestBites
+from .owenhan import OwenHan
+from .panelinha import Panelinha
+from .paninihappy import PaniniHappy
+from .pastificiosorrentino import PastificioSorrentino
+from .pauladeen import PaulaDeen
+from .peelwithzeal import PeelWithZeal
+from .persnicketyplates import PersnicketyPlates
+from .pickuplimes import PickUpLimes
+from .picnic import Picnic
+from .pingodoce import PingoDoce
+from .pinkowlkitchen import PinkOwlKitchen
+from .plantyou import PlantYou
+from .platingpixels import PlatingPixels
+from .platingsandpairings import PlatingsAndPairings
+from .plowingthroughlife import PlowingThroughLife
+from .polishfoodies import PolishFoodies
+from .poppycooks import PoppyCooks
+from .popsugar import PopSugar
+from .postpunkkitchen import PostPunkKitchen
+from .potatorolls import PotatoRolls
+from .practicalselfreliance import PracticalSelfReliance
+from .preppykitchen import PreppyKitchen
+from .primaledgehealth import PrimalEdgeHealth
+from .projectgezond import ProjectGezond
+from .przepisy import Przepisy
+from .purplecarrot import PurpleCarrot
+from .quakeroats import QuakerOats
+from .quitoque import QuiToque
+from .rachlmansfield import RachlMansfield
+from .realfoodtesco import RealFoodTesco
+from .realmomnutrition import RealMomNutrition
+from .receitasnestlebr import ReceitasNestleBR
+from .receptiindex import ReceptiIndex
+from .receptyprevas import ReceptyPreVas
+from .recetteplus import RecettePlus
+from .recipeland import RecipeLand
+from .reishunger import Reishunger
+from .rewe import Rewe
+from .rezeptwelt import Rezeptwelt
+from .ricardocuisine import RicardoCuisine
+from .ricetta import Ricetta
+from .ricetteperbimby import RicettePerBimby
+from .rickbayless import RickBayless
+from .rosannapansino import RosannaPansino
+from .rutgerbakt import RutgerBakt
+from .saboresajinomoto import SaboresAjinomoto
+from .sallysbakingaddiction import SallysBakingAddiction
+from .sallysblog import SallysBlog
+from .saltpepperskillet import SaltPepperSkillet
+from .samsungfood import SamsungFood
+from .savoringthegood import SavoringTheGood
+from .savorynothings import SavoryNothings
+from .savvysavingcouple import SavvySavingCouple
+from .schoolofwok import SchoolOfWok
+from .scrambledandscrumptious import ScrambledAndScrumptious
+from .scrummylane import ScrummyLane
+from .sharkninja import SharkNinja
+from .shelikesfood import SheLikesFood
+from .simplegreensmoothies import SimpleGreenSmoothies
+from .simplehomeedit import SimpleHomeEdit
+from .simplycookit import SimplyCookit
+from .simplyrecipes import SimplyRecipes
+from .sizzlefish import SizzleFish
+from .sizzlingeats import SizzlingEats
+from .skinnytaste import SkinnyTaste
+from .smulweb import Smulweb
+from .southerncastiron import SouthernCastIron
+from .southernliving import SouthernLiving
+from .spendwithpennies import SpendWithPennies
+from .spicysouthernkitchen import SpicySouthernKitchen
+from .spisbedre import SpisBedre
+from .stacyling import StacyLing
+from .staysnatched import StaySnatched
+from .steamykitchen import SteamyKitchen
+from .streetkitchen import StreetKitchen
+from .strongrfastr import StrongrFastr
+from .sugarspunrun import SugarSpunRun
+from .sunbasket import SunBasket
+from .sundaysuppermovement import SundaySupperMovement
+from .sundpaabudget import SundPaaBudget
+from .sunset import Sunset
+from .tasteatlas import TasteAtlas
+from .tasteau import TasteAU
+from .tastefullygrace import TastefullyGrace
+from .tasteline import Tasteline
+from .tasteofhome import TasteOfHome
+from .tastesbetterfromscratch import TastesBetterFromScratch
+from .tastinghistory import TastingHistory
+from .tasty import Tasty
+from .tastykitchen import TastyKitchen
+from .tastyoven import TastyOven
+from .theclevercarrot import TheCleverCarrot
+from .thecookingguy import TheCookingGuy
+from .theglutenfreeaustrian import TheGlutenFreeAustrian
+from .thehappyfoodie import TheHappyFoodie
+from .theicecreamconfectionals import TheIceCreamConfectionals
+from .thekitchencommunity import TheKitchenCommunity
+from .thekitchenmagpie import TheKitchenMagPie
+from .thekitchn import TheKitchn
+from .themagicalslowcooker import TheMagicalSlowCooker
+from .themodernproper import TheModernProper
+from .theoldwomanandthesea import TheOldWomanAndTheSea
+from .thepioneerwoman import ThePioneerWoman
+from .theplantbasedschool import ThePlantBasedSchool
+from .therecipecritic import TheRecipeCritic
+from .thespicetrain import TheSpiceTrain
+from .thespruceeats import TheSpruceEats
+from .thesuburbansoapbox import TheSuburbanSoapBox
+from .thevintagemixer import TheVintageMixer
+from .thinlicious import Thinlicious
+from .thirtyseconds import ThirtySeconds
+from .tidymom import TidyMom
+from .timesofindia import TimesOfIndia
+from .tineno import TineNo
+from .tofoo import Tofoo
+from .tudogostoso import TudoGostoso
+from .twentyfourkitchen import TwentyFourKitchen
+from .uitpaulineskeukennl import UitPaulinesKeukenNL
+from .unsophisticook import Unsophisticook
+from .usapears import USAPears
+from .usdamyplate import USDAMyPlate
+from .valdemarsro import Valdemarsro
+from .varechapravdask import VarechaPravdaSK
+from .vegansociety import VeganSociety
+from .vegetarbloggen import Vegetarbloggen
+from .vegolosi import Vegolosi
+from .velocidadcuchara import VelocidadCuchara
+from .veroniquecloutier import VeroniqueCloutier
+from .waitrose import Waitrose
+from .watchwhatueat import WatchWhatUEat
+from .wdr import WDR
+from .wedishitup import WeDishItUp
+from .weightwatchers import WeightWatchers
+from .weightwatcherspublic import WeightWatchersPublic
+from .wellplated import WellPlated
+from .whole30 import Whole30
+from .wholefoods import WholeFoods
+from .wikicookbook import WikiCookbook
+from .williamssonoma import WilliamsSonoma
+from .womensweeklyfood import WomensWeeklyFood
+from .woop import Woop
+from .xiachufang import Xiachufang
+from .yamasa import Yamasa
+from .yummly import Yummly
+from .zaubertopf import ZauberTopf
+from .zeitwochenmarkt import ZeitWochenmarkt
+from .zenbelly import ZenBelly
+
+SCRAPERS: dict[str, type[AbstractScraper]] = {
+    ABeautifulMess.host(): ABeautifulMess,
+    AberleHome.host(): AberleHome,
+    Abril.host(): Abril,
+    AbuelasCounter.host(): AbuelasCounter,
+    ACoupleCooks.host(): ACoupleCooks,
+    ACozyKitchen.host(): ACozyKitchen,
+    AddAPinch.host(): AddAPinch,
+    ADozenSundays.host(): ADozenSundays,
+    AdrianasBestRecipes.host(): AdrianasBestRecipes,
+    AFarmGirlsDabbles.host(): AFarmGirlsDabbles,
+    AfghanKitchenRecipes.host(): AfghanKitchenRecipes,
+    AFlavorJournal.host(): AFlavorJournal,
+    AfricanBites.host(): AfricanBites,
+    AHealthySliceOfLife.host(): AHealthySliceOfLife,
+    AlbertCz.host(): AlbertCz,
+    AlbertHeijn.host(): AlbertHeijn,
+    AlbertHeijn.host(domain="ah.be"): AlbertHeijn,
+    Aldi.host(): Aldi,
+    AldiNord.host(): AldiNord,
+    AldiNord.host(domain="aldi.es"): AldiNord,
+    AldiNord.host(domain="aldi.fr"): AldiNord,
+    AldiNord.host(domain="aldi.lu"): AldiNord,
+    AldiNord.host(domain="aldi.nl"): AldiNord,
+    AldiNord.host(domain="aldi.pl"): AldiNord,
+    AldiNord.host(domain="aldi.pt"): AldiNord,
+    AldiSued.host(): AldiSued,
+    AldiSued.host(domain="aldi.hu"): AldiSued,
+    AldiSued.host(domain="aldi.it"): AldiSued,
+    AldiSuisse.host(): AldiSuisse,
+    AlisoneRoman.host(): AlisoneRoman,
+    ALittleBitYummy.host(): ALittleBitYummy,
+    AllNutritious.host(): AllNutritious,
+    AllSavoryRecipes.host(): AllSavoryRecipes,
+    AllTheHealthyThings.host(): AllTheHealthyThings,
+    AlltOmMat.host(): AlltOmMat,
+    AltonBrown.host(): AltonBrown,
+    AmazingOriental.host(): AmazingOriental,
+    AmazingRibs.host(): AmazingRibs,
+    AmbitiousKitchen.host(): AmbitiousKitchen,
+    AmeesSavoryDish.host(): AmeesSavoryDish,
+    AmericasTestKitchen.host(): AmericasTestKitchen,
+    AndyCooks.host(): AndyCooks,
+    ArchanasKitchen.host(): ArchanasKitchen,
+    Argiro.host(): Argiro,
+    Arla.host(): Arla,
+    ASweetPeaChef.host(): ASweetPeaChef,
+    AtelierDesChefs.host(): AtelierDesChefs,
+    AubreysKitchen.host(): AubreysKitchen,
+    AverieCooks.host(): AverieCooks,
+    BakeEatRepeat.host(): BakeEatRepeat,
+    BakeItWithLove.host(): BakeItWithLove,
+    Bakels.host(): Bakels,
+    Bakels.host(domain="co.uk"): Bakels,
+    BakeWithZoha.host(): BakeWithZoha,
+    BakingSense.host(): BakingSense,
+    BareFootContessa.host(): BareFootContessa,
+    BarefootInThePines.host(): BarefootInThePines,
+    BBCFood.host(): BBCFood,
+    BBCFood.host(domain="co.uk"): BBCFood,
+    BBCGoodFood.host(): BBCGoodFood,
+    BestRecipes.host(): BestRecipes,
+    BettyBossi.host(): BettyBossi,
+    BettyCrocker.host(): BettyCrocker,
+    BeyondFrosting.host(): BeyondFrosting,
+    BigOven.host(): BigOven,
+    BillyParisi.host(): BillyParisi,
+    BitsOfCarey.host(): BitsOfCarey,
+    Blogghetti.host(): Blogghetti,
+    BlogosferaThermomix.host(): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-albacete.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-alcala.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-algeciras.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-alicante.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-almeria.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-alzira.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-badajoz.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(
+        domain="thermomix-barcelona-centro.es"
+    ): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-barcelona.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-bilbao.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-burgos.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-caceres.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-cadiz.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-cartagena.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-castellon.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-ceuta.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-ciudadreal.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-cordoba.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-coruna.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-doshermanas.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-elche.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-esplugues.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-fuenlabrada.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-fuerteventura.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-gijon.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-girona.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-granada.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-huelva.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-jaen.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-jerez.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-lanzarote.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-laspalmas.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-leon.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-lleida.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-madrid-centro.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(
+        domain="thermomix-madrid-mendezalvaro.es"
+    ): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-majadahonda.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-malaga-centro.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-malaga.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-mallorca.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-manresa.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-marbella.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-mataro.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-mostoles.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-murcia.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-orense.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-pamplona.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-plasencia.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-pontevedra.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-sabadell.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-salamanca.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-sansebastian.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-santander.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(
+        domain="thermomix-sevilla-aljarafe.es"
+    ): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-sevilla.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-ssreyes.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-talavera.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-tarragona.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-tenerife.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-tenerifesur.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-toledo.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-valencia.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-valladolid.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-vic.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-vigo.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-vitoria.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-zamora.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomix-zaragoza.es"): BlogosferaThermomix,
+    BlogosferaThermomix.host(domain="thermomixasturias.es"): BlogosferaThermomix,
+    BlueJeanChef.host(): BlueJeanChef,
+    Bodybuilding.host(): Bodybuilding,
+    Bofrost.host(): Bofrost,
+    BonAppetit.host(): BonAppetit,
+    BongEats.host(): BongEats,
+    BowlOfDelicious.host(): BowlOfDelicious,
+    BrewersFriend.host(): BrewersFriend,
+    BricelEtBaklava.host(): BricelEtBaklava,
+    BrokenOvenBaking.host(): BrokenOvenBaking,
+    BudgetBytes.host(): BudgetBytes,
+    CakeMeHomeTonight.host(): CakeMeHomeTonight,
+    CambreaBakes.host(): CambreaBakes,
+    CarlsBadCravings.host(): CarlsBadCravings,
+    CarriesExperimentalKitchen.host(): CarriesExperimentalKitchen,
+    CastIronSkilletCooking.host(): CastIronSkilletCooking,
+    CdKitchen.host(): CdKitchen,
+    ChefJackOvens.host(): ChefJackOvens,
+    ChefJeanPierre.host(): ChefJeanPierre,
+    Chefkoch.host(): Chefkoch,
+    Chefnini.host(): Chefnini,
+    ChewOutLoud.host(): ChewOutLoud,
+    ChocolateWithGrace.host(): ChocolateWithGrace,
+    ChooseHomemade.host(): ChooseHomemade,
+    CleanEatingKitchen.host(): CleanEatingKitchen,
+    ComidinhasDoChef.host(): ComidinhasDoChef,
+    CookFastRecipes.host(): CookFastRecipes,
+    CookiesAndCups.host(): CookiesAndCups,
+    CookingCircle.host(): CookingCircle,
+    CookingLight.host(): CookingLight,
+    Cookomix.host(): Cookomix,
+    CookPad.host(): CookPad,
+    CookTalk.host(): CookTalk,
+    CookWell.host(): CookWell,
+    CorrieCooks.host(): CorrieCooks,
+    Costco.host(): Costco,
+    CountryLiving.host(): CountryLiving,
+    CreativeCanning.host(): CreativeCanning,
+    CuisineAZ.host(): CuisineAZ,
+    CuisinezPourBebe.host(): CuisinezPourBebe,
+    CulinaryHill.host(): CulinaryHill,
+    Culy.host(): Culy,
+    Cybercook.host(): Cybercook,
+    DagelijkseKost.host(): DagelijkseKost,
+    DaringGourmet.host(): DaringGourmet,
+    DashForDinner.host(): DashForDinner,
+    DavidLebovitz.host(): DavidLebovitz,
+    DeliciouslySprinkled.host(): DeliciouslySprinkled,
+    Delish.host(): Delish,
+    DelishKitchen.host(): DelishKitchen,
+    DirectoAlPaladar.host(): DirectoAlPaladar,
+    Dishnz.host(): Dishnz,
+    DobruChutAktualitySK.host(): DobruChutAktualitySK,
+    DomesticateMe.host(): DomesticateMe,
+    DonalSkehan.host(): DonalSkehan,
+    DonnaHay.host(): DonnaHay,
+    Downshiftology.host(): Downshiftology,
+    Dr.host(): Dr,
+    Drinkoteket.host(): Drinkoteket,
+    DrizzleAndDip.host(): DrizzleAndDip,
+    EatingOnADime.host(): EatingOnADime,
+    EatLiveRun.host(): EatLiveRun,
+    Eatsmarter.host(): Eatsmarter,
+    Eatsmarter.host(domain="de"): Eatsmarter,
+    EatThisMuch.host(): EatThisMuch,
+    EatWell101.host(): EatWell101,
+    EDEKA.host(): EDEKA,
+    EditionsLarousse.host(): EditionsLarousse,
+    EggsCa.host(): EggsCa,
+    ElaVegan.host(): ElaVegan,
+    EmmiKochtEinfach.host(): EmmiKochtEinfach,
+    Empirecipes.host(): Empirecipes,
+    Epicurious.host(): Epicurious,
+    ErinLivesWhole.host(): ErinLivesWhole,
+    ErinsCozyKitchen.host(): ErinsCozyKitchen,
+    EssenUndTrinken.host(): EssenUndTrinken,
+    EthanChlebowski.host(): EthanChlebowski,
+    FamilyfoodOnTheTable.host(): FamilyfoodOnTheTable,
+    Fantabulosity.host(): Fantabulosity,
+    FarmhouseDelivery.host(): FarmhouseDelivery,
+    FarmhouseOnBoone.host(): FarmhouseOnBoone,
+    FarmToJar.host(): FarmToJar,
+    FattoInCasaDaBenedetta.host(): FattoInCasaDaBenedetta,
+    FeelGoodFoodie.host(): FeelGoodFoodie,
+    FelixKitchen.host(): FelixKitchen,
+    Festligare.host(): Festligare,
+    FifteenGram.host(): FifteenGram,
+    FineDiningLovers.host(): FineDiningLovers,
+    FitHealthyMacros.host(): FitHealthyMacros,
+    FitMenCook.host(): FitMenCook,
+    FlavorsByLinbie.host(): FlavorsByLinbie,
+    Food.host(): Food,
+    FoodAndWine.host(): FoodAndWine,
+    FoodFidelity.host(): FoodFidelity,
+    FoodNetwork.host(): FoodNetwork,
+    FoodNetwork.host(domain="com"): FoodNetwork,
+    FoodRepublic.host(): FoodRepublic,
+    ForksOverKnives.host(): ForksOverKnives,
+    ForkToSpoon.host(): ForkToSpoon,
+    FortyAprons.host(): FortyAprons,
+    FranzoesischKochen.host(): FranzoesischKochen,
+    FreshiPrima.host(): FreshiPrima,
+    G750g.host(): G750g,
+    GarlicAndZest.host(): GarlicAndZest,
+    GesundAktiv.host(): GesundAktiv,
+    GialloZafferano.host(): GialloZafferano,
+    GimmeSomeOven.host(): GimmeSomeOven,
+    GloriousRecipes.host(): GloriousRecipes,
+    GlutenFreeOnAShoeString.host(): GlutenFreeOnAShoeString,
+    GoldnPlump.host(): GoldnPlump,
+    GoodFoodDiscoveries.host(): GoodFoodDiscoveries,
+    GoodHousekeeping.host(): GoodHousekeeping,
+    GoodStuffRecipes.host(): GoodStuffRecipes,
+    GourmetTraveller.host(): GourmetTraveller,
+    GrandbabyCakes.host(): GrandbabyCakes,
+    GrandFrais.host(): GrandFrais,
+    GreatBritishChefs.host(): GreatBritishChefs,
+    GrimGrains.host(): GrimGrains,
+    GroupRecipes.host(): GroupRecipes,
+    HalfBakedHarvest.host(): HalfBakedHarvest,
+    HandleTheHeat.host(): HandleTheHeat,
+    HassanChef.host(): HassanChef,
+    HeadbangersKitchen.host(): HeadbangersKitchen,
+    HEB.host(): HEB,
+    HelloFresh.host(): HelloFresh,
+    HelloFresh.host(domain="at"): HelloFresh,
+    HelloFresh.host(domain="be"): HelloFresh,
+    HelloFresh.host(domain="ca"): HelloFresh,
+    HelloFresh.host(domain="ch"): HelloFresh,
+    HelloFresh.host(domain="co.nz"): HelloFresh,
+    HelloFresh.host(domain="co.uk"): HelloFresh,
+    HelloFresh.host(domain="com.au"): HelloFresh,
+    HelloFresh.host(domain="de"): HelloFresh,
+    HelloFresh.host(domain="dk"): HelloFresh,
+    HelloFresh.host(domain="es"): HelloFresh,
+    HelloFresh.host(domain="fr"): HelloFresh,
+    HelloFresh.host(domain="ie"): HelloFresh,
+    HelloFresh.host(domain="it"): HelloFresh,
+    HelloFresh.host(domain="lu"): HelloFresh,
+    HelloFresh.host(domain="nl"): HelloFresh,
+    HelloFresh.host(domain="no"): HelloFresh,
+    HelloFresh.host(domain="se"): HelloFresh,
+    HersheyLand.host(): HersheyLand,
+    HilahCooking.host(): HilahCooking,
+    Hofer.host(): Hofer,
+    Hofer.host(domain="hofer.si"): Hofer,
+    Hogarmania.host(): Hogarmania,
+    HomeAndPlate.host(): HomeAndPlate,
+    HomeChef.host(): HomeChef,
+    HowToCook.host(): HowToCook,
+    HowToFeedALoon.host(): HowToFeedALoon,
+    HungryHappens.host(): HungryHappens,
+    IAmAFoodBlog.host(): IAmAFoodBlog,
+    IG.host(): IG,
+    InBloomBakery.host(): InBloomBakery,
+    InGoodFlavor.host(): InGoodFlavor,
+    Innit.host(): Innit,
+    InsanelyGoodRecipes.host(): InsanelyGoodRecipes,
+    InspiredTaste.host(): InspiredTaste,
+    IowaGirlEats.host(): IowaGirlEats,
+    IrishCentral.host(): IrishCentral,
+    ItDoesntTasteLikeChicken.host(): ItDoesntTasteLikeChicken,
+    ItsNotAboutNutrition.host(): ItsNotAboutNutrition,
+    JamieOliver.host(): JamieOliver,
+    JennyCanCook.host(): JennyCanCook,
+    JoCooks.host(): JoCooks,
+    JoshuaWeissman.host(): JoshuaWeissman,
+    JournalDesFemmes.host(): JournalDesFemmes,
+    Joyfoodsunshine.host(): Joyfoodsunshine,
+    JoyfullyMad.host(): JoyfullyMad,
+    JoyTheBaker.host(): JoyTheBaker,
+    JulieGoodwin.host(): JulieGoodwin,
+    JustAPinch.host(): JustAPinch,
+    JustBento.host(): JustBento,
+    JustOneCookbook.host(): JustOneCookbook,
+    KalciRecept.host(): KalciRecept,
+    KaleJunkie.host(): KaleJunkie,
+    KellysCleanKitchen.host(): KellysCleanKitchen,
+    KennyMcGovern.host(): KennyMcGovern,
+    KeukenLiefdeNL.host(): KeukenLiefdeNL,
+    KeyToMyLime.host(): KeyToMyLime,
+    KFoods.host(): KFoods,
+    KiddoKitchen.host(): KiddoKitchen,
+    Kikkoman.host(): Kikkoman,
+    KingArthur.host(): KingArthur,
+    KitchenAidAustralia.host(): KitchenAidAustralia,
+    KitchenDivas.host(): KitchenDivas,
+    KitchenDreaming.host(): KitchenDreaming,
+    KitchenSanctuary.host(): KitchenSanctuary,
+    Kochbucher.host(): Kochbucher,
+    KookJij.host(): KookJij,
+    KrollsKorner.host(): KrollsKorner,
+    KuchniaDomowa.host(): KuchniaDomowa,
+    KuchynaLidla.host(): KuchynaLidla,
+    KwestiaSmaku.host(): KwestiaSmaku,
+    LaCucinaItaliana.host(): LaCucinaItaliana,
+    LaCucinaItaliana.host(domain="com"): LaCucinaItaliana,
+    LAtelierDeRoxane.host(): LAtelierDeRoxane,
+    LazyCatKitchen.host(): LazyCatKitchen,
+    Lecker.host(): Lecker,
+    LeckerSchmecker.host(): LeckerSchmecker,
+    LekkerEnSimpel.host(): LekkerEnSimpel,
+    LidiasItaly.host(): LidiasItaly,
+    LifestyleOfAFoodie.host(): LifestyleOfAFoodie,
+    LittleFerraroKitchen.host(): LittleFerraroKitchen,
+    LittleSunnyKitchen.host(): LittleSunnyKitchen,
+    LivelyTable.host(): LivelyTable,
+    Lmld.host(): Lmld,
+    LolasCocina.host(): LolasCocina,
+    LoveAndLemons.host(): LoveAndLemons,
+    LoveFood.host(): LoveFood,
+    Maangchi.host(): Maangchi,
+    MadameCuisine.host(): MadameCuisine,
+    MadameLeFigaro.host(): MadameLeFigaro,
+    Magimix.host(): Magimix,
+    MakeItDairyFree.host(): MakeItDairyFree,
+    Matprat.host(): Matprat,
+    McCormick.host(): McCormick,
+    MealPrepManual.host(): MealPrepManual,
+    MeatChurch.host(): MeatChurch,
+    Meljoulwan.host(): Meljoulwan,
+    MellisaKNorris.host(): MellisaKNorris,
+    MellosChourico.host(): MellosChourico,
+    MelsKitchenCafe.host(): MelsKitchenCafe,
+    Migusto.host(): Migusto,
+    Mindmegette.host(): Mindmegette,
+    MinistryOfCurry.host(): MinistryOfCurry,
+    Misya.host(): Misya,
+    Mob.host(): Mob,
+    MobKitchen.host(): MobKitchen,
+    ModernHoney.host(): ModernHoney,
+    MollyBaz.host(): MollyBaz,
+    MomsWithCrockPots.host(): MomsWithCrockPots,
+    MoscatoMom.host(): MoscatoMom,
+    MotherThyme.host(): MotherThyme,
+    Moulinex.host(): Moulinex,
+    MundoDeReceitasBimby.host(): MundoDeReceitasBimby,
+    MyKidsLickTheBowl.host(): MyKidsLickTheBowl,
+    MyKitchen101.host(): MyKitchen101,
+    MyKitchen101en.host(): MyKitchen101en,
+    MyKoreanKitchen.host(): MyKoreanKitchen,
+    NaturallyElla.host(): NaturallyElla,
+    Ndr.host(): Ndr,
+    NetaCooks.host(): NetaCooks,
+    NHSHealthierFamilies.host(): NHSHealthierFamilies,
+    NibbleDish.host(): NibbleDish,
+    NIHHealthyEating.host(): NIHHealthyEating,
+    NinjaTestKitchen.host(): NinjaTestKitchen,
+    NoRecipes.host(): NoRecipes,
+    NoSalty.host(): NoSalty,
+    NRKMat.host(): NRKMat,
+    Number2Pencil.host(): Number2Pencil,
+    NutritionByNathalie.host(): NutritionByNathalie,
+    NYTimes.host(): NYTimes,
+    OhSweetBasil.host(): OhSweetBasil,
+    OkokoRecepten.host(): OkokoRecepten,
+    OmnivoresCookbook.host(): OmnivoresCookbook,
+    OnceUponAChef.host(): OnceUponAChef,
+    OneHundredOneCookBooks.host(): OneHundredOneCookBooks,
+    OneSevenSevenMilkStreet.host(): OneSevenSevenMilkStreet,
+    OneSweetAppetite.host(): OneSweetAppetite,
+    OttolenghiBooks.host(): OttolenghiBooks,
+    OurBestBites.host(): OurBestBites,
+    OwenHan.host(): OwenHan,
+    Panelinha.host(): Panelinha,
+    PaniniHappy.host(): PaniniHappy,
+    PastificioSorrentino.host(): PastificioSorrentino,
+    PaulaDeen.host(): PaulaDeen,
+    PeelWithZeal.host(): PeelWithZeal,
+    PersnicketyPlates.host(): PersnicketyPlates,
+    PickUpLimes.host(): PickUpLimes,
+    Picnic.host(): Picnic,
+    PingoDoce.host(): PingoDoce,
+    PinkOwlKitchen.host(): PinkOwlKitchen,
+    PlantYou.host(): PlantYou,
+    PlatingPixels.host(): PlatingPixels,
+    PlatingsAndPairings.host(): PlatingsAndPairings,
+    PlowingThroughLife.host(): PlowingThroughLife,
+    PolishFoodies.host(): PolishFoodies,
+    PoppyCooks.host(): PoppyCooks,
+    PopSugar.host(): PopSugar,
+    PostPunkKitchen.host(): PostPunkKitchen,
+    PotatoRolls.host(): PotatoRolls,
+    PracticalSelfReliance.host(): PracticalSelfReliance,
+    PreppyKitchen.host(): PreppyKitchen,
+    PrimalEdgeHealth.host(): PrimalEdgeHealth,
+    ProjectGezond.host(): ProjectGezond,
+    Przepisy.host(): Przepisy,
+    PurpleCarrot.host(): PurpleCarrot,
+    QuakerOats.host(): QuakerOats,
+    QuiToque.host(): QuiToque,
+    RachlMansfield.host(): RachlMansfield,
+    RealFoodTesco.host(): RealFoodTesco,
+    RealMomNutrition.host(): RealMomNutrition,
+    ReceitasNestleBR.host(): ReceitasNestleBR,
+    ReceptiIndex.host(): ReceptiIndex,
+    ReceptyPreVas.host(): ReceptyPreVas,
+    RecettePlus.host(): RecettePlus,
+    RecipeLand.host(): RecipeLand,
+    Reishunger.host(): Reishunger,
+    Rewe.host(): Rewe,
+    Rezeptwelt.host(): Rezeptwelt,
+    RicardoCuisine.host(): RicardoCuisine,
+    Ricetta.host(): Ricetta,
+    RicettePerBimby.host(): RicettePerBimby,
+    RickBayless.host(): RickBayless,
+    RosannaPansino.host(): RosannaPansino,
+    RutgerBakt.host(): RutgerBakt,
+    SaboresAjinomoto.host(): SaboresAjinomoto,
+    SallysBakingAddiction.host(): SallysBakingAddiction,
+    SallysBlog.host(): SallysBlog,
+    SaltPepperSkillet.host(): SaltPepperSkillet,
+    SamsungFood.host(): SamsungFood,
+    SavoringTheGood.host(): SavoringTheGood,
+    SavoryNothings.host(): SavoryNothings,
+    SavvySavingCouple.host(): SavvySavingCouple,
+    SchoolOfWok.host(): SchoolOfWok,
+    ScrambledAndScrumptious.host(): ScrambledAndScrumptious,
+    ScrummyLane.host(): ScrummyLane,
+    SharkNinja.host(): SharkNinja,
+    SheLikesFood.host(): SheLikesFood,
+    SimpleGreenSmoothies.host(): SimpleGreenSmoothies,
+    SimpleHomeEdit.host(): SimpleHomeEdit,
+    SimplyCookit.host(): SimplyCookit,
+    SimplyRecipes.host(): SimplyRecipes,
+    SizzleFish.host(): SizzleFish,
+    SizzlingEats.host(): SizzlingEats,
+    SkinnyTaste.host(): SkinnyTaste,
+    Smulweb.host(): Smulweb,
+    SouthernCastIron.host(): SouthernCastIron,
+    SouthernLiving.host(): SouthernLiving,
+    SpendWithPennies.host(): SpendWithPennies,
+    SpicySouthernKitchen.host(): SpicySouthernKitchen,
+    SpisBedre.host(): SpisBedre,
+    StacyLing.host(): StacyLing,
+    StaySnatched.host(): StaySnatched,
+    SteamyKitchen.host(): SteamyKitchen,
+    StreetKitchen.host(): StreetKitchen,
+    StrongrFastr.host(): StrongrFastr,
+    SugarSpunRun.host(): SugarSpunRun,
+    SunBasket.host(): SunBasket,
+    SundaySupperMovement.host(): SundaySupperMovement,
+    SundPaaBudget.host(): SundPaaBudget,
+    Sunset.host(): Sunset,
+    TasteAtlas.host(): TasteAtlas,
+    TasteAU.host(): TasteAU,
+    TastefullyGrace.host(): TastefullyGrace,
+    Tasteline.host(): Tasteline,
+    TasteOfHome.host(): TasteOfHome,
+    TastesBetterFromScratch.host(): TastesBetterFromScratch,
+    TastingHistory.host(): TastingHistory,
+    Tasty.host(): Tasty,
+    TastyKitchen.host(): TastyKitchen,
+    TastyOven.host(): TastyOven,
+    TheCleverCarrot.host(): TheCleverCarrot,
+    TheCookingGuy.host(): TheCookingGuy,
+    TheGlutenFreeAustrian.host(): TheGlutenFreeAustrian,
+    TheHappyFoodie.host(): TheHappyFoodie,
+    TheIceCreamConfectionals.host(): TheIceCreamConfectionals,
+    TheKitchenCommunity.host(): TheKitchenCommunity,
+    TheKitchenMagPie.host(): TheKitchenMagPie,
+    TheKitchn.host(): TheKitchn,
+    TheMagicalSlowCooker.host(): TheMagicalSlowCooker,
+    TheModernProper.host(): TheModernProper,
+    TheOldWomanAndTheSea.host(): TheOldWomanAndTheSea,
+    ThePioneerWoman.host(): ThePioneerWoman,
+    ThePlantBasedSchool.host(): ThePlantBasedSchool,
+    TheRecipeCritic.host(): TheRecipeCritic,
+    TheSpiceTrain.host(): TheSpiceTrain,
+    TheSpruceEats.host(): TheSpruceEats,
+    TheSuburbanSoapBox.host(): TheSuburbanSoapBox,
+    TheVintageMixer.host(): TheVintageMixer,
+    Thinlicious.host(): Thinlicious,
+    ThirtySeconds.host(): ThirtySeconds,
+    TidyMom.host(): TidyMom,
+    TimesOfIndia.host(): TimesOfIndia,
+    TineNo.host(): TineNo,
+    Tofoo.host(): Tofoo,
+    TudoGostoso.host(): TudoGostoso,
+    TwentyFourKitchen.host(): TwentyFourKitchen,
+    UitPaulinesKeukenNL.host(): UitPaulinesKeukenNL,
+    Unsophisticook.host(): Unsophisticook,
+    USAPears.host(): USAPears,
+    USDAMyPlate.host(): USDAMyPlate,
+    Valdemarsro.host(): Valdemarsro,
+    VarechaPravdaSK.host(): VarechaPravdaSK,
+    VeganSociety.host(): VeganSociety,
+    Vegetarbloggen.host(): Vegetarbloggen,
+    Vegolosi.host(): Vegolosi,
+    VelocidadCuchara.host(): VelocidadCuchara,
+    VeroniqueCloutier.host(): VeroniqueCloutier,
+    Waitrose.host(): Waitrose,
+    WatchWhatUEat.host(): WatchWhatUEat,
+    WDR.host(): WDR,
+    WeDishItUp.host(): WeDishItUp,
+    WeightWatchers.host(): WeightWatchers,
+    WeightWatchersPublic.host(): WeightWatchersPublic,
+    WellPlated.host(): WellPlated,
+    Whole30.host(): Whole30,
+    WholeFoods.host(): WholeFoods,
+    WholeFoods.host(domain="co.uk"): WholeFoods,
+    WikiCookbook.host(): WikiCookbook,
+    WilliamsSonoma.host(): WilliamsSonoma,
+    WomensWeeklyFood.host(): WomensWeeklyFood,
+    Woop.host(): Woop,
+    Xiachufang.host(): Xiachufang,
+    Yamasa.host(): Yamasa,
+    Yummly.host(): Yummly,
+    ZauberTopf.host(): ZauberTopf,
+    ZeitWochenmarkt.host(): ZeitWochenmarkt,
+    ZenBelly.host(): ZenBelly,
+}
+SCRAPERS.update(
+    {host: alias_scraper(class_name) for class_name, host in SCRAPER_ALIASES.items()}
+)
@@ -1,7 +1,9 @@
+import functools
 import html
 import inspect
 import math
 import re
+from collections.abc import Iterable, Iterator
 
 import isodate
 
@@ -25,13 +27,25 @@ FRACTIONS = {
     "⅞": 0.875,
 }
 
-TIME_REGEX = re.compile(
-    r"(?:\D*(?P<days>\d+)\s*(?:days|D))?"
-    r"(?:\D*(?P<hours>[\d.\s/?¼½¾⅓⅔⅕⅖⅗]+)\s*(?:hours|hrs|hr|h|óra|:))?"
-    r"(?:\D*(?P<minutes>\d+)\s*(?:minutes|mins|min|m|perc|$))?"
-    r"(?:\D*(?P<seconds>\d+)\s*(?:seconds|secs|sec|s))?",
-    re.IGNORECASE,
+# Units following the numbers of a duration (see parse_time_units())
+TIME_UNIT_REGEXES = {
+    "days": re.compile(r"days|D", re.IGNORECASE),
+    "hours": re.compile(r"hours|hrs|hr|h|óra|:", re.IGNORECASE),
+    "minutes": re.compile(r"minutes|mins|min|m|perc|$", re.IGNORECASE),
+    "seconds": re.compile(r"seconds|secs|sec|s", re.IGNORECASE),
+}
+# an amount of hours is made of digits, whitespace and these (e.g. '1 1/2', '1½')
+HOURS_AMOUNT_SYMBOLS = frozenset("./?¼½¾⅓⅔⅕⅖⅗")
+HOURS_AMOUNT_REGEX = re.compile(r"[\d\s./?¼½¾⅓⅔⅕⅖⅗]*")
+DIGITS_REGEX = re.compile(r"\d+")
+WHITESPACE_REGEX = re.compile(r"\s*")
+
+ISO8601_DURATION_REGEX = re.compile(
+    r"P(?:(?P<days>\d{1,6})D)?"
+    r"T(?:(?P<hours>\d{1,6})H)?(?:(?P<minutes>\d{1,6})M)?(?:(?P<seconds>\d{1,6})S)?"
 )
+GET_MINUTES_CACHE_SIZE = 1024
+
 SERVE_REGEX_NUMBER = re.compile(r"(\D*(?P<items>\d+(\.\d*)?)?\D*)")
 
 SERVE_REGEX_ITEMS = re.compile(
@@ -41,6 +55,27 @@ SERVE_REGEX_ITEMS = re.compile(
 
 SERVE_REGEX_TO = re.compile(r"\d+(\s+to\s+|-)\d+", flags=re.I | re.X)
 
+URL_REGEX = re.compile(
+    r"^"
+    r"((?P<schema>.+?)://)?"
+    r"((?P<user>.+?)(:(?P<password>.*?))?@)?"
+    r"(?P<host>[^:/]+)"
+    r"(:(?P<port>\d+?))?"
+    r"(?P<path>/.*?)?"
+    r"(?P<query>[?].*?)?"
+    r"$"
+)
+HTML_TAG_REGEX = re.compile(r"<[^>]*>")
+ZERO_WIDTH_SPACE_TABLE = str.maketrans({"\u200b": None})
+NORMALIZE_STRING_CACHE_SIZE = 4096
+NORMALIZE_STRING_CACHE_MAX_LENGTH = 256
+
+# only reads the host: scheme, userinfo and "www." are skipped, and the host ends
+# at the port, path, query or fragment (matches any string, possibly empty)
+HOST_REGEX = re.compile(
+    r"(?:[^:/?#]*://|//)?(?:[^@/?#]*@)?(?:www\.)?(?P<host>[^:/?#]*)", flags=re.I
+)
+
 RECIPE_YIELD_TYPES = (
     ("appetizer", "appetizers"),
     ("bar", "bars"),
@@ -101,17 +136,73 @@ RECIPE_YIELD_ABBREVIATIONS = (
     ("g", "gram", "grams"),
 )
 
-# Pre-compile regex patterns for yield type matching with word boundaries
-_YIELD_TYPE_PATTERNS = [
-    (
-        re.compile(rf"\b{re.escape(singular)}\b", re.IGNORECASE),
-        re.compile(rf"\b{re.escape(plural)}\b", re.IGNORECASE),
-        singular,
-        plural,
-    )
-    for singular, plural in RECIPE_YIELD_TYPES
-]
 
+class YieldTypeRegistry:
+    """
+    Units a recipe yield can be counted in, as (singular, plural) pairs such as
+    ("cookie", "cookies").
+
+    The words of all types are compiled into one regular expression, which finds
+    every word of a text in a single scan; it is compiled again on the first
+    match after new types are registered.
+    """
+
+    def __init__(self, types: Iterable[tuple[str, str]] = ()):
+        self._types: list[tuple[str, str]] = []
+        self._word_types: dict[str, list[int]] = {}
+        self._words_regex: re.Pattern | None = None
+        for singular, plural in types:
+            self.register(singular, plural)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def register(self, singular: str, plural: str) -> None:
+        """Add a type, e.g. register("empanada", "empanadas")."""
+        index = len(self._types)
+        self._types.append((singular, plural))
+        for word in {singular.lower(), plural.lower()}:
+            self._word_types.setdefault(word, []).append(index)
+        self._words_regex = None
+
+    def _find_words(self, text: str) -> Iterator[str]:
+        if self._words_regex is None:
+            # the longest word first: of words starting at the same position, only
+            # the longest is reported, and the shorter ones could not be the match
+            words = sorted(self._word_types, key=len, reverse=True)
+            alternation = "|".join(re.escape(word) for word in words)
+            # a lookahead, so that overlapping words are all found
+            self._words_regex = re.compile(
+                rf"\b(?=({alternation})\b)", flags=re.IGNORECASE
+            )
+        for match in self._words_regex.finditer(text):
+            yield match.group(1).lower()
+
+    def search(self, text: str) -> bool:
+        """Whether a text contains a word of any type."""
+        return next(self._find_words(text), None) is not None
+
+    def match(self, text: str) -> tuple[str, str] | None:
+        """
+        The type a yield is counted in: among the types with a word in the text,
+        the one with the longest word (the longest of both words when both are
+        found), or the first registered of equally long ones.
+        """
+        found = set(self._find_words(text))
+        indexes = {index for word in found for index in self._word_types[word]}
+        best_type = None
+        best_length = 0
+        for index in sorted(indexes):
+            singular, plural = self._types[index]
+            lengths = [
+                len(word) for word in (singular, plural) if word.lower() in found
+            ]
+            if max(lengths) > best_length:
+                best_type, best_length = (singular, plural), max(lengths)
+        return best_type
+
+
+YIELD_TYPES = YieldTypeRegistry(RECIPE_YIELD_TYPES)
 
 _YIELD_ABBREVIATION_PATTERNS = [
     (
@@ -190,6 +281,77 @@ def _extract_fractional(input_string: str) -> float:
     raise ValueError(f"Unrecognized fraction format: '{input_string}'")
 
 
+def _is_hours_amount_character(character: str) -> bool:
+    return (
+        character.isdecimal()
+        or character.isspace()
+        or character in HOURS_AMOUNT_SYMBOLS
+    )
+
+
+def _match_number(text: str, start: int, unit_regex: re.Pattern):
+    """The next number after `start` if a unit follows it, and the end of the unit."""
+    number = DIGITS_REGEX.search(text, start)
+    if number is None:
+        return None
+    unit = unit_regex.match(text, WHITESPACE_REGEX.match(text, number.end()).end())
+    if unit is None:
+        return None
+    return number.group(), unit.end()
+
+
+def _match_hours(text: str, start: int, unit_regex: re.Pattern):
+    """
+    The amount of hours after `start` if a unit follows it, and the end of the unit.
+
+    The amount is a run of digits, whitespace and fraction symbols. It starts at
+    the next digit, else at the closest position before it where such a run can
+    start, and is the longest part of its run followed by a unit. Positions of a
+    run are checked once, from its end, whatever the number of starts tried.
+    """
+    next_digit = DIGITS_REGEX.search(text, start)
+    amount_start = len(text) if next_digit is None else next_digit.start()
+    run_end = None
+    checked = None  # the amount cannot end at positions >= checked
+    for amount_start in range(amount_start, start - 1, -1):
+        if amount_start == len(text) or not _is_hours_amount_character(
+            text[amount_start]
+        ):
+            run_end = None
+            continue
+        if run_end is None:
+            run_end = HOURS_AMOUNT_REGEX.match(text, amount_start).end()
+            checked = run_end + 1
+            unit_start = run_end  # no whitespace follows the run
+        for amount_end in range(checked - 1, amount_start, -1):
+            if amount_end < run_end and not text[amount_end].isspace():
+                unit_start = amount_end
+            unit = unit_regex.match(text, unit_start)
+            if unit is not None:
+                return text[amount_start:amount_end], unit.end()
+        checked = amount_start + 1
+    return None
+
+
+def parse_time_units(text: str) -> dict[str, str | None]:
+    """
+    Find the days, hours, minutes and seconds of a duration in text, in that
+    order (e.g. '1 hour 15 mins' -> hours '1 ', minutes '15').
+
+    Each unit is optional and is looked for in the text left after the previous
+    one, where anything but digits can precede its number. Runs in time linear
+    in the length of the text.
+    """
+    time_units: dict[str, str | None] = dict.fromkeys(TIME_UNIT_REGEXES)
+    position = 0
+    for name, unit_regex in TIME_UNIT_REGEXES.items():
+        match_unit = _match_hours if name == "hours" else _match_number
+        match = match_unit(text, position, unit_regex)
+        if match is not None:
+            time_units[name], position = match
+    return time_units
+
+
 def get_minutes(element):
     if element is None:
         raise ElementNotFoundInHtml(element)
@@ -198,14 +360,25 @@ def get_minutes(element):
     if hasattr(element, "text"):
         element = element.text
 
+    if isinstance(element, str):
+        # str() so that the cache does not keep a subclass (e.g. a NavigableString
+        # referencing its whole document) alive
+        return _get_minutes_from_text(str(element))
+
     try:
         return int(element)
     except ValueError:
         pass
 
-    if not isinstance(element, str):
-        raise ValueError("Unexpected format for time element")
-    time_text = element
+    raise ValueError("Unexpected format for time element")
+
+
+@functools.lru_cache(maxsize=GET_MINUTES_CACHE_SIZE)
+def _get_minutes_from_text(time_text: str) -> int | None:
+    try:
+        return int(time_text)
+    except ValueError:
+        pass
 
     # attempt iso8601 duration parsing
     if "-" in time_text:  # sometimes formats are like this: '12-15 minutes'
@@ -213,11 +386,16 @@ def get_minutes(element):
     if " to " in time_text:  # sometimes formats are like this: '12 to 15 minutes'
         _min, _to, time_text = time_text.partition(" to ")
 
-    if time_text is None:
-        return None
-
     # Attempt ISO8601 duration parsing
     if time_text.startswith("P") and "T" in time_text:
+        # durations in whole days, hours, minutes and seconds (e.g. 'PT1H30M')
+        # are read directly; others (years, fractions, ...) are left to isodate
+        iso_match = ISO8601_DURATION_REGEX.fullmatch(time_text)
+        if iso_match:
+            days, hours, minutes, seconds = (int(v or 0) for v in iso_match.groups())
+            total_seconds = ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+            total_minutes = math.ceil(total_seconds / 60)
+            return None if total_minutes == 0 else total_minutes
         try:
             duration = isodate.parse_duration(time_text)
             total_minutes = math.ceil(duration.total_seconds() / 60)
@@ -225,7 +403,7 @@ def get_minutes(element):
         except Exception:
             pass
 
-    time_units = TIME_REGEX.search(time_text).groupdict()
+    time_units = parse_time_units(time_text)
     if not any(time_units.values()):
         return None
 
@@ -272,14 +450,9 @@ def get_yields(element):
     if isinstance(element, list):
         best_element = element[0]
         for item in element:
-            item_str = str(item).lower()
-            for singular_pattern, plural_pattern, _, _ in _YIELD_TYPE_PATTERNS:
-                if singular_pattern.search(item_str) or plural_pattern.search(item_str):
-                    best_element = item
-                    break
-            else:
-                continue
-            break
+            if YIELD_TYPES.search(str(item).lower()):
+                best_element = item
+                break
         element = best_element
 
     if isinstance(element, str):
@@ -303,24 +476,9 @@ def get_yields(element):
         matched = 0.0
 
     serve_text_lower = serve_text.lower()
-    best_match = None
-    best_match_length = 0
-
-    for singular_pattern, plural_pattern, singular, plural in _YIELD_TYPE_PATTERNS:
-        singular_match = singular_pattern.search(serve_text_lower)
-        plural_match = plural_pattern.search(serve_text_lower)
-        if singular_match or plural_match:
-            match_length = (
-                max(len(singular), len(plural))
-                if (singular_match and plural_match)
-                else (len(singular) if singular_match else len(plural))
-            )
-            if match_length > best_match_length:
-                best_match_length = match_length
-                best_match = format_count_label(matched, singular, plural)
-
-    if best_match:
-        return best_match
+    yield_type = YIELD_TYPES.match(serve_text_lower)
+    if yield_type is not None:
+        return format_count_label(matched, *yield_type)
 
     for abbreviation_pattern, singular, plural in _YIELD_ABBREVIATION_PATTERNS:
         if abbreviation_pattern.search(serve_text_lower):
@@ -338,33 +496,58 @@ def get_equipment(equipment_items):
     return list(dict.fromkeys(equipment_items))
 
 
-def normalize_string(string: str) -> str:
-    prev = None
-    unescaped = string
-    while prev != unescaped:
-        prev = unescaped
-        unescaped = html.unescape(unescaped)
-
-    no_html_string = re.sub(r"<[^>]*>", "", unescaped)
-
-    cleaned = (
-        no_html_string.replace("\xc2\xa0", " ")
-        .replace("\xa0", " ")
-        .replace("\u200b", "")
-        .replace("\r\n", " ")
-        .replace("\n", " ")
-        .replace("\t", " ")
-        .replace("u0026#039;", "'")
-        .strip()
-    )
+def _unescape(string: str) -> str:
+    # unescape until stable, for text escaped several times (e.g. "&amp;amp;")
+    while "&" in string:
+        unescaped = html.unescape(string)
+        if unescaped == string:
+            break
+        string = unescaped
+    return string
+
+
+def _normalize_string(string: str) -> str:
+    cleaned = _unescape(string)
+    if "<" in cleaned:
+        cleaned = HTML_TAG_REGEX.sub("", cleaned)
+    if "\xc2\xa0" in cleaned:
+        cleaned = cleaned.replace("\xc2\xa0", " ")
+    if "\u200b" in cleaned:
+        cleaned = cleaned.translate(ZERO_WIDTH_SPACE_TABLE)
+    if "u0026#039;" in cleaned:
+        cleaned = cleaned.replace("u0026#039;", "'")
 
     # Only replace '((' and '))' if both are present in the string
     if "((" in cleaned and "))" in cleaned:
         cleaned = cleaned.replace("((", "(").replace("))", ")")
 
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    # collapse whitespace (including newlines, tabs and non-breaking spaces)
+    return " ".join(cleaned.split())
+
+
+@functools.lru_cache(maxsize=NORMALIZE_STRING_CACHE_SIZE)
+def _normalize_short_string(string: str) -> str:
+    return _normalize_string(string)
+
 
-    return cleaned.strip()
+def normalize_string(string: str) -> str:
+    """
+    Clean up text from a recipe page: unescape HTML entities, remove HTML tags
+    and collapse whitespace.
+
+    Short strings (ingredients, nutrient keys and values, ...) repeat across
+    pages and fields, so their results are memoized.
+    """
+    if len(string) <= NORMALIZE_STRING_CACHE_MAX_LENGTH:
+        # str() so that the cache does not keep a subclass (e.g. a NavigableString
+        # referencing its whole document) alive
+        return _normalize_short_string(str(string))
+    return _normalize_string(string)
+
+
+def normalize_strings(strings: Iterable[str]) -> list[str]:
+    """normalize_string() applied to each string."""
+    return [normalize_string(string) for string in strings]
 
 
 def csv_to_tags(csv, lowercase=False):
@@ -380,23 +563,13 @@ def csv_to_tags(csv, lowercase=False):
 
 
 def url_path_to_dict(path):
-    pattern = (
-        r"^"
-        r"((?P<schema>.+?)://)?"
-        r"((?P<user>.+?)(:(?P<password>.*?))?@)?"
-        r"(?P<host>[^:/]+)"
-        r"(:(?P<port>\d+?))?"
-        r"(?P<path>/.*?)?"
-        r"(?P<query>[?].*?)?"
-        r"$"
-    )
-    regex = re.compile(pattern)
-    matches = regex.match(path)
+    matches = URL_REGEX.match(path)
     return matches.groupdict() if matches else None
 
 
 def get_host_name(url):
-    return url_path_to_dict(url.replace("://www.", "://"))["host"]
+    """Host of a URL, lowercased and without its "www." prefix."""
+    return HOST_REGEX.match(url).group("host").lower().rstrip(".")
 
 
 def change_keys(obj, convert):
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class AnItalianInMyKitchen(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "anitalianinmykitchen.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class BakingMischief(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "bakingmischief.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class BlueApron(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "blueapron.com"
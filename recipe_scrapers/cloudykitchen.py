@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class CloudyKitchen(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "cloudykitchen.com"
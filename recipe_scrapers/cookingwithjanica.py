@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class CookingWithJanica(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "cookingwithjanica.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class CookWithDana(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "cookwithdana.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class CrazyForCrust(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "crazyforcrust.com"
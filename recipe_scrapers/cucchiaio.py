@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Cucchiaio(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "cucchiaio.it"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class EatingBirdFood(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "eatingbirdfood.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class EvolvingTable(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "evolvingtable.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class FeastingAtHome(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "feastingathome.com"
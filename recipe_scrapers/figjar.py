@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class FigJar(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "figjar.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class FitSlowCookerQueen(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "fitslowcookerqueen.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class GirlGoneGourmet(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "girlgonegourmet.com"
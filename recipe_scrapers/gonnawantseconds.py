@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class GonnaWantSeconds(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "gonnawantseconds.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class IAmBaker(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "iambaker.net"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Ica(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "ica.se"
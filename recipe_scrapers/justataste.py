@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class JustATaste(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "justataste.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class KitchenStories(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "kitchenstories.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Leukerecepten(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "leukerecepten.nl"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Madsvin(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "madsvin.com"
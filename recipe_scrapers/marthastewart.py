@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class MarthaStewart(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "marthastewart.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class MyVegetarianRoots(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "myvegetarianroots.com"
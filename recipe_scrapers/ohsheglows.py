@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class OhSheGlows(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "ohsheglows.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class PanlasangPinoy(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "panlasangpinoy.com"
@@ -1,22 +1,18 @@
 import re
 from ._abstract import AbstractScraper
 from ._utils import normalize_string
-from ._schemaorg import SchemaOrg
 
 
 class PaulaDeen(AbstractScraper):
-    class _CustomSchemaOrg(SchemaOrg):
-        def __init__(self, page_data):
-            # Fix invalid JSON-LD by removing the trailing semicolon before the closing script tag
-            page_data = re.sub(r"};\s*</script>", "}</script>", page_data)
-            super().__init__(page_data)
-
-    _schema_cls = _CustomSchemaOrg
-
     @classmethod
     def host(cls):
         return "pauladeen.com"
 
+    def __init__(self, html, url, *args, **kwargs):
+        # Fix invalid JSON-LD by removing the trailing semicolon before the closing script tag
+        html = re.sub(r"};\s*</script>", "}</script>", html)
+        super().__init__(html, url, *args, **kwargs)
+
     def instructions(self):
         paragraphs = self.soup.select("section.directions .directions__content p")
         steps = [
@@ -1,14 +1,32 @@
 from ._abstract import AbstractScraper
 from ._utils import normalize_string
 from ._exceptions import FieldNotProvidedByWebsiteException
+from ._result_cache import ResultCache
 import re
 import json
 from typing import Optional
 
 
 class Picnic(AbstractScraper):
-    def __init__(self, html: str, url: str, best_image: Optional[bool] = None):
-        super().__init__(html, url, best_image=best_image)
+    def __init__(
+        self,
+        html: str,
+        url: str,
+        best_image: Optional[bool] = None,
+        parser: Optional[str] = None,
+        cache_fields: Optional[bool] = None,
+        result_cache: Optional[ResultCache] = None,
+        element_index: Optional[bool] = None,
+    ):
+        super().__init__(
+            html,
+            url,
+            best_image=best_image,
+            parser=parser,
+            cache_fields=cache_fields,
+            result_cache=result_cache,
+            element_index=element_index,
+        )
         self.recipe_data = None
         self._recipe = None
         script_tag = self.soup.find(
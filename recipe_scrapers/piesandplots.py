@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class PiesAndPlots(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "piesandplots.net"
@@ -1,4 +1,5 @@
 from .exception_handling import ExceptionHandlingPlugin
+from .field_cache import FieldCachePlugin
 from .html_tags_stripper import HTMLTagStripperPlugin
 from .normalize_string import NormalizeStringPlugin
 from .opengraph_fill import OpenGraphFillPlugin
@@ -11,6 +12,7 @@ from .best_image import BestImagePlugin
 __all__ = [
     "BestImagePlugin",
     "ExceptionHandlingPlugin",
+    "FieldCachePlugin",
     "StaticValueExceptionHandlingPlugin",
     "HTMLTagStripperPlugin",
     "NormalizeStringPlugin",
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from typing import Optional
 
 
 class PluginInterface(ABC):
@@ -15,6 +16,11 @@ class PluginInterface(ABC):
 
     run_on_hosts: Iterable[str] = ("*",)
     run_on_methods: Iterable[str] = ("title",)
+    # Name of a scraper attribute turning the plugin on per scraper, e.g.
+    # "cache_fields": the plugin then wraps the methods of the scrapers having
+    # it set, around the plugin chains of their class, rather than the class
+    # methods of every scraper.
+    instance_option: Optional[str] = None
 
     @classmethod
     @abstractmethod
@@ -1,18 +1,12 @@
 import functools
-import logging
 import re
 from collections import OrderedDict
 from collections.abc import Iterator
 from typing import ClassVar, Optional, Union
 from urllib.parse import urljoin, urlsplit
 
-from recipe_scrapers.settings import settings
-
 from ._interface import PluginInterface
 
-logging.basicConfig()
-logger = logging.getLogger(__name__)
-
 
 class BestImagePlugin(PluginInterface):
     """Select the best available recipe image when requested."""
@@ -29,15 +23,6 @@ class BestImagePlugin(PluginInterface):
         r"(?:^|[/.-])(?:favicon|apple-touch-icon|icon(?:[.-][\w-]+)?|logo)(?:[/.?-]|$)",
         re.IGNORECASE,
     )
-    _IMAGE_META_PROPS = frozenset(
-        {
-            "og:image",
-            "og:image:url",
-            "og:image:secure_url",
-            "twitter:image",
-            "twitter:image:src",
-        }
-    )
     _SOURCE_PRIORITY: ClassVar[dict[str, int]] = {
         "primary": 3,
         "schema": 2,
@@ -49,13 +34,6 @@ class BestImagePlugin(PluginInterface):
     def run(cls, decorated):
         @functools.wraps(decorated)
         def decorated_method_wrapper(self, *args, **kwargs):
-            logger.setLevel(settings.LOG_LEVEL)
-            class_name = self.__class__.__name__
-            method_name = decorated.__name__
-            logger.debug(
-                f"Decorating: {class_name}.{method_name}() with BestImagePlugin"
-            )
-
             image = decorated(self, *args, **kwargs)
 
             if not getattr(self, "best_image_selection", False):
@@ -136,48 +114,13 @@ class BestImagePlugin(PluginInterface):
         candidates: "OrderedDict[str, dict]",
         base_url: str,
     ) -> None:
-        soup = getattr(scraper, "soup", None)
-        if soup is None:
+        metadata = getattr(scraper, "head_metadata", None)
+        if metadata is None:
             return
 
-        images: dict[str, dict] = {}
-        current_url: Optional[str] = None
-        for meta in soup.find_all("meta"):
-            prop = (meta.get("property") or meta.get("name") or "").lower()
-            content = meta.get("content")
-            if not content:
-                continue
-
-            if prop in cls._IMAGE_META_PROPS:
-                url = content.strip()
-                current_url = url
-                source = "twitter" if prop.startswith("twitter:") else "opengraph"
-                if url not in images:
-                    images[url] = {
-                        "url": url,
-                        "width": None,
-                        "height": None,
-                    }
-                current = images[url]
-                cls._merge_candidate(candidates, current, source, base_url)
-            elif (
-                prop == "og:image:width"
-                and current_url is not None
-                and current_url in images
-            ):
-                images[current_url]["width"] = cls._parse_dimension(content)
-                cls._merge_candidate(
-                    candidates, images[current_url], "opengraph", base_url
-                )
-            elif (
-                prop == "og:image:height"
-                and current_url is not None
-                and current_url in images
-            ):
-                images[current_url]["height"] = cls._parse_dimension(content)
-                cls._merge_candidate(
-                    candidates, images[current_url], "opengraph", base_url
-                )
+        for image in metadata.images:
+            for source in sorted(image["sources"]):
+                cls._merge_candidate(candidates, image, source, base_url)
 
     @classmethod
     def _merge_candidate(
@@ -5,7 +5,6 @@ from recipe_scrapers.settings import settings
 
 from ._interface import PluginInterface
 
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
@@ -18,8 +17,8 @@ class ExceptionHandlingPlugin(PluginInterface):
     If ANY of the methods listed raises ANY kind of exception, silence it
     and return the respective value from settings.ON_EXCEPTION_RETURN_VALUES
 
-    If settings.SUPPRESS_EXCEPTIONS is set to False this plugin is ignored and
-    does nothing. (In other words exceptions won't be handled and will bubble up
+    If settings.SUPPRESS_EXCEPTIONS is set to False this plugin is not attached
+    and does nothing. (In other words exceptions won't be handled and will bubble up
     to program's explosion. Left to the end-user to handle them on his own).
     """
 
@@ -37,28 +36,26 @@ class ExceptionHandlingPlugin(PluginInterface):
         "nutrients",
     )
 
+    @classmethod
+    def should_run(cls, host, method):
+        # Read when the plugin chains are built, which happens again after
+        # settings change, rather than on every call.
+        return settings.SUPPRESS_EXCEPTIONS and super().should_run(host, method)
+
     @classmethod
     def run(cls, decorated):
         @functools.wraps(decorated)
         def decorated_method_wrapper(self, *args, **kwargs):
-            if settings.SUPPRESS_EXCEPTIONS:
-                logger.setLevel(settings.LOG_LEVEL)
-                class_name = self.__class__.__name__
-                method_name = decorated.__name__
-                logger.debug(
-                    f"Decorating: {class_name}.{method_name}() with ExceptionHandlingPlugin"
+            try:
+                return decorated(self, *args, **kwargs)
+            except Exception as e:
+                logger.info(
+                    "ExceptionHandlingPlugin silenced exception: %s in %s.%s()",
+                    e,
+                    self.__class__.__name__,
+                    decorated.__name__,
                 )
 
-                try:
-                    return decorated(self, *args, **kwargs)
-                except Exception as e:
-                    logger.info(
-                        f"ExceptionHandlingPlugin silenced exception: {str(e)} in {class_name}.{method_name}()"
-                    )
-
-                    return settings.ON_EXCEPTION_RETURN_VALUES.get(
-                        decorated.__name__, None
-                    )
-            return decorated(self, *args, **kwargs)
+                return settings.ON_EXCEPTION_RETURN_VALUES.get(decorated.__name__, None)
 
         return decorated_method_wrapper
@@ -0,0 +1,75 @@
+import copy
+import functools
+
+from ._interface import PluginInterface
+
+
+class FieldCachePlugin(PluginInterface):
+    """
+    Memoize the results of the methods listed per scraper instance, so that
+    each field is computed at most once per page, even when fields call each
+    other (e.g. ingredient_groups() calling ingredients()).
+
+    Only attached to scrapers created with cache_fields=True, or when
+    settings.CACHE_FIELDS is True, around the plugin chains of their class, so
+    that the cached value is the final result of the whole plugin chain.
+
+    Copies of the cached values are returned, so that callers may change them.
+    Exceptions are not cached. Use FieldCachePlugin.invalidate() to drop
+    cached results, e.g. after changing scraper.schema.data.
+    """
+
+    run_on_hosts = ("*",)
+    instance_option = "cache_fields"
+    run_on_methods = (
+        "author",
+        "canonical_url",
+        "site_name",
+        "language",
+        "title",
+        "ingredients",
+        "ingredient_groups",
+        "instructions",
+        "instructions_list",
+        "category",
+        "yields",
+        "description",
+        "total_time",
+        "cook_time",
+        "prep_time",
+        "cuisine",
+        "cooking_method",
+        "ratings",
+        "ratings_count",
+        "equipment",
+        "nutrients",
+        "dietary_restrictions",
+        "image",
+        "keywords",
+        "links",
+    )
+
+    @classmethod
+    def run(cls, decorated):
+        name = decorated.__name__
+
+        @functools.wraps(decorated)
+        def decorated_method_wrapper(self, *args, **kwargs):
+            if args or kwargs:
+                return decorated(self, *args, **kwargs)
+
+            cache = self.__dict__.setdefault("_field_cache", {})
+            if name not in cache:
+                cache[name] = decorated(self)
+            return copy.deepcopy(cache[name])
+
+        return decorated_method_wrapper
+
+    @staticmethod
+    def invalidate(scraper, *fields: str) -> None:
+        """Drop the cached results of the given fields, or of all fields."""
+        cache = scraper.__dict__.get("_field_cache", {})
+        if not fields:
+            cache.clear()
+        for field in fields:
+            cache.pop(field, None)
@@ -1,14 +1,23 @@
 import functools
-import logging
+import html
+import re
 from html.parser import HTMLParser
 from io import StringIO
 
-from recipe_scrapers.settings import settings
-
 from ._interface import PluginInterface
 
-logging.basicConfig()
-logger = logging.getLogger(__name__)
+# Start and end tags that HTMLParser reads as plain tags: a name, then attributes
+# with quoted values free of < and >. Elements whose content the parser does not
+# read as regular text (script, style, ...) are left to the parser.
+_TAG_NAME = r"[a-zA-Z][-.a-zA-Z0-9:_]*"
+_ATTRIBUTE = r"""[^\s"'<>/=]+(?:\s*=\s*(?:"[^"<>]*"|'[^'<>]*'|[^\s"'<>=`/]+))?"""
+SIMPLE_TAG_REGEX = re.compile(
+    r"<(?!(?:script|style|textarea|title|xmp|iframe|noembed|noframes|noscript"
+    r"|plaintext)\b)"
+    rf"{_TAG_NAME}(?:\s+{_ATTRIBUTE})*\s*/?>"
+    rf"|</{_TAG_NAME}\s*>",
+    flags=re.IGNORECASE,
+)
 
 
 # Taken from @jksimoniii 's PR:
@@ -36,16 +45,26 @@ def strip_tags(html):
     return s.get_data()
 
 
-def stripper(string):
-    # Deal with HTML and HTML Encoded Characters
-    string = strip_tags(
-        f"<tag>{string}<tag>"
-    )  # This is a workaround, since HTMLParser expects valid markup
-    string = strip_tags(
-        f"<tag>{string}<tag>"
-    )  # This is another workaround, handles "&amp;amp;"
+def strip_tags_once(string):
+    """
+    Equivalent to strip_tags(f"<tag>{string}<tag>"), without parsing simple markup.
+
+    HTMLParser reports the text between tags with its entities unescaped; text
+    split on simple tags gives the same result. Any other markup (comments,
+    unclosed tags, a "<" in text, ...) is left to the parser.
+    """
+    if "<" not in string:
+        return html.unescape(string)
+    chunks = SIMPLE_TAG_REGEX.split(string)
+    if any("<" in chunk for chunk in chunks):
+        return strip_tags(f"<tag>{string}<tag>")
+    return "".join([html.unescape(chunk) for chunk in chunks])
+
 
-    return string
+def stripper(string):
+    # Deal with HTML and HTML Encoded Characters. The second pass handles
+    # "&amp;amp;", and tags that were escaped in the original string.
+    return strip_tags_once(strip_tags_once(string))
 
 
 class HTMLTagStripperPlugin(PluginInterface):
@@ -64,13 +83,6 @@ class HTMLTagStripperPlugin(PluginInterface):
     def run(cls, decorated):
         @functools.wraps(decorated)
         def decorated_method_wrapper(self, *args, **kwargs):
-            logger.setLevel(settings.LOG_LEVEL)
-            class_name = self.__class__.__name__
-            method_name = decorated.__name__
-            logger.debug(
-                f"Decorating: {class_name}.{method_name}() with HTMLTagStripperPlugin plugin."
-            )
-
             decorated_func_result = decorated(self, *args, **kwargs)
 
             if type(decorated_func_result) is list:
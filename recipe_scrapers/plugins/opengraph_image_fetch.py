@@ -1,11 +1,8 @@
 import functools
 import logging
 
-from recipe_scrapers.settings import settings
-
 from ._interface import PluginInterface
 
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
@@ -24,13 +21,6 @@ class OpenGraphImageFetchPlugin(PluginInterface):
     def run(cls, decorated):
         @functools.wraps(decorated)
         def decorated_method_wrapper(self, *args, **kwargs):
-            logger.setLevel(settings.LOG_LEVEL)
-            class_name = self.__class__.__name__
-            method_name = decorated.__name__
-            logger.debug(
-                f"Decorating: {class_name}.{method_name}() with OpenGraphImageFetchPlugin"
-            )
-
             image = None
             try:
                 image = decorated(self, *args, **kwargs)
@@ -41,11 +31,10 @@ class OpenGraphImageFetchPlugin(PluginInterface):
                 return image
             else:
                 logger.info(
-                    f"{class_name}.{method_name}() did not manage to find recipe image. OpenGraphImageFetchPlugin will attempt to do its magic."
-                )
-                image = self.soup.find(
-                    "meta", {"property": "og:image", "content": True}
+                    "%s.%s() did not manage to find recipe image. OpenGraphImageFetchPlugin will attempt to do its magic.",
+                    self.__class__.__name__,
+                    decorated.__name__,
                 )
-                return image.get("content") if image else None
+                return self.head_metadata.content("property", "og:image")
 
         return decorated_method_wrapper
@@ -2,11 +2,9 @@ import functools
 import logging
 
 from recipe_scrapers._exceptions import FillPluginException, RecipeSchemaNotFound
-from recipe_scrapers.settings import settings
 
 from ._interface import PluginInterface
 
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
@@ -46,12 +44,6 @@ class SchemaOrgFillPlugin(PluginInterface):
     def run(cls, decorated):
         @functools.wraps(decorated)
         def decorated_method_wrapper(self, *args, **kwargs):
-            logger.setLevel(settings.LOG_LEVEL)
-            class_name = self.__class__.__name__
-            method_name = decorated.__name__
-            logger.debug(
-                f"Decorating: {class_name}.{method_name}() with SchemaOrgFillPlugin"
-            )
             try:
                 return decorated(self, *args, **kwargs)
             except (FillPluginException, NotImplementedError) as e:
@@ -60,7 +52,9 @@ class SchemaOrgFillPlugin(PluginInterface):
                     raise RecipeSchemaNotFound(url=self.url)
                 if function:
                     logger.info(
-                        f"{class_name}.{method_name}() seems to not be implemented but .schema is available! Attempting to return result from SchemaOrg."
+                        "%s.%s() seems to not be implemented but .schema is available! Attempting to return result from SchemaOrg.",
+                        self.__class__.__name__,
+                        decorated.__name__,
                     )
                     return function(*args, **kwargs)
                 else:
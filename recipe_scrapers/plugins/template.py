@@ -2,9 +2,7 @@ import functools
 import logging
 
 from recipe_scrapers.plugins._interface import PluginInterface
-from recipe_scrapers.settings import settings
 
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
@@ -28,12 +26,9 @@ class TemplatePlugin(PluginInterface):
             # in here you'll have self.soup, self.schema and the other
             # instance attributes/methods you can work with.
             # check other plugins for examples
-            logger.setLevel(settings.LOG_LEVEL)
-            class_name = self.__class__.__name__
-            method_name = decorated.__name__
-            logger.debug(
-                f"Decorating: {class_name}.{method_name}() with TemplatePlugin"
-            )
+            # this wrapper runs on every call of the decorated method, so keep
+            # it lean: log with lazy %-style arguments, e.g.
+            # logger.debug("%s.%s() called", self.__class__.__name__, decorated.__name__)
             return decorated(self, *args, **kwargs)
 
         return decorated_method_wrapper
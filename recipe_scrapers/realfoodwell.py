@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class RealFoodWell(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "realfoodwell.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Recept(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "recept.se"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class RedHouseSpice(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "redhousespice.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Saveur(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "saveur.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SavoryThoughts(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "savorythoughts.com"
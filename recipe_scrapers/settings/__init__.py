@@ -1,4 +1,5 @@
 import importlib
+import logging
 import os
 from typing import Any
 
@@ -31,6 +32,8 @@ class RecipeScraperSettings:
     def __init__(self, *args: Any, **kwargs: Any):
         self._configured = False
         self._user_settings = False
+        # incremented whenever a setting changes, see AbstractScraper.__init__()
+        self._version = 0
         super().__init__(*args, **kwargs)
 
     def __getattribute__(self, item: Any) -> Any:
@@ -48,6 +51,15 @@ class RecipeScraperSettings:
 
         return super().__getattribute__(item)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.isupper():
+            super().__setattr__("_version", self._version + 1)
+        # loggers within the package inherit their level from the package
+        # logger, so that it only needs to be set when the setting changes
+        if name == "LOG_LEVEL":
+            logging.getLogger("recipe_scrapers").setLevel(value)
+
     def _configure(self) -> None:
         # configure the default settings by default
         if not getattr(self, "_configured"):
@@ -1,6 +1,7 @@
 from recipe_scrapers.plugins import (
     BestImagePlugin,
     ExceptionHandlingPlugin,
+    FieldCachePlugin,
     HTMLTagStripperPlugin,
     NormalizeStringPlugin,
     OpenGraphFillPlugin,
@@ -13,6 +14,7 @@ from recipe_scrapers.plugins import (
 # The upper most plugin is the "outer most" executed.
 # Check recipe_scrapers.settings.template.py for ways to extend.
 PLUGINS = (
+    FieldCachePlugin,
     ExceptionHandlingPlugin,
     BestImagePlugin,
     StaticValueExceptionHandlingPlugin,
@@ -25,6 +27,27 @@ PLUGINS = (
 
 BEST_IMAGE_SELECTION = True
 
+# Memoize field results per scraper instance (see FieldCachePlugin), so that
+# each field is computed at most once per page.
+CACHE_FIELDS = False
+
+# Cache of to_json() results shared by all scrapers, e.g. a MemoryResultCache or
+# a SQLiteResultCache from recipe_scrapers, so that pages scraped again with
+# identical content are not parsed again. None disables the cache.
+RESULT_CACHE = None
+
+# Index the elements of each page by tag name, id, class, itemprop and property
+# on the first soup lookup (see recipe_scrapers._element_index.IndexedSoup), so
+# that find() and select() lookups on them do not walk the whole page.
+ELEMENT_INDEX = False
+
+# BeautifulSoup tree builder used to parse recipe pages, e.g. "html.parser",
+# "lxml" or "html5lib". Faster builders may produce a slightly different tree,
+# run scripts/parser_conformance.py to check which scrapers are affected.
+# "lxml-shared" parses each page once with lxml and builds both the soup and
+# the schema.org data from that single tree.
+HTML_PARSER = "html.parser"
+
 SUPPRESS_EXCEPTIONS = False
 # Applicable only if SUPPRESS_EXCEPTIONS is True, otherwise ignored
 # silence <anyScraper>.[method]() exception and return the value
@@ -50,4 +73,7 @@ ON_EXCEPTION_RETURN_VALUES = {
 # logging.ERROR     # 40
 # logging.CRITICAL  # 50
 # https://docs.python.org/3/howto/logging.html
+# Level of the "recipe_scrapers" logger. The package does not configure any
+# logging handler: call logging.basicConfig() (or configure logging otherwise)
+# in your application to see its messages.
 LOG_LEVEL = 30
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SipAndFeast(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "sipandfeast.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SmallTownWoman(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "smalltownwoman.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SoBors(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "sobors.hu"
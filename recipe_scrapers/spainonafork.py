@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SpainOnAFork(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "spainonafork.com"
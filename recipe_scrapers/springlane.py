@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Springlane(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "springlane.de"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SugarHero(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "sugarhero.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class SugarMapleFarmhouse(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "sugarmaplefarmhouse.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class TableAndDish(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "tableanddish.com"
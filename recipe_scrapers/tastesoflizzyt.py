@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class TastesOfLizzyT(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "tastesoflizzyt.com"
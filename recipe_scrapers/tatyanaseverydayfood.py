@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class TatyanasEverydayFood(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "tatyanaseverydayfood.com"
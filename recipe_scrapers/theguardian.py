@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class TheGuardian(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "theguardian.com"
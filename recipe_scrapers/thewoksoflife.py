@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class Thewoksoflife(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "thewoksoflife.com"
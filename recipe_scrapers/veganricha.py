@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class VeganRicha(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "veganricha.com"
@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class WeAreNotMartha(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "wearenotmartha.com"
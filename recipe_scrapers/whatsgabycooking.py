@@ -1,7 +0,0 @@
-from ._abstract import AbstractScraper
-
-
-class WhatsGabyCooking(AbstractScraper):
-    @classmethod
-    def host(cls):
-        return "whatsgabycooking.com"
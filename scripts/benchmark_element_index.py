@@ -0,0 +1,74 @@
+import argparse
+import pathlib
+import time
+import warnings
+
+from recipe_scrapers import SCRAPERS, scrape_html
+from recipe_scrapers._exceptions import StaticValueException
+from recipe_scrapers._utils import get_abstract_methods
+
+TEST_DATA = pathlib.Path(__file__).parent.parent / "tests" / "test_data"
+FIELDS = [field for field in get_abstract_methods() if field != "host"]
+
+
+def scrape_fields(html: str, host: str, element_index: bool) -> tuple[dict, float]:
+    """Scrape every field of a test page, and the time taken once it is parsed."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        scraper = scrape_html(
+            html=html,
+            org_url=host,
+            supported_only=host in SCRAPERS,
+            element_index=element_index,
+        )
+        scraper.soup  # parsing is the same with and without the index
+        results = {}
+        start = time.perf_counter()
+        for field in FIELDS:
+            try:
+                results[field] = getattr(scraper, field)()
+            except StaticValueException as e:
+                results[field] = e.return_value
+            except Exception as e:
+                results[field] = f"raised {type(e).__name__}"
+        return results, time.perf_counter() - start
+
+
+def benchmark_element_index(limit: int | None) -> None:
+    """Check that the element index leaves results unchanged, and time the fields.
+
+    Args:
+        limit (int | None): Number of test pages scraped; all of them by default.
+    """
+    mismatches = []
+    seconds = {False: 0.0, True: 0.0}
+    paths = sorted(TEST_DATA.glob("*/*.testhtml"))[:limit]
+    for path in paths:
+        host = path.parent.name
+        html = path.read_text(encoding="utf-8")
+        expected, seconds_scan = scrape_fields(html, host, element_index=False)
+        actual, seconds_index = scrape_fields(html, host, element_index=True)
+        seconds[False] += seconds_scan
+        seconds[True] += seconds_index
+        if expected != actual:
+            mismatches.append(path)
+
+    print(f"{len(paths)} pages")
+    print(f"{len(mismatches)} pages scraped differently with the element index")
+    for path in mismatches[:10]:
+        print(f"  {path}")
+    print(f"{'lookups':<20}{'ms/page':>10}")
+    for name, element_index in (("scan", False), ("element index", True)):
+        print(f"{name:<20}{seconds[element_index] / len(paths) * 1e3:>10.2f}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare scraping the test pages with and without the element index",
+    )
+    parser.add_argument("--limit", type=int, help="Number of test pages scraped")
+
+    args = parser.parse_args()
+    benchmark_element_index(args.limit)
@@ -0,0 +1,57 @@
+import argparse
+import random
+import time
+
+from recipe_scrapers import SCRAPERS, scraper_exists_for
+from recipe_scrapers._utils import get_host_name
+
+SUBDOMAINS = ("", "www.", "m.", "amp.", "es.")
+UNSUPPORTED_HOSTS = ("example.com", "recipes.example.org", "blog.example.net")
+
+
+def sample_urls(count: int, seed: int) -> list[str]:
+    """URLs of supported hosts (and their subdomains) mixed with unsupported ones."""
+    rng = random.Random(seed)
+    hosts = list(SCRAPERS) + list(UNSUPPORTED_HOSTS) * 20
+    return [
+        f"https://{rng.choice(SUBDOMAINS)}{rng.choice(hosts)}/recipe/{index}/"
+        for index in range(count)
+    ]
+
+
+def time_per_url(function, urls: list[str]) -> float:
+    start = time.perf_counter()
+    for url in urls:
+        function(url)
+    return (time.perf_counter() - start) / len(urls)
+
+
+def benchmark_hosts(count: int, seed: int) -> None:
+    """Measure the classification of URLs by the host of their scraper.
+
+    Args:
+        count (int): Number of URLs classified.
+        seed (int): Seed of the random choice of URLs.
+    """
+    urls = sample_urls(count, seed)
+    scraper_exists_for(urls[0])  # build the host index before timing
+    supported = sum(map(scraper_exists_for, urls))
+    print(f"{count} URLs, {supported} supported")
+    print(f"{'function':<24}{'ns/URL':>10}{'URLs/s':>14}")
+    for name, function in (
+        ("get_host_name", get_host_name),
+        ("scraper_exists_for", scraper_exists_for),
+    ):
+        seconds = time_per_url(function, urls)
+        print(f"{name:<24}{seconds * 1e9:>10.0f}{1 / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the time taken to find the scraper host of URLs",
+    )
+    parser.add_argument("--count", type=int, default=200_000, help="URLs classified")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    args = parser.parse_args()
+    benchmark_hosts(args.count, args.seed)
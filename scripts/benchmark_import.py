@@ -0,0 +1,58 @@
+import argparse
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+STATEMENTS = {
+    "import recipe_scrapers": "import recipe_scrapers",
+    "first scrape (one scraper imported)": (
+        "from recipe_scrapers import scrape_html\n"
+        "scrape_html('<html></html>', 'https://www.allrecipes.com/recipe/1/')"
+    ),
+    "all scrapers imported": "import recipe_scrapers._scrapers",
+}
+
+
+def time_statement(statement: str, runs: int) -> list[float]:
+    """Time a statement in fresh interpreters, so that no module is cached."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def benchmark_import(runs: int) -> None:
+    """Compare the cold start of recipe_scrapers with importing every scraper.
+
+    Args:
+        runs (int): Number of fresh interpreters timed for each statement.
+    """
+    print(f"{runs} runs per statement")
+    print(f"{'statement':<40}{'median (ms)':>14}{'min (ms)':>12}")
+    for name, statement in STATEMENTS.items():
+        timings = time_statement(statement, runs)
+        median_ms, min_ms = statistics.median(timings) * 1e3, min(timings) * 1e3
+        print(f"{name:<40}{median_ms:>14.1f}{min_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the time taken to import recipe_scrapers",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Runs per statement")
+
+    args = parser.parse_args()
+    benchmark_import(args.runs)
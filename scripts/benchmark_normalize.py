@@ -0,0 +1,115 @@
+import argparse
+import html
+import json
+import pathlib
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers._utils import _normalize_string, normalize_string
+
+TEST_DATA = pathlib.Path(__file__).parent.parent / "tests" / "test_data"
+TEXT_TAGS = ("h1", "h2", "h3", "li", "p", "span", "td")
+
+
+def reference_normalize_string(string: str) -> str:
+    """normalize_string() as implemented before the single-pass version."""
+    prev = None
+    unescaped = string
+    while prev != unescaped:
+        prev = unescaped
+        unescaped = html.unescape(unescaped)
+
+    no_html_string = re.sub(r"<[^>]*>", "", unescaped)
+
+    cleaned = (
+        no_html_string.replace("\xc2\xa0", " ")
+        .replace("\xa0", " ")
+        .replace("\u200b", "")
+        .replace("\r\n", " ")
+        .replace("\n", " ")
+        .replace("\t", " ")
+        .replace("u0026#039;", "'")
+        .strip()
+    )
+
+    if "((" in cleaned and "))" in cleaned:
+        cleaned = cleaned.replace("((", "(").replace("))", ")")
+
+    cleaned = re.sub(r"\s+", " ", cleaned)
+
+    return cleaned.strip()
+
+
+def json_strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from json_strings(item)
+
+
+def corpus_strings(limit: int | None) -> list[str]:
+    """Raw text of the test pages: HTML of text elements, and JSON-LD strings."""
+    strings = []
+    paths = sorted(TEST_DATA.glob("*/*.testhtml"))[:limit]
+    for path in paths:
+        soup = BeautifulSoup(path.read_text(encoding="utf-8"), "html.parser")
+        for tag in soup.find_all(TEXT_TAGS):
+            strings.append(tag.decode_contents())
+        for script in soup.find_all("script", type="application/ld+json"):
+            try:
+                strings.extend(json_strings(json.loads(script.string or "")))
+            except ValueError:
+                continue
+    return strings
+
+
+def time_per_string(function, strings: list[str]) -> float:
+    start = time.perf_counter()
+    for string in strings:
+        function(string)
+    return (time.perf_counter() - start) / len(strings)
+
+
+def benchmark_normalize(limit: int | None) -> None:
+    """Check that normalize_string() is unchanged on the test corpus, and time it.
+
+    Args:
+        limit (int | None): Number of test pages read; all of them by default.
+    """
+    strings = corpus_strings(limit)
+    mismatches = [
+        string
+        for string in strings
+        if normalize_string(string) != reference_normalize_string(string)
+    ]
+    print(f"{len(strings)} strings ({len(set(strings))} distinct)")
+    print(f"{len(mismatches)} outputs differing from the reference implementation")
+    for string in mismatches[:10]:
+        print(f"  {string!r}")
+
+    print(f"{'function':<28}{'ns/string':>12}")
+    for name, function in (
+        ("reference", reference_normalize_string),
+        ("single pass", _normalize_string),
+        ("normalize_string (memo)", normalize_string),
+    ):
+        seconds = time_per_string(function, strings)
+        print(f"{name:<28}{seconds * 1e9:>12.0f}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare normalize_string() with its reference implementation",
+    )
+    parser.add_argument("--limit", type=int, help="Number of test pages read")
+
+    args = parser.parse_args()
+    benchmark_normalize(args.limit)
@@ -0,0 +1,110 @@
+import argparse
+import functools
+import inspect
+import logging
+import timeit
+
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers.settings import settings
+
+
+class BenchmarkScraper(AbstractScraper):
+    """Scraper returning constants, so that timings only measure dispatch."""
+
+    @classmethod
+    def host(cls):
+        return "benchmark.recipe-scrapers.example"
+
+    def title(self):
+        return "Benchmark Recipe"
+
+    def ingredients(self):
+        return ["1 slice of bread", "5g margarine"]
+
+    def instructions(self):
+        return "spread the margarine on the bread"
+
+    def total_time(self):
+        return 5
+
+    def yields(self):
+        return "1 serving"
+
+    def author(self):
+        return "Benchmark"
+
+
+FIELDS = ["title", "ingredients", "instructions", "total_time", "yields", "author"]
+
+
+def legacy_dispatch_wrapper(plugin, decorated):
+    """Dispatch of a plugin wrapper as it used to be, without the plugin's work.
+
+    Each call set the level of the plugin's logger from the settings and
+    formatted a debug message with an f-string, before calling the method.
+    """
+    logger = logging.getLogger(plugin.__module__)
+
+    @functools.wraps(decorated)
+    def decorated_method_wrapper(self, *args, **kwargs):
+        logger.setLevel(settings.LOG_LEVEL)
+        class_name = self.__class__.__name__
+        method_name = decorated.__name__
+        logger.debug(f"Decorating: {class_name}.{method_name}() with {plugin.__name__}")
+        return decorated(self, *args, **kwargs)
+
+    return decorated_method_wrapper
+
+
+def legacy_chain(bare, host: str):
+    """The bare method wrapped by the plugins running on it, as they used to be."""
+    method = bare
+    for plugin in reversed(settings.PLUGINS):
+        if plugin.instance_option is not None:
+            continue
+        hosts, methods = plugin.run_on_hosts, plugin.run_on_methods
+        if ("*" in hosts or host in hosts) and bare.__name__ in methods:
+            method = legacy_dispatch_wrapper(plugin, method)
+    return method
+
+
+def benchmark_dispatch(number: int) -> None:
+    """Compare each field called through its plugin chain with the bare method.
+
+    The difference between a chain's timing and the bare method's is the
+    per-call overhead added by the plugins wrapping the field. It is given
+    before (the per-call logger setup and f-string debug message of the
+    former wrappers, without the plugins' own work) and after (the current
+    chain, including the plugins' own work).
+
+    Args:
+        number (int): Number of calls to time for each field.
+    """
+    scraper = BenchmarkScraper(
+        html="<html></html>", url="https://benchmark.recipe-scrapers.example/"
+    )
+    print(f"{number} calls per field, overhead in us per call")
+    print(f"{'field':<14}{'bare (us)':>12}{'before (us)':>14}{'after (us)':>13}")
+    for field in FIELDS:
+        wrapped = getattr(BenchmarkScraper, field)
+        bare = inspect.unwrap(wrapped)
+        legacy = legacy_chain(bare, scraper.host())
+
+        bare_us = timeit.timeit(lambda: bare(scraper), number=number) / number
+        legacy_us = timeit.timeit(lambda: legacy(scraper), number=number) / number
+        chain_us = timeit.timeit(lambda: wrapped(scraper), number=number) / number
+        bare_us, legacy_us, chain_us = bare_us * 1e6, legacy_us * 1e6, chain_us * 1e6
+        print(
+            f"{field:<14}{bare_us:>12.2f}{legacy_us - bare_us:>14.2f}"
+            f"{chain_us - bare_us:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the per-call overhead of the plugins wrapping scraper fields",
+    )
+    parser.add_argument("--number", type=int, default=20000, help="Calls per field")
+
+    args = parser.parse_args()
+    benchmark_dispatch(args.number)
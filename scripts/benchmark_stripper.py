@@ -0,0 +1,52 @@
+import argparse
+import time
+
+from benchmark_normalize import corpus_strings
+
+from recipe_scrapers.plugins.html_tags_stripper import strip_tags, stripper
+
+
+def parser_stripper(string: str) -> str:
+    """stripper() as implemented before, parsing every string twice."""
+    string = strip_tags(f"<tag>{string}<tag>")
+    return strip_tags(f"<tag>{string}<tag>")
+
+
+def time_per_string(function, strings: list[str]) -> float:
+    start = time.perf_counter()
+    for string in strings:
+        function(string)
+    return (time.perf_counter() - start) / len(strings)
+
+
+def benchmark_stripper(limit: int | None) -> None:
+    """Check that stripper() is unchanged on the test corpus, and time it.
+
+    Args:
+        limit (int | None): Number of test pages read; all of them by default.
+    """
+    strings = corpus_strings(limit)
+    mismatches = [
+        string for string in strings if stripper(string) != parser_stripper(string)
+    ]
+    print(f"{len(strings)} strings")
+    print(f"{len(mismatches)} outputs differing from the parser implementation")
+    for string in mismatches[:10]:
+        print(f"  {string!r}")
+
+    print(f"{'function':<20}{'ns/string':>12}")
+    for name, function in (("parser", parser_stripper), ("stripper", stripper)):
+        seconds = time_per_string(function, strings)
+        print(f"{name:<20}{seconds * 1e9:>12.0f}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare stripper() with its HTMLParser implementation",
+    )
+    parser.add_argument("--limit", type=int, help="Number of test pages read")
+
+    args = parser.parse_args()
+    benchmark_stripper(args.limit)
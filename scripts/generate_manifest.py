@@ -0,0 +1,60 @@
+import argparse
+import pathlib
+import sys
+
+from recipe_scrapers._scrapers import SCRAPERS
+
+MANIFEST_PATH = (
+    pathlib.Path(__file__).parent.parent / "recipe_scrapers" / "_manifest.py"
+)
+
+MAX_LINE_LENGTH = 88
+
+HEADER = '''"""
+Host -> (module, class name) of every scraper in recipe_scrapers/_scrapers.py.
+
+Generated by scripts/generate_manifest.py, do not edit by hand.
+"""
+
+'''
+
+
+def build_manifest() -> dict[str, tuple[str, str]]:
+    """Locate the scraper class of each host registered in SCRAPERS."""
+    return {
+        host: (scraper.__module__.rsplit(".", 1)[-1], scraper.__name__)
+        for host, scraper in sorted(SCRAPERS.items())
+    }
+
+
+def render_manifest(manifest: dict[str, tuple[str, str]]) -> str:
+    lines = ["SCRAPER_MANIFEST: dict[str, tuple[str, str]] = {"]
+    for host, (module, class_name) in manifest.items():
+        line = f'    "{host}": ("{module}", "{class_name}"),'
+        if len(line) > MAX_LINE_LENGTH:  # wrapped the way black formats it
+            line = (
+                f'    "{host}": (\n        "{module}",\n        "{class_name}",\n    ),'
+            )
+        lines.append(line)
+    lines.append("}")
+    return HEADER + "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the manifest of scrapers loaded lazily by recipe_scrapers",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if the manifest is out of date instead of writing it",
+    )
+
+    args = parser.parse_args()
+    content = render_manifest(build_manifest())
+    if args.check:
+        if MANIFEST_PATH.read_text() != content:
+            print(f"{MANIFEST_PATH} is out of date")
+            sys.exit(1)
+    else:
+        MANIFEST_PATH.write_text(content)
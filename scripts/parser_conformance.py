@@ -0,0 +1,109 @@
+import argparse
+import pathlib
+import warnings
+from collections import defaultdict
+
+from recipe_scrapers import SCRAPERS, scrape_html
+from recipe_scrapers._exceptions import StaticValueException
+from recipe_scrapers._utils import get_abstract_methods
+
+REFERENCE_PARSER = "html.parser"
+FIELDS = [field for field in get_abstract_methods() if field != "host"]
+
+
+def scrape_fields(html: str, host: str, parser: str) -> dict:
+    """Scrape every field of a test page using the given HTML parser.
+
+    Exceptions are recorded by type name so that they can be compared across
+    parsers just like regular values.
+
+    Args:
+        html (str): HTML of the test page.
+        host (str): Host the test page belongs to.
+        parser (str): BeautifulSoup tree builder to use.
+
+    Returns:
+        dict: Mapping of field name to scraped value.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            scraper = scrape_html(
+                html=html,
+                org_url=host,
+                supported_only=host in SCRAPERS,
+                parser=parser,
+            )
+        except Exception as e:
+            return {"scrape_html": f"raised {type(e).__name__}"}
+
+        results = {}
+        for field in FIELDS:
+            try:
+                results[field] = getattr(scraper, field)()
+            except StaticValueException as e:
+                results[field] = e.return_value
+            except Exception as e:
+                results[field] = f"raised {type(e).__name__}"
+        return results
+
+
+def check_conformance(test_data: pathlib.Path, parsers: list[str]) -> dict:
+    """Replay the test data with each parser and compare against the reference.
+
+    Args:
+        test_data (pathlib.Path): Directory containing the per-host test data.
+        parsers (list[str]): BeautifulSoup tree builders to check.
+
+    Returns:
+        dict: Mapping of parser to {test file: [fields that differ]}.
+    """
+    mismatches: dict[str, dict[str, list[str]]] = defaultdict(dict)
+    for testhtml in sorted(test_data.glob("*/*.testhtml")):
+        host = testhtml.parent.name
+        html = testhtml.read_text(encoding="utf-8")
+        expected = scrape_fields(html, host, REFERENCE_PARSER)
+        for parser in parsers:
+            actual = scrape_fields(html, host, parser)
+            differing = [
+                field
+                for field in expected.keys() | actual.keys()
+                if expected.get(field) != actual.get(field)
+            ]
+            if differing:
+                mismatches[parser][str(testhtml)] = sorted(differing)
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay the test data with alternative HTML parsers and report "
+            f"which scrapers give different output than '{REFERENCE_PARSER}'"
+        ),
+    )
+    parser.add_argument(
+        "parsers",
+        nargs="*",
+        default=["lxml"],
+        help="BeautifulSoup tree builders to check (default: lxml)",
+    )
+    parser.add_argument(
+        "--test-data",
+        default="tests/test_data",
+        help="Directory containing the test data (default: tests/test_data)",
+    )
+
+    args = parser.parse_args()
+    test_data = pathlib.Path(args.test_data)
+    total = len(list(test_data.glob("*/*.testhtml")))
+    mismatches = check_conformance(test_data, args.parsers)
+
+    for html_parser in args.parsers:
+        differing = mismatches.get(html_parser, {})
+        print(
+            f"{html_parser}: {total - len(differing)} of {total} test pages "
+            f"match '{REFERENCE_PARSER}'"
+        )
+        for testhtml, fields in differing.items():
+            print(f"  {testhtml}: {', '.join(fields)}")
@@ -0,0 +1,12 @@
+import pathlib
+
+# Recipe page shared by the library tests, scraped as an allrecipes.com page
+RECIPE_HTML = pathlib.Path(
+    "tests/test_data/recipe-scrapers.example/library.testhtml"
+).read_text()
+RECIPE_URL = "https://www.allrecipes.com/recipe/1/"
+
+
+def numbered_recipe_html(number: int) -> str:
+    """The recipe page, titled "Test Recipe <number>"."""
+    return RECIPE_HTML.replace("Test Recipe", f"Test Recipe {number}")
@@ -0,0 +1,183 @@
+import logging
+import unittest
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers._html_tree import SharedTreeBuilder, parse_html_tree
+from recipe_scrapers.plugins import exception_handling
+from recipe_scrapers.settings import settings
+
+from .recipe_page import RECIPE_HTML
+
+
+class TestLazyParsing(unittest.TestCase):
+
+    def test_construction_does_not_parse(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        for attribute in ("soup", "opengraph", "schema"):
+            with self.subTest(attribute):
+                self.assertNotIn(attribute, scraper.__dict__)
+
+    def test_schema_field_does_not_build_soup(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        self.assertEqual("Test Recipe", scraper.title())
+        self.assertIn("schema", scraper.__dict__)
+        self.assertNotIn("soup", scraper.__dict__)
+
+    def test_dom_field_does_not_extract_schema(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        self.assertEqual("en", scraper.language())
+        self.assertIn("soup", scraper.__dict__)
+        self.assertNotIn("schema", scraper.__dict__)
+
+    def test_parsed_attributes_are_memoized(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        self.assertIs(scraper.soup, scraper.soup)
+        self.assertIs(scraper.schema, scraper.schema)
+        self.assertIs(scraper.opengraph.soup, scraper.soup)
+
+
+class TestHTMLParser(unittest.TestCase):
+
+    def test_default_parser_from_settings(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        self.assertEqual("html.parser", scraper.html_parser)
+        self.assertEqual("html.parser", scraper.soup.builder.NAME)
+
+    def test_parser_argument(self):
+        scraper = scrape_html(
+            RECIPE_HTML, "https://www.allrecipes.com/recipe/1/", parser="lxml"
+        )
+        self.assertEqual("lxml", scraper.soup.builder.NAME)
+        self.assertEqual("en", scraper.language())
+
+    def test_parser_argument_for_unsupported_website(self):
+        scraper = scrape_html(
+            RECIPE_HTML,
+            "https://recipe-scrapers.example/recipe/1/",
+            supported_only=False,
+            parser="lxml",
+        )
+        self.assertEqual("lxml", scraper.soup.builder.NAME)
+
+    def test_shared_tree_parser(self):
+        scraper = scrape_html(
+            RECIPE_HTML, "https://www.allrecipes.com/recipe/1/", parser="lxml-shared"
+        )
+        self.assertIs(scraper.soup.builder.__class__, SharedTreeBuilder)
+        self.assertEqual("en", scraper.language())
+        self.assertEqual("Test Recipe", scraper.title())
+        self.assertEqual("Test Recipe", scraper.soup.find("h1").get_text())
+        self.assertEqual(["1 slice of bread", "5g margarine"], scraper.ingredients())
+
+    def test_shared_tree_parser_matches_lxml(self):
+        html = RECIPE_HTML.strip()
+        shared = BeautifulSoup(parse_html_tree(html), builder=SharedTreeBuilder())
+        self.assertEqual(str(BeautifulSoup(html, "lxml")), str(shared))
+
+    def test_shared_tree_parser_empty_page(self):
+        self.assertIsNone(parse_html_tree(""))
+        scraper = scrape_html("", "https://www.allrecipes.com/", parser="lxml-shared")
+        self.assertEqual({}, scraper.schema.data)
+        self.assertIsNone(scraper.soup.find("h1"))
+
+
+class TestPluginChain(unittest.TestCase):
+
+    def test_log_level_setting(self):
+        original = settings.LOG_LEVEL
+        plugin_logger = exception_handling.logger
+        try:
+            settings.LOG_LEVEL = logging.DEBUG
+            self.assertTrue(plugin_logger.isEnabledFor(logging.DEBUG))
+            settings.LOG_LEVEL = logging.WARNING
+            self.assertFalse(plugin_logger.isEnabledFor(logging.INFO))
+        finally:
+            settings.LOG_LEVEL = original
+
+    def test_plugins_attached_once(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        title = type(scraper).title
+        scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/2/")
+        self.assertIs(title, type(scraper).title)
+        self.assertEqual("Test Recipe", scraper.title())
+
+    def test_plugins_attached_again_after_settings_change(self):
+        url = "https://www.allrecipes.com/recipe/1/"
+        original = settings.SUPPRESS_EXCEPTIONS
+        try:
+            settings.SUPPRESS_EXCEPTIONS = False
+            with self.assertRaises(Exception):
+                scrape_html("<html></html>", url).title()
+
+            settings.SUPPRESS_EXCEPTIONS = True
+            self.assertIsNone(scrape_html("<html></html>", url).title())
+        finally:
+            settings.SUPPRESS_EXCEPTIONS = original
+        with self.assertRaises(Exception):
+            scrape_html("<html></html>", url).title()
+        self.assertEqual("Test Recipe", scrape_html(RECIPE_HTML, url).title())
+
+    def test_subclass_plugins_built_from_definitions(self):
+        from recipe_scrapers.aldisued import AldiSued
+        from recipe_scrapers.hofer import Hofer
+
+        settings.LOG_LEVEL
+        original = settings.SUPPRESS_EXCEPTIONS
+        try:
+            settings.SUPPRESS_EXCEPTIONS = True
+            AldiSued(html="<html></html>", url="https://www.aldi-sued.de/recipe/1/")
+
+            settings.SUPPRESS_EXCEPTIONS = False
+            hofer = Hofer(html="<html></html>", url="https://www.hofer.at/recipe/1/")
+            with self.assertRaises(Exception):
+                hofer.ratings()
+
+            settings.SUPPRESS_EXCEPTIONS = True
+            hofer = Hofer(html="<html></html>", url="https://www.hofer.at/recipe/1/")
+            self.assertIsNone(hofer.ratings())
+        finally:
+            settings.SUPPRESS_EXCEPTIONS = original
+        aldisued = AldiSued(html="<html></html>", url="https://www.aldi-sued.de/1/")
+        with self.assertRaises(Exception):
+            aldisued.ratings()
+
+
+class TestToJson(unittest.TestCase):
+
+    def setUp(self):
+        self.scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+
+    def test_selected_fields(self):
+        self.assertEqual(
+            {
+                "title": "Test Recipe",
+                "ingredients": ["1 slice of bread", "5g margarine"],
+            },
+            self.scraper.to_json(fields=["title", "ingredients"]),
+        )
+
+    def test_unknown_fields(self):
+        with self.assertRaises(ValueError):
+            self.scraper.to_json(fields=["title", "soup"])
+        with self.assertRaises(ValueError):
+            self.scraper.to_json(errors="warn")
+
+    def test_field_list_computed_once_per_class(self):
+        fields = type(self.scraper).json_fields()
+        self.assertIs(fields, type(self.scraper).json_fields())
+        self.assertIn("ingredient_groups", fields)
+        self.assertNotIn("to_json", fields)
+        self.assertLessEqual(set(self.scraper.to_json()), set(fields))
+
+    def test_errors(self):
+        fields = ["title", "cook_time"]
+        self.assertEqual({"title": "Test Recipe"}, self.scraper.to_json(fields=fields))
+
+        json_dict = self.scraper.to_json(fields=fields, errors="include")
+        self.assertEqual("Test Recipe", json_dict["title"])
+        self.assertEqual(["cook_time"], list(json_dict["errors"]))
+
+        with self.assertRaises(Exception):
+            self.scraper.to_json(fields=fields, errors="raise")
@@ -0,0 +1,94 @@
+import pickle
+import subprocess
+import sys
+import unittest
+
+from recipe_scrapers import SCRAPERS, scrape_html
+from recipe_scrapers._aliases import SCRAPER_ALIASES, SchemaAliasScraper
+from recipe_scrapers.plugins import NormalizeStringPlugin
+from recipe_scrapers.settings import settings
+
+from .recipe_page import RECIPE_HTML
+
+
+class UpperTitle(NormalizeStringPlugin):
+    run_on_hosts = ("seriouseats.com",)
+    run_on_methods = ("title",)
+
+    @classmethod
+    def run(cls, decorated):
+        return lambda self: decorated(self).upper()
+
+
+class TestSchemaAliasScraper(unittest.TestCase):
+
+    def test_alias_hosts_registered(self):
+        for class_name, host in SCRAPER_ALIASES.items():
+            with self.subTest(host):
+                scraper = SCRAPERS[host]
+                self.assertEqual(class_name, scraper.__name__)
+                self.assertEqual(host, scraper.host())
+                self.assertTrue(issubclass(scraper, SchemaAliasScraper))
+
+    def test_scrape(self):
+        scraper = scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        self.assertIs(SCRAPERS["allrecipes.com"], type(scraper))
+        self.assertEqual("allrecipes.com", scraper.host())
+        self.assertEqual("Test Recipe", scraper.title())
+        self.assertIs(type(scraper), pickle.loads(pickle.dumps(type(scraper))))
+
+    def test_plugins_shared(self):
+        scrape_html(RECIPE_HTML, "https://www.allrecipes.com/recipe/1/")
+        scrape_html(RECIPE_HTML, "https://www.seriouseats.com/recipe/1/")
+        for host in ("allrecipes.com", "seriouseats.com"):
+            self.assertNotIn("title", SCRAPERS[host].__dict__)
+        self.assertIn("title", SchemaAliasScraper.__dict__)
+
+    def test_host_specific_plugin(self):
+        # in a new interpreter, so that no alias scraper has its plugins attached yet
+        code = (
+            "from recipe_scrapers import SCRAPERS, scrape_html\n"
+            "from recipe_scrapers.plugins import NormalizeStringPlugin\n"
+            "from recipe_scrapers.settings import settings\n"
+            "class UpperTitle(NormalizeStringPlugin):\n"
+            "    run_on_hosts = ('seriouseats.com',)\n"
+            "    run_on_methods = ('title',)\n"
+            "    @classmethod\n"
+            "    def run(cls, decorated):\n"
+            "        return lambda self: decorated(self).upper()\n"
+            "settings.PLUGINS = (UpperTitle,) + tuple(settings.PLUGINS)\n"
+            f"html = {RECIPE_HTML!r}\n"
+            "print(scrape_html(html, 'https://www.seriouseats.com/1').title())\n"
+            "print(scrape_html(html, 'https://www.allrecipes.com/1').title())\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        )
+        self.assertEqual(["TEST RECIPE", "Test Recipe"], result.stdout.split("\n")[:2])
+
+    def test_host_specific_plugin_after_shared_chains(self):
+        allrecipes = "https://www.allrecipes.com/recipe/1/"
+        seriouseats = "https://www.seriouseats.com/recipe/1/"
+        settings.LOG_LEVEL
+        plugins, suppress = settings.PLUGINS, settings.SUPPRESS_EXCEPTIONS
+        try:
+            settings.SUPPRESS_EXCEPTIONS = True
+            scrape_html(RECIPE_HTML, seriouseats)
+            self.assertIsNone(scrape_html("<html></html>", seriouseats).ratings())
+
+            settings.PLUGINS = (UpperTitle,) + tuple(plugins)
+            settings.SUPPRESS_EXCEPTIONS = False
+            self.assertEqual(
+                "TEST RECIPE", scrape_html(RECIPE_HTML, seriouseats).title()
+            )
+            self.assertEqual(
+                "Test Recipe", scrape_html(RECIPE_HTML, allrecipes).title()
+            )
+            with self.assertRaises(Exception):
+                scrape_html("<html></html>", seriouseats).ratings()
+        finally:
+            settings.PLUGINS, settings.SUPPRESS_EXCEPTIONS = plugins, suppress
+
+        self.assertEqual("Test Recipe", scrape_html(RECIPE_HTML, seriouseats).title())
+        with self.assertRaises(Exception):
+            scrape_html("<html></html>", seriouseats).ratings()
@@ -0,0 +1,82 @@
+import asyncio
+import unittest
+
+from recipe_scrapers import AsyncFetcher, scrape_url, scrape_urls
+
+from .local_server import LocalServer
+from .recipe_page import numbered_recipe_html
+
+HTML_HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+
+
+def recipe_routes(count):
+    return {
+        f"/recipe/{number}/": (200, HTML_HEADERS, numbered_recipe_html(number))
+        for number in range(count)
+    }
+
+
+class TestAsyncScraping(unittest.TestCase):
+
+    def test_scrape_url(self):
+        with LocalServer(recipe_routes(1)) as server:
+            data = asyncio.run(
+                scrape_url(
+                    server.url("/recipe/0/"),
+                    fields=["title", "ingredients"],
+                    supported_only=False,
+                )
+            )
+        self.assertEqual(
+            {
+                "title": "Test Recipe 0",
+                "ingredients": ["1 slice of bread", "5g margarine"],
+            },
+            data,
+        )
+        self.assertIn("recipe-scrapers", server.requests[0][1]["User-Agent"])
+
+    def test_scrape_urls(self):
+        with LocalServer(recipe_routes(6), delay=0.05) as server:
+            urls = [server.url(f"/recipe/{number}/") for number in range(6)]
+            urls.append(server.url("/missing/"))
+
+            async def scrape():
+                async with AsyncFetcher(per_host_limit=2) as fetcher:
+                    return await scrape_urls(
+                        urls, fields=["title"], fetcher=fetcher, supported_only=False
+                    )
+
+            results = asyncio.run(scrape())
+
+        self.assertEqual(
+            [{"title": f"Test Recipe {number}"} for number in range(6)],
+            [result.data for result in results[:6]],
+        )
+        self.assertIsNone(results[6].data)
+        self.assertTrue(results[6].error.startswith("HTTPError"))
+        self.assertEqual(2, server.max_active)
+
+    def test_event_loop_not_blocked(self):
+        with LocalServer(recipe_routes(1), delay=0.2) as server:
+
+            async def scrape():
+                ticks = 0
+
+                async def tick():
+                    nonlocal ticks
+                    while True:
+                        ticks += 1
+                        await asyncio.sleep(0.01)
+
+                ticker = asyncio.create_task(tick())
+                data = await scrape_url(
+                    server.url("/recipe/0/"), fields=["title"], supported_only=False
+                )
+                ticker.cancel()
+                return data, ticks
+
+            data, ticks = asyncio.run(scrape())
+
+        self.assertEqual({"title": "Test Recipe 0"}, data)
+        self.assertGreater(ticks, 5)
@@ -0,0 +1,69 @@
+import unittest
+
+from recipe_scrapers import ScrapeResult, scrape_many
+
+from .recipe_page import numbered_recipe_html
+
+
+def recipe(number, host="www.allrecipes.com"):
+    return numbered_recipe_html(number), f"https://{host}/recipe/{number}/"
+
+
+class TestScrapeMany(unittest.TestCase):
+
+    def test_ordered(self):
+        hosts = ["www.allrecipes.com", "www.bbcgoodfood.com", "www.allrecipes.com"]
+        items = [recipe(number, hosts[number % 3]) for number in range(20)]
+        results = list(scrape_many(items, workers=2, fields=["title"], chunk_size=3))
+
+        self.assertEqual(list(range(20)), [result.index for result in results])
+        self.assertEqual(
+            [{"title": f"Test Recipe {number}"} for number in range(20)],
+            [result.data for result in results],
+        )
+
+    def test_unordered(self):
+        items = [recipe(number) for number in range(10)]
+        results = list(scrape_many(items, workers=2, ordered=False, chunk_size=2))
+
+        self.assertEqual(list(range(10)), sorted(result.index for result in results))
+        for result in results:
+            self.assertEqual(f"Test Recipe {result.index}", result.data["title"])
+            self.assertIsNone(result.error)
+
+    def test_errors(self):
+        items = [
+            recipe(0),
+            recipe(1, host="recipe-scrapers.example"),
+            recipe(2),
+        ]
+        results = list(scrape_many(items, workers=1, fields=["title", "cook_time"]))
+
+        self.assertEqual("Test Recipe 0", results[0].data["title"])
+        self.assertIn("cook_time", results[0].data["errors"])
+        self.assertEqual(
+            ScrapeResult(1, items[1][1], data=None, error=results[1].error),
+            results[1],
+        )
+        self.assertTrue(results[1].error.startswith("WebsiteNotImplementedError"))
+        self.assertEqual("Test Recipe 2", results[2].data["title"])
+
+    def test_scrape_html_options(self):
+        items = [recipe(0, host="recipe-scrapers.example")]
+        results = list(scrape_many(items, workers=1, supported_only=False))
+        self.assertEqual("Test Recipe 0", results[0].data["title"])
+
+    def test_bounded_in_flight(self):
+        consumed = 0
+
+        def items():
+            nonlocal consumed
+            for number in range(30):
+                consumed += 1
+                yield recipe(number)
+
+        yielded = 0
+        for _ in scrape_many(items(), workers=2, max_in_flight=4, chunk_size=2):
+            yielded += 1
+            self.assertLessEqual(consumed - yielded, 4)
+        self.assertEqual(30, yielded)
@@ -0,0 +1,250 @@
+import re
+import unittest
+from unittest import mock
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers._element_index import ElementIndex, IndexedSoup, selector_keys
+
+PAGE_HTML = """
+<html lang="en">
+<head>
+<meta property="og:title" content="Lentil Soup" />
+<meta name="description" content="A warming soup" />
+</head>
+<body>
+<div id="recipe" class="recipe card" itemscope>
+  <h1 itemprop="name">Lentil Soup</h1>
+  <div class="ingredients">
+    <h4 class="group-name">For the soup</h4>
+    <ul>
+      <li class="ingredient" itemprop="recipeIngredient">1 cup lentils</li>
+      <li class="ingredient optional" itemprop="recipeIngredient">1 onion</li>
+    </ul>
+    <h4 class="group-name">To serve</h4>
+    <ul>
+      <li class="ingredient" itemprop="recipeIngredient">Parsley</li>
+    </ul>
+  </div>
+  <div class="Ingredient">Not an ingredient</div>
+  <ol class="instructions">
+    <li class="step"><span itemprop="text">Simmer the lentils</span></li>
+    <li class="step"><a href="/tips">Tips</a></li>
+  </ol>
+</div>
+<p class="ingredient">Outside the recipe</p>
+</body>
+</html>
+"""
+
+FIND_QUERIES = [
+    (("li",), {}),
+    (("LI",), {}),
+    (("div",), {"class_": "ingredients"}),
+    (("li", "ingredient"), {}),
+    ((), {"class_": "ingredient"}),
+    ((), {"class_": "ingredient optional"}),
+    ((), {"class_": "optional ingredient"}),
+    ((), {"attrs": {"class": "Ingredient"}}),
+    ((), {"id": "recipe"}),
+    ((), {"id": "missing"}),
+    ((), {"itemprop": "recipeIngredient"}),
+    (("meta",), {"property": "og:title", "content": True}),
+    (("meta",), {"attrs": {"name": "description"}}),
+    ((), {"class_": True}),
+    ((), {"itemprop": True}),
+    ((["h1", "h4"],), {}),
+    ((("ul", "ol"),), {"class_": "instructions"}),
+    (("a",), {"href": True}),
+    (("a",), {"href": "/tips"}),
+]
+
+SELECTORS = [
+    "li",
+    "LI",
+    "li.ingredient",
+    ".ingredient",
+    ".ingredient.optional",
+    "#recipe",
+    "div#recipe.card",
+    "[itemprop=recipeIngredient]",
+    '[itemprop="recipeIngredient"]',
+    "li[itemprop='recipeIngredient'][class]",
+    ".ingredients h4",
+    ".ingredients > ul > li",
+    "h4 + ul li",
+    "h1 ~ div",
+    ".ingredients h4, .ingredient",
+    ".step, h1, .group-name",
+    'meta[property="og:title"]',
+    "*.step",
+]
+
+
+def positions(tags):
+    return [(tag.name, tag.sourceline, tag.sourcepos) for tag in tags]
+
+
+class TestElementIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.soup = BeautifulSoup(PAGE_HTML, "html.parser")
+        self.indexed = IndexedSoup(PAGE_HTML, "html.parser")
+
+    def test_find_matches_scan(self):
+        for args, kwargs in FIND_QUERIES:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(
+                    positions(self.soup.find_all(*args, **kwargs)),
+                    positions(self.indexed.find_all(*args, **kwargs)),
+                )
+                expected = self.soup.find(*args, **kwargs)
+                actual = self.indexed.find(*args, **kwargs)
+                self.assertEqual(
+                    positions([expected] if expected else []),
+                    positions([actual] if actual else []),
+                )
+
+    def test_select_matches_scan(self):
+        for selector in SELECTORS:
+            with self.subTest(selector=selector):
+                self.assertIsNotNone(selector_keys(selector))
+                self.assertEqual(
+                    positions(self.soup.select(selector)),
+                    positions(self.indexed.select(selector)),
+                )
+                self.assertEqual(
+                    positions([self.soup.select_one(selector)]),
+                    positions([self.indexed.select_one(selector)]),
+                )
+
+    def test_limit(self):
+        self.assertEqual(
+            positions(self.soup.find_all("li", limit=2)),
+            positions(self.indexed.find_all("li", limit=2)),
+        )
+        self.assertEqual(
+            positions(self.soup.select("li", limit=2)),
+            positions(self.indexed.select("li", limit=2)),
+        )
+
+    def test_lookups_use_index(self):
+        self.indexed.element_index
+        with (
+            mock.patch.object(BeautifulSoup, "find_all", side_effect=AssertionError),
+            mock.patch.object(BeautifulSoup, "select", side_effect=AssertionError),
+        ):
+            self.assertEqual(4, len(self.indexed.find_all(class_="ingredient")))
+            self.assertEqual(2, len(self.indexed.select(".ingredients h4")))
+
+    def test_other_lookups_scan(self):
+        for args, kwargs in [
+            (("li",), {"string": "Parsley"}),
+            ((re.compile("^h[14]$"),), {}),
+            (("li",), {"class_": re.compile("ingred")}),
+            (("li",), {"class_": lambda value: value == "step"}),
+            (("html",), {"recursive": False}),
+            ((), {"href": True}),
+            ((), {}),
+        ]:
+            with self.subTest(args=args, kwargs=kwargs):
+                self.assertEqual(
+                    positions(self.soup.find_all(*args, **kwargs)),
+                    positions(self.indexed.find_all(*args, **kwargs)),
+                )
+        for selector in [
+            "li:first-child",
+            "[href]",
+            "a[href^='/']",
+            "ul > li:nth-of-type(2)",
+        ]:
+            with self.subTest(selector=selector):
+                self.assertEqual(
+                    positions(self.soup.select(selector)),
+                    positions(self.indexed.select(selector)),
+                )
+
+    def test_selector_keys(self):
+        self.assertEqual([[("name", "li"), ("class", "x")]], selector_keys("li.x"))
+        self.assertEqual(
+            [[("name", "h4")], [("class", "ingredient")]],
+            selector_keys(".ingredients h4, .ingredient"),
+        )
+        self.assertEqual([[("itemprop", "name")]], selector_keys("[itemprop=name]"))
+        for selector in ["", "[href]", "a:hover", ".a\\:b", "[itemprop=name i]", "> a"]:
+            with self.subTest(selector=selector):
+                self.assertIsNone(selector_keys(selector))
+
+    def test_invalid_selector(self):
+        with self.assertRaises(soupsieve.SelectorSyntaxError):
+            self.indexed.select(".1x")
+
+    def test_removed_tags_are_skipped(self):
+        self.indexed.element_index
+        self.indexed.find("li", class_="optional").decompose()
+        self.indexed.find("h4").extract()
+        self.indexed.find(id="recipe").find("h1").replace_with("Title")
+        self.soup.find("li", class_="optional").decompose()
+        self.soup.find("h4").extract()
+        self.soup.find(id="recipe").find("h1").replace_with("Title")
+
+        self.assertEqual(
+            positions(self.soup.find_all(class_="ingredient")),
+            positions(self.indexed.find_all(class_="ingredient")),
+        )
+        for selector in ["li", ".ingredient", "h4", "h1", "[itemprop=name]"]:
+            with self.subTest(selector=selector):
+                self.assertEqual(
+                    positions(self.soup.select(selector)),
+                    positions(self.indexed.select(selector)),
+                )
+
+    def test_reindex(self):
+        self.indexed.element_index
+        tag = self.indexed.new_tag("li", attrs={"class": "ingredient"})
+        self.indexed.find("ul").append(tag)
+        self.assertNotIn(tag, self.indexed.find_all("li"))
+
+        self.indexed.reindex()
+        self.assertIn(tag, self.indexed.find_all("li"))
+        self.assertEqual(
+            self.indexed.find_all(class_="ingredient"),
+            self.indexed.select(".ingredient"),
+        )
+
+    def test_index_keys(self):
+        index = ElementIndex(BeautifulSoup(PAGE_HTML, "html.parser"))
+        self.assertEqual(
+            ["1 onion"],
+            [tag.get_text() for tag in index.candidates([[("class", "optional")]])],
+        )
+        self.assertEqual(
+            ["Not an ingredient"],
+            [tag.get_text() for tag in index.candidates([[("class", "Ingredient")]])],
+        )
+        self.assertEqual([], index.candidates([[("id", "missing")]]))
+
+
+class TestScraperElementIndex(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        scraper = scrape_html(PAGE_HTML, "https://www.allrecipes.com/recipe/1/")
+        self.assertFalse(scraper.element_index)
+        self.assertNotIsInstance(scraper.soup, IndexedSoup)
+
+    def test_element_index_argument(self):
+        for parser in ("html.parser", "lxml", "lxml-shared"):
+            with self.subTest(parser=parser):
+                scraper = scrape_html(
+                    PAGE_HTML,
+                    "https://www.allrecipes.com/recipe/1/",
+                    parser=parser,
+                    element_index=True,
+                )
+                self.assertIsInstance(scraper.soup, IndexedSoup)
+                self.assertEqual(
+                    "Lentil Soup", scraper.soup.find(itemprop="name").get_text()
+                )
+                self.assertEqual("en", scraper.language())
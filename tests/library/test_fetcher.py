@@ -0,0 +1,109 @@
+import gzip
+import unittest
+
+import requests
+
+from recipe_scrapers import Fetcher, WebsiteNotImplementedError, scrape_html, scrape_me
+from recipe_scrapers._fetcher import ResponseTooLarge
+
+from .local_server import LocalServer
+
+RECIPE_HTML = """
+<html>
+<head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Recipe", "name": "Crème brûlée"}
+</script>
+</head>
+</html>
+"""
+
+
+class TestFetcher(unittest.TestCase):
+
+    def test_connections_reused(self):
+        routes = {"/recipe/": (200, {}, RECIPE_HTML)}
+        with LocalServer(routes) as server, Fetcher() as fetcher:
+            for _ in range(5):
+                self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/recipe/")))
+        self.assertEqual(5, len(server.requests))
+        self.assertEqual(1, len(server.clients))
+
+    def test_compressed_response(self):
+        headers = {"Content-Encoding": "gzip"}
+        routes = {"/recipe/": (200, headers, gzip.compress(RECIPE_HTML.encode()))}
+        with LocalServer(routes) as server, Fetcher() as fetcher:
+            self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/recipe/")))
+        self.assertIn("gzip", server.requests[0][1]["Accept-Encoding"])
+
+    def test_encoding(self):
+        latin_html = RECIPE_HTML.encode("latin-1")
+        declared_html = '<meta charset="latin-1">' + RECIPE_HTML
+        routes = {
+            "/header/": (
+                200,
+                {"Content-Type": "text/html; charset=latin-1"},
+                latin_html,
+            ),
+            "/declared/": (200, {}, declared_html.encode("latin-1")),
+            "/undeclared/": (200, {}, RECIPE_HTML.encode("utf-8")),
+        }
+        with LocalServer(routes) as server, Fetcher() as fetcher:
+            self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/header/")))
+            self.assertEqual(declared_html, fetcher.fetch(server.url("/declared/")))
+            self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/undeclared/")))
+
+    def test_retries(self):
+        attempts = []
+
+        def flaky(handler):
+            attempts.append(handler.path)
+            if len(attempts) < 3:
+                return 503, {}, "unavailable"
+            return 200, {}, RECIPE_HTML
+
+        routes = {"/recipe/": (200, {}, flaky)}
+        with LocalServer(routes) as server:
+            with Fetcher(retries=2, backoff=0) as fetcher:
+                self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/recipe/")))
+
+            attempts.clear()
+            with Fetcher(retries=1, backoff=0) as fetcher:
+                with self.assertRaises(requests.HTTPError):
+                    fetcher.fetch(server.url("/recipe/"))
+
+    def test_timeout(self):
+        routes = {"/recipe/": (200, {}, RECIPE_HTML)}
+        with LocalServer(routes, delay=0.5) as server:
+            with Fetcher(timeout=0.1, retries=0) as fetcher:
+                with self.assertRaises(requests.RequestException):
+                    fetcher.fetch(server.url("/recipe/"))
+
+    def test_size_limit(self):
+        large_html = RECIPE_HTML + " " * 5000
+        routes = {
+            "/large/": (200, {}, large_html),
+            "/compressed/": (
+                200,
+                {"Content-Encoding": "gzip"},
+                gzip.compress(large_html.encode()),
+            ),
+        }
+        with LocalServer(routes) as server, Fetcher(max_bytes=1000) as fetcher:
+            for path in routes:
+                with self.subTest(path):
+                    with self.assertRaises(ResponseTooLarge):
+                        fetcher.fetch(server.url(path))
+
+    def test_scrape_with_fetcher(self):
+        routes = {"/recipe/": (200, {}, RECIPE_HTML)}
+        with LocalServer(routes) as server, Fetcher() as fetcher:
+            url = server.url("/recipe/")
+            scraper = scrape_html(
+                None, url, online=True, supported_only=False, fetcher=fetcher
+            )
+            self.assertEqual("Crème brûlée", scraper.title())
+
+            with self.assertRaises(WebsiteNotImplementedError):
+                scrape_me(url, fetcher=fetcher)
+        self.assertEqual(2, len(server.requests))
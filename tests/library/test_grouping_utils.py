@@ -1,6 +1,20 @@
+import itertools
+import random
 import unittest
+from unittest import mock
 
-from recipe_scrapers._grouping_utils import best_match, score_sentence_similarity
+from bs4 import BeautifulSoup
+
+from recipe_scrapers._grouping_utils import (
+    IngredientGroup,
+    IngredientMatcher,
+    SoupIndex,
+    _assign,
+    best_match,
+    detect_grouping,
+    group_ingredients,
+    score_sentence_similarity,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -66,3 +80,116 @@ class TestUtils(unittest.TestCase):
     def test_best_match_raises_error_with_empty_list(self):
         with self.assertRaises(ValueError):
             best_match("any string", [])
+
+    def test_assign_is_optimal(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            rows = rng.randint(0, 4)
+            columns = rng.randint(rows, 5)
+            scores = [[rng.random() for _ in range(columns)] for _ in range(rows)]
+            assignment = _assign(scores)
+            self.assertEqual(rows, len(set(assignment)))
+            best_total = max(
+                sum(scores[row][column] for row, column in enumerate(permutation))
+                for permutation in itertools.permutations(range(columns), rows)
+            )
+            total = sum(scores[row][column] for row, column in enumerate(assignment))
+            self.assertAlmostEqual(best_total, total)
+
+    def test_matcher_assigns_each_ingredient_once(self):
+        matcher = IngredientMatcher(["1 cup sugar", "1 cup brown sugar", "salt"])
+        # both texts are closest to "1 cup sugar" on their own
+        texts = ["1 cup sugar", "1 cup sugar, packed", "salt"]
+        self.assertEqual(
+            ["1 cup sugar", "1 cup brown sugar", "salt"], matcher.assign(texts)
+        )
+        self.assertEqual(
+            ["½ cup milk"], IngredientMatcher(["½ cup milk"]).assign(["1/2 cup milk"])
+        )
+
+    def test_group_ingredients(self):
+        html = """
+            <div class="wprm-recipe-ingredients">
+                <li class="wprm-recipe-ingredient">1 egg</li>
+                <div class="wprm-recipe-ingredient-group"><h4>For the glaze</h4>
+                    <li class="wprm-recipe-ingredient">1 cup icing sugar</li>
+                    <li class="wprm-recipe-ingredient">2 tbsp milk</li>
+                </div>
+            </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        ingredients = ["1 egg", "1 cup icing sugar", "2 tablespoons milk"]
+        self.assertEqual(
+            [
+                IngredientGroup(ingredients=["1 egg"], purpose=None),
+                IngredientGroup(
+                    ingredients=["1 cup icing sugar", "2 tablespoons milk"],
+                    purpose="For the glaze",
+                ),
+            ],
+            group_ingredients(ingredients, soup),
+        )
+
+    def test_soup_index(self):
+        soup = BeautifulSoup('<div class="Card x"><h4>A</h4></div>', "html.parser")
+        index = SoupIndex(soup)
+        self.assertEqual({"card", "x"}, index.class_names)
+        self.assertTrue(index.may_match(".card h4"))
+        self.assertFalse(index.may_match(".wprm-recipe-group-name"))
+        self.assertTrue(index.may_match(":not(.missing)"))
+        self.assertIs(index.select("h4"), index.select("h4"))
+
+    def test_soup_index_merge(self):
+        html = "<div><h4>A</h4><p>1</p><h4 class='x'>B</h4><p class='x'>2</p></div>"
+        index = SoupIndex(BeautifulSoup(html, "html.parser"))
+        for selectors in (["h4", "p"], ["p", "h4"], ["h4", ".x"], [".x", "p"]):
+            with self.subTest(selectors=selectors):
+                self.assertEqual(
+                    index.soup.select(", ".join(selectors)),
+                    index.merge(*[index.select(s) for s in selectors]),
+                )
+
+    def test_group_ingredients_selects_each_selector_once(self):
+        html = """
+            <h4>For the cake</h4><ul><li>1 egg</li></ul>
+            <h4>For the glaze</h4><ul><li>1 cup icing sugar</li></ul>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        with mock.patch.object(
+            BeautifulSoup, "select", autospec=True, side_effect=BeautifulSoup.select
+        ) as select:
+            groups = group_ingredients(["1 egg", "1 cup icing sugar"], soup, "h4", "li")
+        self.assertEqual(
+            [
+                IngredientGroup(ingredients=["1 egg"], purpose="For the cake"),
+                IngredientGroup(
+                    ingredients=["1 cup icing sugar"], purpose="For the glaze"
+                ),
+            ],
+            groups,
+        )
+        self.assertEqual(
+            ["h4", "li"], sorted(call.args[1] for call in select.call_args_list)
+        )
+
+    def test_detect_grouping(self):
+        html = """
+            <div class="tasty-recipes-ingredients">
+                <h4>For the dough</h4><ul><li>2 cups flour</li></ul>
+            </div>
+        """
+        index = SoupIndex(BeautifulSoup(html, "html.parser"))
+        self.assertEqual(
+            (".tasty-recipes-ingredients h4", ".tasty-recipes-ingredients ul li"),
+            detect_grouping(index),
+        )
+
+    def test_detect_grouping_without_plugin_classes(self):
+        soup = BeautifulSoup("<ul><li>1 egg</li></ul>", "html.parser")
+        with mock.patch.object(BeautifulSoup, "select") as select:
+            self.assertIsNone(detect_grouping(SoupIndex(soup)))
+            self.assertEqual(
+                [IngredientGroup(ingredients=["1 egg"])],
+                group_ingredients(["1 egg"], soup),
+            )
+        select.assert_not_called()
@@ -0,0 +1,152 @@
+import unittest
+from collections import OrderedDict
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers._exceptions import OpenGraphException
+from recipe_scrapers._head_metadata import HeadMetadata
+from recipe_scrapers._opengraph import OpenGraph
+from recipe_scrapers.plugins.best_image import BestImagePlugin
+
+PAGE_HTML = """
+<html>
+<head>
+<meta name="og:site_name" content="Named Site" />
+<meta property="og:site_name" content="Recipe Site" />
+<meta property="og:image" />
+<meta property="og:image" content="https://example.com/small.jpg" />
+<meta property="og:image:width" content="300" />
+<meta property="og:image:height" content="200px" />
+<meta name="twitter:image" content="https://example.com/large.jpg" />
+<meta property="og:image" content="https://example.com/large.jpg" />
+<meta property="og:image:width" content="1200" />
+<meta property="og:image:width" content="800" />
+<meta HTTP-EQUIV="Content-Language" content="fr,en" />
+<link rel="stylesheet" href="/style.css" />
+<link rel="canonical" />
+<link rel="canonical alternate" href="/recipe/1/" />
+</head>
+<body>
+<meta property="og:title" content="Out of head" />
+</body>
+</html>
+"""
+
+
+class TestHeadMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.soup = BeautifulSoup(PAGE_HTML, "html.parser")
+        self.metadata = HeadMetadata(self.soup)
+
+    def test_meta(self):
+        self.assertEqual(
+            ["Recipe Site"],
+            [tag["content"] for tag in self.metadata.meta("property", "og:site_name")],
+        )
+        self.assertEqual([], self.metadata.meta("property", "og:description"))
+        self.assertEqual(
+            ["og:image:width"] * 3,
+            [
+                tag["property"]
+                for tag in self.metadata.meta("property", "og:image:width")
+            ],
+        )
+
+    def test_content(self):
+        self.assertEqual(
+            "https://example.com/small.jpg",
+            self.metadata.content("property", "og:image"),
+        )
+        self.assertEqual("Out of head", self.metadata.content("property", "og:title"))
+        self.assertEqual(
+            "fr,en", self.metadata.content("http-equiv", "content-language")
+        )
+        self.assertIsNone(self.metadata.content("name", "description"))
+
+    def test_links(self):
+        self.assertEqual("/recipe/1/", self.metadata.link_href("canonical"))
+        self.assertEqual(2, len(self.metadata.links("canonical")))
+        self.assertEqual(1, len(self.metadata.links("canonical alternate")))
+        self.assertIsNone(self.metadata.link_href("icon"))
+
+    def test_images(self):
+        self.assertEqual(
+            [
+                {
+                    "url": "https://example.com/small.jpg",
+                    "width": 300,
+                    "height": 200,
+                    "sources": {"opengraph"},
+                },
+                {
+                    "url": "https://example.com/large.jpg",
+                    "width": 1200,
+                    "height": None,
+                    "sources": {"opengraph", "twitter"},
+                },
+            ],
+            self.metadata.images,
+        )
+
+    def test_matches_find(self):
+        for attrs in (
+            {"property": "og:site_name"},
+            {"name": "og:site_name"},
+            {"property": "og:image", "content": True},
+        ):
+            with self.subTest(attrs=attrs):
+                self.assertEqual(
+                    self.soup.find_all("meta", attrs),
+                    [
+                        tag
+                        for tag in self.metadata.meta(*list(attrs.items())[0])
+                        if all(tag.get(key) is not None for key in attrs)
+                    ],
+                )
+
+    def test_opengraph(self):
+        opengraph = OpenGraph(self.soup, self.metadata)
+        self.assertEqual("Recipe Site", opengraph.site_name())
+        self.assertEqual("https://example.com/small.jpg", opengraph.image())
+
+        opengraph = OpenGraph(BeautifulSoup("<html></html>", "html.parser"))
+        with self.assertRaises(OpenGraphException):
+            opengraph.site_name()
+        with self.assertRaises(OpenGraphException):
+            opengraph.image()
+
+    def test_best_image_candidates(self):
+        scraper = mock.Mock(head_metadata=self.metadata)
+        candidates = OrderedDict()
+        BestImagePlugin._collect_meta_image_candidates(
+            scraper, candidates, "https://example.com/"
+        )
+        self.assertEqual(
+            [
+                ("https://example.com/small.jpg", 300, 200, {"opengraph"}),
+                ("https://example.com/large.jpg", 1200, None, {"opengraph", "twitter"}),
+            ],
+            [
+                (c["url"], c["width"], c["height"], c["sources"])
+                for c in candidates.values()
+            ],
+        )
+
+
+class TestScraperHeadMetadata(unittest.TestCase):
+
+    def test_lookups_share_one_traversal(self):
+        scraper = scrape_html(PAGE_HTML, "https://www.allrecipes.com/recipe/1/")
+        with mock.patch(
+            "recipe_scrapers._abstract.HeadMetadata", wraps=HeadMetadata
+        ) as head_metadata:
+            self.assertEqual("fr", scraper.language())
+            self.assertEqual(
+                "https://www.allrecipes.com/recipe/1/", scraper.canonical_url()
+            )
+            self.assertEqual("Recipe Site", scraper.opengraph.site_name())
+            self.assertIs(scraper.head_metadata, scraper.opengraph.metadata)
+        head_metadata.assert_called_once_with(scraper.soup)
@@ -0,0 +1,124 @@
+import tempfile
+import unittest
+
+from recipe_scrapers import Fetcher, HTTPCache
+
+from .local_server import LocalServer
+
+RECIPE_HTML = "<html><head><title>Test Recipe</title></head></html>"
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+def conditional(handler):
+    if handler.headers.get("If-None-Match") == ETAG:
+        return 304, {"ETag": ETAG}, b""
+    headers = {"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+    return 200, headers, RECIPE_HTML
+
+
+class TestHTTPCache(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+
+    def cache(self, **kwargs):
+        cache = HTTPCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_fresh_response_served_from_cache(self):
+        routes = {"/recipe/": (200, {}, RECIPE_HTML)}
+        with LocalServer(routes) as server:
+            with Fetcher(cache=self.cache()) as fetcher:
+                for _ in range(3):
+                    self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/recipe/")))
+
+            with Fetcher(cache=self.cache()) as fetcher:
+                self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/recipe/")))
+
+        self.assertEqual(1, len(server.requests))
+
+    def test_expired_response_revalidated(self):
+        routes = {"/recipe/": (200, {}, conditional)}
+        with LocalServer(routes) as server:
+            with Fetcher(cache=self.cache(ttl=0)) as fetcher:
+                for _ in range(3):
+                    self.assertEqual(RECIPE_HTML, fetcher.fetch(server.url("/recipe/")))
+
+        self.assertEqual(3, len(server.requests))
+        self.assertNotIn("If-None-Match", server.requests[0][1])
+        for _, headers in server.requests[1:]:
+            self.assertEqual(ETAG, headers["If-None-Match"])
+            self.assertEqual(LAST_MODIFIED, headers["If-Modified-Since"])
+
+    def test_revalidation_updates_validators(self):
+        cache = self.cache(ttl=0)
+        new_last_modified = "Thu, 22 Oct 2015 07:28:00 GMT"
+
+        def rotating(handler):
+            if handler.headers.get("If-None-Match") in (ETAG, '"v2"'):
+                return 304, {"ETag": '"v2"', "Last-Modified": new_last_modified}, b""
+            return conditional(handler)
+
+        routes = {"/recipe/": (200, {}, rotating)}
+        with LocalServer(routes) as server, Fetcher(cache=cache) as fetcher:
+            url = server.url("/recipe/")
+            for _ in range(3):
+                self.assertEqual(RECIPE_HTML, fetcher.fetch(url))
+
+        self.assertEqual(ETAG, server.requests[1][1]["If-None-Match"])
+        self.assertEqual('"v2"', server.requests[2][1]["If-None-Match"])
+        self.assertEqual(new_last_modified, server.requests[2][1]["If-Modified-Since"])
+        self.assertEqual('"v2"', cache.get(url).etag)
+        self.assertEqual(new_last_modified, cache.get(url).last_modified)
+
+    def test_revalidation_keeps_validators_not_sent(self):
+        cache = self.cache()
+        cache.store("https://example.com/", b"", etag=ETAG, last_modified=LAST_MODIFIED)
+        cache.revalidated("https://example.com/", etag='"v2"')
+
+        cached = cache.get("https://example.com/")
+        self.assertEqual('"v2"', cached.etag)
+        self.assertEqual(LAST_MODIFIED, cached.last_modified)
+
+    def test_changed_response_replaced(self):
+        cache = self.cache(ttl=0)
+        routes = {"/recipe/": (200, {}, RECIPE_HTML)}
+        with LocalServer(routes) as server, Fetcher(cache=cache) as fetcher:
+            url = server.url("/recipe/")
+            fetcher.fetch(url)
+            server.routes["/recipe/"] = (200, {}, "<html>updated</html>")
+            self.assertEqual("<html>updated</html>", fetcher.fetch(url))
+
+        self.assertEqual(b"<html>updated</html>", cache.get(url).content)
+        self.assertEqual(len(b"<html>updated</html>"), cache.size())
+
+    def test_identical_content_stored_once(self):
+        cache = self.cache()
+        cache.store("https://recipe-scrapers.example/1", b"x" * 100)
+        cache.store("https://recipe-scrapers.example/2", b"x" * 100)
+        self.assertEqual(100, cache.size())
+
+    def test_least_recently_used_evicted(self):
+        cache = self.cache(max_size=250)
+        for number in range(3):
+            cache.store(
+                f"https://recipe-scrapers.example/{number}", bytes([number]) * 100
+            )
+        self.assertIsNone(cache.get("https://recipe-scrapers.example/0"))
+
+        cache.get("https://recipe-scrapers.example/1")
+        cache.store("https://recipe-scrapers.example/3", b"3" * 100)
+        self.assertIsNotNone(cache.get("https://recipe-scrapers.example/1"))
+        self.assertIsNone(cache.get("https://recipe-scrapers.example/2"))
+        self.assertEqual(200, cache.size())
+
+    def test_clear(self):
+        cache = self.cache()
+        cache.store("https://recipe-scrapers.example/1", b"x" * 100)
+        cache.clear()
+        self.assertIsNone(cache.get("https://recipe-scrapers.example/1"))
+        self.assertEqual(0, cache.size())
@@ -59,7 +59,7 @@ class TestMainMethods(unittest.TestCase):
             scraper_exists_for("https://eatsmarter.de/rezepte/gruenkohl-kokos-suppe")
         )
 
-    @mock.patch("recipe_scrapers.requests.get")
+    @mock.patch("recipe_scrapers._fetcher.Fetcher.fetch")
     def test_offline_no_html_retrieval(self, mock_get):
         with self.assertRaises(ValueError):
             scrape_html(
@@ -71,13 +71,12 @@ class TestMainMethods(unittest.TestCase):
 
         assert not mock_get.called
 
-    @mock.patch("recipe_scrapers.requests.get")
+    @mock.patch("recipe_scrapers._fetcher.Fetcher.fetch")
     def test_online_mode_html_retrieval(self, mock_get):
         recipe_html = pathlib.Path(
             "tests/test_data/recipe-scrapers.example/online.testhtml"
         )
-        mock_get.return_value = mock.MagicMock()
-        mock_get.return_value.text = recipe_html.read_text()
+        mock_get.return_value = recipe_html.read_text()
 
         with catch_warnings(record=True) as ws:
             simplefilter("always", category=DeprecationWarning)
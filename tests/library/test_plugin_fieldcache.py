@@ -0,0 +1,85 @@
+import unittest
+from unittest import mock
+
+from recipe_scrapers import scrape_html
+from recipe_scrapers.plugins import FieldCachePlugin
+from recipe_scrapers.settings import settings
+
+from .recipe_page import RECIPE_HTML, RECIPE_URL
+
+
+class TestFieldCachePlugin(unittest.TestCase):
+
+    def test_fields_computed_once(self):
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, cache_fields=True)
+        with mock.patch.object(
+            scraper.schema, "ingredients", wraps=scraper.schema.ingredients
+        ) as ingredients:
+            scraper.ingredients()
+            scraper.ingredient_groups()
+            scraper.to_json()
+
+        self.assertEqual(1, ingredients.call_count)
+        self.assertEqual(scraper.ingredients(), scraper.ingredients())
+
+    def test_cached_values_are_copies(self):
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, cache_fields=True)
+        scraper.ingredients().append("1 egg")
+        scraper.ingredient_groups()[0].ingredients.clear()
+
+        self.assertEqual(["1 slice of bread", "5g margarine"], scraper.ingredients())
+        self.assertEqual(
+            ["1 slice of bread", "5g margarine"],
+            scraper.ingredient_groups()[0].ingredients,
+        )
+
+    def test_disabled_by_default(self):
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL)
+        with mock.patch.object(
+            scraper.schema, "ingredients", wraps=scraper.schema.ingredients
+        ) as ingredients:
+            scraper.ingredients()
+            scraper.ingredients()
+
+        self.assertEqual(2, ingredients.call_count)
+
+    def test_not_attached_when_disabled(self):
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL)
+        scraper.ingredients()
+        self.assertNotIn("ingredients", vars(scraper))
+        self.assertNotIn("_field_cache", vars(scraper))
+
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, cache_fields=True)
+        self.assertIn("ingredients", vars(scraper))
+
+    def test_setting(self):
+        original = settings.CACHE_FIELDS
+        try:
+            settings.CACHE_FIELDS = True
+            scraper = scrape_html(RECIPE_HTML, RECIPE_URL)
+            self.assertTrue(scraper.cache_fields)
+            self.assertFalse(
+                scrape_html(RECIPE_HTML, RECIPE_URL, cache_fields=False).cache_fields
+            )
+        finally:
+            settings.CACHE_FIELDS = original
+
+    def test_invalidate(self):
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, cache_fields=True)
+        self.assertEqual("Test Recipe", scraper.title())
+        self.assertEqual(
+            ["spread the margarine", "on the bread"], scraper.instructions_list()
+        )
+
+        scraper.schema.data["name"] = "Updated Recipe"
+        scraper.schema.data["recipeInstructions"] = ["toast the bread"]
+        self.assertEqual("Test Recipe", scraper.title())
+
+        FieldCachePlugin.invalidate(scraper, "title")
+        self.assertEqual("Updated Recipe", scraper.title())
+        self.assertEqual(
+            ["spread the margarine", "on the bread"], scraper.instructions_list()
+        )
+
+        FieldCachePlugin.invalidate(scraper)
+        self.assertEqual(["toast the bread"], scraper.instructions_list())
@@ -1,6 +1,7 @@
 import unittest
 
 from recipe_scrapers.plugins import HTMLTagStripperPlugin
+from recipe_scrapers.plugins.html_tags_stripper import strip_tags, stripper
 
 
 class TestHTMLTagStripperPlugin(unittest.TestCase):
@@ -104,3 +105,30 @@ class TestHTMLTagStripperPlugin(unittest.TestCase):
             "Sticky Pomegranate & Black Pepper Chicken Wing",
             "Result must have html tags stripped when invoked after plugin used",
         )
+
+    def test_stripper_matches_parser(self):
+        def parser_stripper(string):
+            string = strip_tags(f"<tag>{string}<tag>")
+            return strip_tags(f"<tag>{string}<tag>")
+
+        cases = [
+            "plain text",
+            "Salt &amp;amp; pepper",
+            "&lt;b&gt;escaped&lt;/b&gt; tags",
+            "<a href=\"/x?a=1&amp;b=2\" class='link'>link</a> &copy;",
+            'line<br/>break<BR >and<img src=x alt="">image',
+            "&am<b>p;",
+            "a < b and c > d",
+            "unclosed <b",
+            "<!-- comment -->text",
+            "<script>var x = '&amp;';</script>after",
+            "<style>p > b {}</style>styled",
+            "<title>&amp;</title>",
+            '<p data-x="a > b">quoted bracket</p>',
+            "</p >end tag",
+            "<? processing ?>instruction",
+            "trailing &",
+        ]
+        for string in cases:
+            with self.subTest(string=string):
+                self.assertEqual(parser_stripper(string), stripper(string))
@@ -0,0 +1,125 @@
+import subprocess
+import sys
+import unittest
+
+import recipe_scrapers
+from recipe_scrapers import SCRAPERS, get_supported_urls, scraper_exists_for
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers._registry import HostSuffixTrie, ScraperRegistry
+
+
+class TestScraperRegistry(unittest.TestCase):
+
+    def test_manifest_matches_scrapers(self):
+        from recipe_scrapers._scrapers import SCRAPERS as EAGER_SCRAPERS
+
+        self.assertEqual(sorted(EAGER_SCRAPERS), sorted(SCRAPERS))
+        for host, scraper in EAGER_SCRAPERS.items():
+            with self.subTest(host):
+                self.assertIs(scraper, SCRAPERS[host])
+
+    def test_scrapers_imported_on_first_use(self):
+        code = (
+            "import sys\n"
+            "from recipe_scrapers import SCRAPERS, scraper_exists_for\n"
+            "assert scraper_exists_for('https://www.bbcgoodfood.com/recipes/1')\n"
+            "assert 'bbcgoodfood.com' in SCRAPERS and len(SCRAPERS) > 1\n"
+            "assert 'recipe_scrapers.bbcgoodfood' not in sys.modules\n"
+            "SCRAPERS['bbcgoodfood.com']\n"
+            "print(sorted(m for m in sys.modules if m.startswith('recipe_scrapers.b')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        )
+        self.assertEqual("['recipe_scrapers.bbcgoodfood']", result.stdout.strip())
+
+    def test_lookups(self):
+        self.assertIn("allrecipes.com", get_supported_urls())
+        self.assertTrue(scraper_exists_for("https://www.allrecipes.com/recipe/1/"))
+        self.assertFalse(scraper_exists_for("https://recipe-scrapers.example/"))
+        self.assertIsNone(SCRAPERS.get("recipe-scrapers.example"))
+        with self.assertRaises(KeyError):
+            SCRAPERS["recipe-scrapers.example"]
+
+    def test_subdomains(self):
+        for url in (
+            "https://m.allrecipes.com/recipe/1/",
+            "https://amp.allrecipes.com/recipe/1/",
+            "https://es.allrecipes.com/receta/1/",
+        ):
+            with self.subTest(url):
+                self.assertTrue(scraper_exists_for(url))
+                scraper = recipe_scrapers.scrape_html("<html></html>", url)
+                self.assertIs(SCRAPERS["allrecipes.com"], type(scraper))
+        self.assertFalse(scraper_exists_for("https://myallrecipes.com/"))
+        self.assertFalse(scraper_exists_for("https://allrecipes.com.example/"))
+
+    def test_match(self):
+        self.assertEqual("allrecipes.com", SCRAPERS.match("allrecipes.com"))
+        self.assertEqual("allrecipes.com", SCRAPERS.match("es.m.allrecipes.com"))
+        self.assertEqual("cooking.nytimes.com", SCRAPERS.match("cooking.nytimes.com"))
+        self.assertIsNone(SCRAPERS.match("nytimes.com"))
+        self.assertIsNone(SCRAPERS.match(""))
+
+    def test_host_suffix_trie(self):
+        trie = HostSuffixTrie(["example.com", "recipes.example.com", "example.co.uk"])
+        self.assertEqual("example.com", trie.match("example.com"))
+        self.assertEqual("example.com", trie.match("m.example.com"))
+        self.assertEqual("recipes.example.com", trie.match("m.recipes.example.com"))
+        self.assertEqual("example.co.uk", trie.match("www2.example.co.uk"))
+        self.assertIsNone(trie.match("co.uk"))
+        self.assertIsNone(trie.match("example.org"))
+
+    def test_registry(self):
+        registry = ScraperRegistry({"bbcgoodfood.com": ("bbcgoodfood", "BBCGoodFood")})
+        self.assertEqual(["bbcgoodfood.com"], list(registry))
+        self.assertEqual(1, len(registry))
+        self.assertIs(registry["bbcgoodfood.com"], registry["bbcgoodfood.com"])
+        self.assertEqual({"BBCGoodFood": "bbcgoodfood"}, registry.class_locations())
+
+    def test_register(self):
+        registry = ScraperRegistry({"bbcgoodfood.com": ("bbcgoodfood", "BBCGoodFood")})
+        manifest_scraper = registry["bbcgoodfood.com"]
+        self.assertIsNone(registry.match("m.example.com"))
+
+        registry["example.com"] = AbstractScraper
+        self.assertIs(AbstractScraper, registry["example.com"])
+        self.assertEqual("example.com", registry.match("m.example.com"))
+        self.assertEqual(["bbcgoodfood.com", "example.com"], list(registry))
+        self.assertEqual({"BBCGoodFood": "bbcgoodfood"}, registry.class_locations())
+
+        registry.update({"bbcgoodfood.com": AbstractScraper})
+        self.assertIs(AbstractScraper, registry["bbcgoodfood.com"])
+        registry["bbcgoodfood.com"] = manifest_scraper
+        self.assertIs(manifest_scraper, registry["bbcgoodfood.com"])
+
+        del registry["example.com"]
+        self.assertNotIn("example.com", registry)
+        self.assertIsNone(registry.match("m.example.com"))
+        with self.assertRaises(KeyError):
+            del registry["example.com"]
+
+    def test_scrape_html_with_registered_scraper(self):
+        class ExampleScraper(AbstractScraper):
+            @classmethod
+            def host(cls):
+                return "recipe-scrapers.example"
+
+        SCRAPERS[ExampleScraper.host()] = ExampleScraper
+        try:
+            self.assertTrue(scraper_exists_for("https://recipe-scrapers.example/"))
+            scraper = recipe_scrapers.scrape_html(
+                "<html></html>", "https://www.recipe-scrapers.example/recipe/1/"
+            )
+            self.assertIsInstance(scraper, ExampleScraper)
+        finally:
+            del SCRAPERS[ExampleScraper.host()]
+        self.assertFalse(scraper_exists_for("https://recipe-scrapers.example/"))
+
+    def test_scraper_classes_as_attributes(self):
+        from recipe_scrapers import AllRecipes
+
+        self.assertIs(SCRAPERS["allrecipes.com"], AllRecipes)
+        self.assertIn("AllRecipes", dir(recipe_scrapers))
+        with self.assertRaises(AttributeError):
+            recipe_scrapers.NotAScraper
@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from recipe_scrapers import MemoryResultCache, SQLiteResultCache, scrape_html
+from recipe_scrapers._abstract import AbstractScraper
+from recipe_scrapers.settings import settings
+
+from .recipe_page import RECIPE_HTML, RECIPE_URL
+
+FIELDS = ["title", "ingredients", "cook_time"]
+
+
+class TestResultCache(unittest.TestCase):
+
+    def test_identical_page_not_parsed_again(self):
+        cache = MemoryResultCache()
+        first = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=cache)
+        expected = first.to_json(fields=FIELDS)
+
+        second = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=cache)
+        self.assertEqual(expected, second.to_json(fields=FIELDS))
+        self.assertNotIn("schema", second.__dict__)
+        self.assertNotIn("soup", second.__dict__)
+
+    def test_key(self):
+        cache = MemoryResultCache()
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=cache)
+        key = scraper._result_cache_key(FIELDS)
+
+        for html, url, best_image in (
+            (RECIPE_HTML.replace("Test", "Other"), RECIPE_URL, None),
+            (RECIPE_HTML, "https://www.allrecipes.com/recipe/2/", None),
+            (RECIPE_HTML, RECIPE_URL, False),
+        ):
+            other = scrape_html(html, url, best_image=best_image, result_cache=cache)
+            self.assertNotEqual(key, other._result_cache_key(FIELDS))
+        self.assertNotEqual(key, scraper._result_cache_key(FIELDS[:2]))
+
+    def test_errors(self):
+        cache = MemoryResultCache()
+        scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=cache).to_json(FIELDS)
+
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=cache)
+        self.assertNotIn("errors", scraper.to_json(FIELDS))
+        self.assertIn("cook_time", scraper.to_json(FIELDS, errors="include")["errors"])
+        with self.assertRaises(Exception):
+            scraper.to_json(FIELDS, errors="raise")
+
+    def test_results_not_shared(self):
+        cache = MemoryResultCache()
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=cache)
+        scraper.to_json(FIELDS)["ingredients"].append("butter")
+        self.assertEqual(
+            ["1 slice of bread", "5g margarine"], scraper.to_json(FIELDS)["ingredients"]
+        )
+
+    def test_least_recently_used_evicted(self):
+        cache = MemoryResultCache(max_entries=2)
+        cache.set("a", {"title": "a"})
+        cache.set("b", {"title": "b"})
+        cache.get("a")
+        cache.set("c", {"title": "c"})
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual({"title": "a"}, cache.get("a"))
+
+    def test_setting(self):
+        original = settings.RESULT_CACHE
+        try:
+            settings.RESULT_CACHE = MemoryResultCache()
+            scrape_html(RECIPE_HTML, RECIPE_URL).to_json(FIELDS)
+            self.assertEqual(1, len(settings.RESULT_CACHE))
+        finally:
+            settings.RESULT_CACHE = original
+
+
+class TestSQLiteResultCache(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "results.sqlite")
+
+    def cache(self):
+        cache = SQLiteResultCache(self.path)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_results_kept_across_runs(self):
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=self.cache())
+        expected = scraper.to_json(FIELDS)
+
+        scraper = scrape_html(RECIPE_HTML, RECIPE_URL, result_cache=self.cache())
+        self.assertEqual(expected, scraper.to_json(FIELDS))
+        self.assertNotIn("schema", scraper.__dict__)
+
+    def test_unserializable_results_not_stored(self):
+        class SetKeywordsScraper(AbstractScraper):
+            @classmethod
+            def host(cls):
+                return "recipe-scrapers.example"
+
+            def title(self):
+                return "Test Recipe"
+
+            def keywords(self):
+                return {"quick"}
+
+        cache = self.cache()
+        fields = ["title", "keywords"]
+        for _ in range(2):
+            scraper = SetKeywordsScraper(
+                html=RECIPE_HTML, url=RECIPE_URL, result_cache=cache
+            )
+            self.assertEqual(
+                {"title": "Test Recipe", "keywords": {"quick"}},
+                scraper.to_json(fields),
+            )
+        self.assertEqual(0, len(cache))
+
+    def test_other_versions_invalidated(self):
+        self.cache().set("current", {"title": "current"})
+        db = sqlite3.connect(self.path)
+        db.execute("INSERT INTO results VALUES ('old', '0.0.1', '{}')")
+        db.commit()
+        db.close()
+
+        cache = self.cache()
+        self.assertEqual(1, len(cache))
+        self.assertEqual({"title": "current"}, cache.get("current"))
@@ -1,7 +1,9 @@
 import unittest
+from unittest import mock
 
 from recipe_scrapers._factory import SchemaScraperFactory
-from recipe_scrapers._schemaorg import SchemaOrg
+from recipe_scrapers._html_tree import parse_html_tree
+from recipe_scrapers._schemaorg import SchemaOrg, load_json_ld
 from recipe_scrapers.settings import settings
 
 JSONLD_PAGE_TEMPLATE = """
@@ -161,6 +163,71 @@ DIETARY_RESTRICTIONS_SCHEMA = """
 }
 """
 
+BROKEN_JSON_SCHEMA = """
+// generated by a recipe plugin
+{
+  "@context": "https://schema.org",
+  "@type": "Recipe",
+  "name": "Broken // Recipe",
+  "description": "A description
+spanning two lines",
+  "recipeIngredient": ["1 slice of bread", "5g margarine",],
+  /* "recipeYield": "2", */
+  "recipeInstructions": ["spread the margarine on the bread"],
+};
+"""
+
+MICRODATA_PAGE = """
+<html>
+<body>
+<script type="application/ld+json">{"@context": "https://schema.org", "@type": "WebSite", "name": "Recipe Test"}</script>
+<div itemscope itemtype="https://schema.org/Recipe">
+  <h1 itemprop="name">Microdata Recipe</h1>
+  <span itemprop="recipeIngredient">1 slice of bread</span>
+</div>
+</body>
+</html>
+"""
+
+GRAPH_SCHEMA = """
+{
+  "@context": "https://schema.org",
+  "@graph": [
+    {"@type": "WebSite", "@id": "http://recipe.test/#website", "name": "Recipe Test"},
+    {"@type": "Person", "@id": "http://recipe.test/#editor", "name": "Editor"},
+    {"@type": "Person", "@id": "http://recipe.test/#author", "name": "Author"},
+    {"@type": "AggregateRating", "@id": "http://recipe.test/#rating", "ratingValue": "4.567", "ratingCount": "12"},
+    {
+      "@type": ["schema:Recipe", "NewsArticle"],
+      "name": "Graph Recipe",
+      "author": {"@id": "http://recipe.test/#author"},
+      "aggregateRating": {"@id": "http://recipe.test/#rating"}
+    }
+  ]
+}
+"""
+
+REFERENCES_SCHEMA = """
+{
+  "@context": "https://schema.org",
+  "@graph": [
+    {
+      "@type": "Recipe",
+      "name": "Referencing Recipe",
+      "author": {"@id": "http://recipe.test/#organization"},
+      "image": {"@id": "http://recipe.test/#image"},
+      "nutrition": {"@id": "http://recipe.test/#nutrition"},
+      "aggregateRating": {"@id": "http://recipe.test/#rating"}
+    },
+    {"@id": "http://recipe.test/#image"},
+    {"@type": "ImageObject", "@id": "http://recipe.test/#image", "url": "https://recipe.test/image.jpg"},
+    {"@type": "Organization", "@id": "http://recipe.test/#organization", "name": "Test Kitchen"},
+    {"@type": "NutritionInformation", "@id": "http://recipe.test/#nutrition", "calories": "120 kcal"},
+    {"@type": "AggregateRating", "@id": "http://recipe.test/#rating", "ratingValue": "4", "reviewCount": "7"}
+  ]
+}
+"""
+
 
 class TestSchemaOrg(unittest.TestCase):
 
@@ -267,3 +334,82 @@ class TestSchemaOrg(unittest.TestCase):
             ["Vegetarian Diet", "Vegan", "Mediterranean"],
             parser.dietary_restrictions(),
         )
+
+    def test_load_json_ld_repairs_common_breakage(self):
+        data = load_json_ld(BROKEN_JSON_SCHEMA)
+        self.assertEqual("Broken // Recipe", data["name"])
+        self.assertEqual("A description\nspanning two lines", data["description"])
+        self.assertEqual(["1 slice of bread", "5g margarine"], data["recipeIngredient"])
+        self.assertNotIn("recipeYield", data)
+
+    def test_load_json_ld_invalid(self):
+        with self.assertRaises(ValueError):
+            load_json_ld("{'@type': 'Recipe'")
+
+    def test_json_ld_recipe_skips_microdata(self):
+        page_data = JSONLD_PAGE_TEMPLATE.format(jsonld=BROKEN_JSON_SCHEMA)
+        with mock.patch("extruct.extract") as extract:
+            parser = SchemaOrg(page_data)
+
+        self.assertFalse(extract.called)
+        self.assertEqual("Broken // Recipe", parser.title())
+        self.assertEqual(["1 slice of bread", "5g margarine"], parser.ingredients())
+
+    def test_microdata_fallback(self):
+        parser = SchemaOrg(MICRODATA_PAGE)
+
+        self.assertEqual("Microdata Recipe", parser.title())
+        self.assertEqual(["1 slice of bread"], parser.ingredients())
+        self.assertEqual("Recipe Test", parser.site_name())
+
+    def test_parsed_tree(self):
+        page_data = JSONLD_PAGE_TEMPLATE.format(jsonld=SIMPLE_SCHEMA)
+        parser = SchemaOrg(parse_html_tree(page_data))
+        self.assertEqual("Test Recipe", parser.title())
+
+        parser = SchemaOrg(parse_html_tree(MICRODATA_PAGE))
+        self.assertEqual("Microdata Recipe", parser.title())
+
+    def test_graph_references(self):
+        page_data = JSONLD_PAGE_TEMPLATE.format(jsonld=GRAPH_SCHEMA)
+        parser = SchemaOrg(page_data)
+
+        self.assertEqual("Graph Recipe", parser.title())
+        self.assertEqual("Recipe Test", parser.site_name())
+        self.assertEqual("Author", parser.author())
+        self.assertEqual(4.57, parser.ratings())
+        self.assertEqual(12, parser.ratings_count())
+
+    def test_rating_entities_indexed_once(self):
+        parser = SchemaOrg(JSONLD_PAGE_TEMPLATE.format(jsonld=SIMPLE_SCHEMA))
+        rating = {"@type": "AggregateRating", "ratingValue": "4", "ratingCount": "3"}
+        parser.data = {"@graph": [parser.data, rating]}
+
+        with mock.patch.object(
+            SchemaOrg, "_index_entities", wraps=parser._index_entities
+        ) as index_entities:
+            self.assertEqual(4.0, parser.ratings())
+            self.assertEqual(3, parser.ratings_count())
+            self.assertEqual(1, index_entities.call_count)
+
+            parser.data = {"@graph": [{**rating, "ratingValue": "5"}]}
+            self.assertEqual(5.0, parser.ratings())
+            self.assertEqual(2, index_entities.call_count)
+
+    def test_references_resolved_by_id(self):
+        parser = SchemaOrg(JSONLD_PAGE_TEMPLATE.format(jsonld=REFERENCES_SCHEMA))
+        with mock.patch.object(SchemaOrg, "_index_entities") as index_entities:
+            self.assertEqual("Test Kitchen", parser.author())
+            self.assertEqual("https://recipe.test/image.jpg", parser.image())
+            self.assertEqual({"calories": "120 kcal"}, parser.nutrients())
+            self.assertEqual(4.0, parser.ratings())
+            self.assertEqual(7, parser.ratings_count())
+        index_entities.assert_not_called()
+
+    def test_inline_entities_not_replaced(self):
+        schema = REFERENCES_SCHEMA.replace(
+            '"author": {"@id": "http://recipe.test/#organization"}',
+            '"author": {"@id": "http://recipe.test/#organization", "name": "Chef"}',
+        )
+        parser = SchemaOrg(JSONLD_PAGE_TEMPLATE.format(jsonld=schema))
+        self.assertEqual("Chef", parser.author())